@@ -7,9 +7,9 @@ LLM to narrate them. All scoring/window logic is deterministic.
 
 import os
 from datetime import datetime, timezone
-from typing import List, Optional, Tuple
+from typing import AsyncIterator, List, Optional, Tuple
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from .assessment_engine import assess_timeline, compute_window_recommendations, build_summary
 from .domain import AgentAssessmentPayload, AssessmentContext, RiderPreferences
@@ -20,9 +20,10 @@ from utils.logging_utils import get_tagged_logger  # or whatever your helper is
 
 logger = get_tagged_logger(__name__, tag="agent")  # tweak to match your logging helper
 
-
 class UserPreferences(BaseModel):
     """User-tunable riding preferences that influence recommendations."""
+    model_config = ConfigDict(extra="forbid")
+
     latitude: float = float(os.getenv("USER_LATITUDE_DEFAULT", 43.00))
     longitude: float = float(os.getenv("USER_LONGITUDE_DEFAULT", -89.00))
     timezone: str = Field(default_factory=lambda: os.getenv("USER_TIMEZONE_DEFAULT", "America/Chicago"))
@@ -35,13 +36,33 @@ class UserPreferences(BaseModel):
     max_aqi: Optional[int] = 80
     avoid_precip: bool = True
 
+    @classmethod
+    def from_trusted(cls, data: dict) -> "UserPreferences":
+        """Rebuild preferences this service serialized itself, skipping validation."""
+        fields = {k: v for k, v in data.items() if k in cls.model_fields}
+        temp_range = fields.get("preferred_temp_range_f")
+        if isinstance(temp_range, list):  # JSON has no tuples
+            fields["preferred_temp_range_f"] = tuple(temp_range)
+        return cls.model_construct(**fields)
+
+
+# UserPreferences and RiderPreferences share field names; copy the overlap
+# directly instead of dumping to a dict and re-validating.
+_RIDER_PREF_FIELDS = tuple(name for name in RiderPreferences.model_fields if name in UserPreferences.model_fields)
+
+
+def _to_rider_preferences(prefs: UserPreferences) -> RiderPreferences:
+    """Build RiderPreferences from already-validated UserPreferences without re-validation."""
+    return RiderPreferences.model_construct(**{name: getattr(prefs, name) for name in _RIDER_PREF_FIELDS})
+
 
 def build_assessment_payload(conditions: BikeConditions, prefs: UserPreferences | None) -> AgentAssessmentPayload:
     """Compute deterministic assessment and window recommendations."""
     prefs = prefs or UserPreferences()
-    rider_prefs = RiderPreferences(**prefs.model_dump())
+    rider_prefs = _to_rider_preferences(prefs)
     current_assessment, hourly_assessments = assess_timeline(rider_prefs, conditions)
-    windows = compute_window_recommendations(hourly_assessments)
+    # The summary only keeps the best three windows, so only those are built.
+    windows = compute_window_recommendations(hourly_assessments, top_k=3)
     summary = build_summary(hourly_assessments, windows)
 
     return AgentAssessmentPayload(
@@ -59,7 +80,7 @@ def build_assessment_payload(conditions: BikeConditions, prefs: UserPreferences
     )
 
 
-def narrate_assessment(
+async def narrate_assessment(
     assessment: AgentAssessmentPayload,
     *,
     user_message: str | None = None,
@@ -68,6 +89,35 @@ def narrate_assessment(
     """
     Ask the LLM to narrate a deterministic assessment. Returns (messages, assistant_content).
     """
+    messages = _narration_messages(assessment, user_message, prior_messages)
+    raw_reply = await ollama_client.achat(messages)
+    assistant_content = _finish_narration(messages, assessment, raw_reply)
+    return messages, assistant_content
+
+
+async def stream_narration(
+    assessment: AgentAssessmentPayload,
+    messages: list[dict],
+    *,
+    user_message: str | None = None,
+    prior_messages: list[dict] | None = None,
+) -> AsyncIterator[str]:
+    """
+    Stream the narration as content deltas. Once the stream ends, `messages` (filled in place)
+    holds the conversation with the validated reply appended, as narrate_assessment returns it.
+    """
+    messages[:] = _narration_messages(assessment, user_message, prior_messages)
+    parts = []
+    async for delta in ollama_client.astream_chat(list(messages)):
+        parts.append(delta)
+        yield delta
+    _finish_narration(messages, assessment, "".join(parts))
+
+
+def _narration_messages(
+    assessment: AgentAssessmentPayload, user_message: str | None, prior_messages: list[dict] | None
+) -> list[dict]:
+    """Build the message list for a narration request."""
     messages = list(prior_messages) if prior_messages else build_narration_messages(assessment)
 
     if user_message is not None:
@@ -79,8 +129,11 @@ def narrate_assessment(
         len(user_message or ""),
         len(messages),
     )
-    raw_reply = ollama_client.chat(messages)
+    return messages
 
+
+def _finish_narration(messages: list[dict], assessment: AgentAssessmentPayload, raw_reply: str) -> str:
+    """Validate the raw reply, append it to messages and return the assistant content."""
     try:
         assistant_content = validate_narration_output(
             raw_reply, assessment.summary.suitability_score if assessment.summary else None
@@ -90,13 +143,13 @@ def narrate_assessment(
         assistant_content = raw_reply
 
     messages.append({"role": "assistant", "content": assistant_content})
-    return messages, assistant_content
+    return assistant_content
 
 
-def run_initial_interaction(conditions: BikeConditions, prefs: UserPreferences | None):
+async def run_initial_interaction(conditions: BikeConditions, prefs: UserPreferences | None):
     """Compute assessment and get an initial narration."""
     assessment = build_assessment_payload(conditions, prefs)
-    messages, assistant_content = narrate_assessment(assessment)
+    messages, assistant_content = await narrate_assessment(assessment)
     return messages, None, assistant_content, assessment
 
 
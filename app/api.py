@@ -1,17 +1,27 @@
 """HTTP API for the biking conditions assistant."""
 
+import asyncio
+import hashlib
 import hmac
+import json
+import secrets
+import threading
+import time
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Optional
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 from fastapi import APIRouter, Depends, Header, HTTPException, status
-from pydantic import BaseModel
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
-from app.domain import AgentAssessmentPayload
-from .agent import UserPreferences, build_assessment_payload, narrate_assessment
+from app.domain import AgentAssessmentPayload, AssessmentSummary
+from .agent import UserPreferences, build_assessment_payload, narrate_assessment, stream_narration
 from .narration import build_narration_messages
 from .app_types import CachedConditions
 from .config import settings
+from .redis_pool import redis_client
 from .data_sources import build_data_source
 from .forecast_service import BikeConditions, get_bike_conditions_for_window
 from .session_manager import create_session, get_session, update_session
@@ -28,12 +38,52 @@ except ImportError:  # pragma: no cover - exercised implicitly
 _redis_client = None
 if settings.api_key_redis_url and redis:
     try:
-        _redis_client = redis.Redis.from_url(settings.api_key_redis_url)
+        _redis_client = redis_client(settings.api_key_redis_url)
         logger.info("API key checks will use Redis backend", extra={"redis_url": settings.api_key_redis_url})
     except Exception as exc:  # pragma: no cover - safety net
         logger.warning("Failed to connect to Redis for API key checks; falling back to static key",
                        extra={"error": str(exc)})
 
+# Keys validated against Redis are remembered for a short TTL so repeat callers skip the
+# SISMEMBER round-trip. Entries are HMAC digests (never raw keys) and failures are never cached;
+# a key removed from Redis stays valid here for at most api_key_cache_ttl_seconds.
+_API_KEY_PEPPER = (settings.api_key_pepper or secrets.token_hex(32)).encode("utf-8")
+_api_key_cache: dict[str, float] = {}
+_api_key_cache_lock = threading.Lock()
+
+
+def _api_key_digest(api_key: str) -> str:
+    """Return the HMAC-SHA256 digest used as the cache key for an API key."""
+    return hmac.new(_API_KEY_PEPPER, api_key.encode("utf-8"), hashlib.sha256).hexdigest()
+
+
+def _api_key_is_cached(digest: str) -> bool:
+    """Return True if the digest was validated recently and has not expired."""
+    with _api_key_cache_lock:
+        expires_at = _api_key_cache.get(digest)
+        if expires_at is None:
+            return False
+        if expires_at < time.monotonic():
+            _api_key_cache.pop(digest, None)
+            return False
+        return True
+
+
+def _remember_api_key(digest: str) -> None:
+    """Cache a successful validation, evicting expired/oldest entries when full."""
+    ttl = settings.api_key_cache_ttl_seconds
+    if ttl <= 0:
+        return
+    now = time.monotonic()
+    with _api_key_cache_lock:
+        if len(_api_key_cache) >= settings.api_key_cache_max_entries:
+            for key, expires_at in list(_api_key_cache.items()):
+                if expires_at < now:
+                    del _api_key_cache[key]
+            while len(_api_key_cache) >= settings.api_key_cache_max_entries:
+                _api_key_cache.pop(next(iter(_api_key_cache)))
+        _api_key_cache[digest] = now + ttl
+
 
 def require_api_key(x_api_key: str | None = Header(default=None)):
     """
@@ -54,9 +104,13 @@ def require_api_key(x_api_key: str | None = Header(default=None)):
 
     # First, try Redis, if available
     if _redis_client:
+        digest = _api_key_digest(str(x_api_key))
+        if _api_key_is_cached(digest):
+            return
         logger.debug("Checking API key against Redis")
         try:
             if _redis_client.sismember(settings.api_key_redis_set, x_api_key):
+                _remember_api_key(digest)
                 return
         except Exception as e:  # pragma: no cover - defensive
             logger.warning("Redis API key lookup error; falling back to static key",
@@ -71,7 +125,12 @@ def require_api_key(x_api_key: str | None = Header(default=None)):
     raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid API key")
 
 
+# Leave default_response_class unset: with a response_model, FastAPI serializes the
+# payload straight to JSON bytes in pydantic-core (Rust), which beats ORJSONResponse
+# and handles datetime/Enum fields natively. Any explicit response class disables it.
 router = APIRouter(dependencies=[Depends(require_api_key)])
+# Non-JSON (server-sent event) routes; mounted alongside `router` under the same API-key check.
+stream_router = APIRouter(dependencies=[Depends(require_api_key)])
 DATA_SOURCE = build_data_source(settings)
 
 
@@ -98,6 +157,8 @@ class CurrentConditions(BaseModel):
 
 class ChatRequest(BaseModel):
     """Incoming chat message payload."""
+    model_config = ConfigDict(extra="forbid")
+
     message: str
 
 
@@ -127,28 +188,42 @@ class PreferencesResponse(BaseModel):
     preferences: UserPreferences
 
 
+_FORECAST_ADAPTER = TypeAdapter(list[CurrentConditions])
+_CC_FIELDS = tuple(CurrentConditions.model_fields)
+
+
 def _get_bike_conditions(conditions: BikeConditions) -> Optional[CurrentConditions]:
     """Convert current BikeConditions into serialized API shape."""
-    current = conditions.current.to_display_strings() if conditions.current else None
+    current = conditions.current.to_display_tuple() if conditions.current else None
     if not current:
         return None
-    return CurrentConditions(**current)
+    row = dict(zip(_CC_FIELDS, current))
+    if settings.validate_response_conditions:
+        return CurrentConditions.model_validate(row)
+    return CurrentConditions.model_construct(**row)
 
 
 def _get_forecast_conditions(conditions: BikeConditions) -> list[CurrentConditions]:
     """Convert forecast hours into serialized API shape."""
-    out: list[CurrentConditions] = []
-    for hour in conditions.forecast or []:
-        s = hour.to_display_strings()
-        if s:
-            out.append(CurrentConditions(**s))
-    return out
+    rows = [
+        dict(zip(_CC_FIELDS, values))
+        for values in (hour.to_display_tuple() for hour in conditions.forecast or [])
+        if values
+    ]
+    if settings.validate_response_conditions:
+        return _FORECAST_ADAPTER.validate_python(rows)
+    # Rows are built in-process from typed dataclasses, so skip per-field validation.
+    return [CurrentConditions.model_construct(**row) for row in rows]
 
 
 def _format_summary_markdown(summary) -> str:
-    """Render an assessment summary as short markdown."""
+    """Render an assessment summary as short markdown, cached on the summary."""
     if not summary:
         return ""
+    cached = getattr(summary, "_markdown", None)
+    if cached is not None:
+        return cached
+
     def _label(value) -> str:
         if value is None:
             return ""
@@ -174,45 +249,132 @@ def _format_summary_markdown(summary) -> str:
         lines.append(
             f"**Best window:** {best.start.isoformat()} to {best.end.isoformat()} (score {best.window_score})"
         )
-    return "\n".join(lines)
+    markdown = "\n".join(lines)
+    if isinstance(summary, AssessmentSummary):
+        summary._markdown = markdown
+    return markdown
+
+
+@lru_cache(maxsize=64)
+def _zoneinfo(name: str) -> ZoneInfo:
+    """Return a cached ZoneInfo; lookup failures are not cached and still raise."""
+    return ZoneInfo(name)
 
 
-def _resolve_time_window(prefs: UserPreferences) -> tuple[str, ZoneInfo, datetime, datetime]:
+def _utcnow() -> datetime:
+    """Return the current UTC time; computed once per request and threaded through."""
+    return datetime.now(tz=timezone.utc)
+
+
+def _resolve_time_window(
+    prefs: UserPreferences, now: datetime | None = None
+) -> tuple[str, ZoneInfo, datetime, datetime]:
     """Resolve timezone and compute the rider's preferred window."""
     tz_str = prefs.timezone or "America/Chicago"
     try:
-        tz = ZoneInfo(tz_str)
-    except ZoneInfoNotFoundError:
+        tz = _zoneinfo(tz_str)
+    except (ZoneInfoNotFoundError, ValueError):
         raise HTTPException(status_code=400, detail=f"Invalid timezone: {tz_str}")
-    start_time = datetime.now(tz)
+    start_time = (now or _utcnow()).astimezone(tz)
     end_time = start_time + timedelta(hours=prefs.ride_window_hours)
     return tz_str, tz, start_time, end_time
 
 
-def _fetch_conditions(
+async def _fetch_conditions(
     prefs: UserPreferences,
     start_time: datetime,
     end_time: datetime,
     tz_str: str,
     cached: CachedConditions | BikeConditions | dict | None = None,
     require_fresh: bool = False,
+    now: datetime | None = None,
+    reuse_recent: bool = True,
 ) -> BikeConditions:
-    """Fetch conditions, using cached values when still fresh."""
-    if cached and (not require_fresh or _conditions_are_fresh(cached)):
+    """Fetch conditions, using cached values when still fresh.
+
+    Data sources are synchronous (requests/SQLAlchemy), so the fetch runs in the
+    threadpool to keep the event loop free for other sessions.
+    """
+    if cached and (not require_fresh or _conditions_are_fresh(cached, now)):
         unwrapped = _unwrap_conditions(cached)
         if unwrapped:
             return unwrapped
-    return get_bike_conditions_for_window(
-        latitude=prefs.latitude,
-        longitude=prefs.longitude,
-        timezone=tz_str,
-        start_local=start_time,
-        end_local=end_time,
-        forecast_hours=settings.forecast_hours,
-        data_source=DATA_SOURCE,
+    return await _fetch_shared(prefs, start_time, end_time, tz_str, reuse_recent=reuse_recent)
+
+
+# Upstream fetches keyed by location/window: concurrent callers share one in-flight
+# request, and completed results are reused for a short TTL.
+_inflight_fetches: dict[tuple, asyncio.Future] = {}
+_recent_fetches: dict[tuple, tuple[float, BikeConditions]] = {}
+
+
+def _fetch_key(prefs: UserPreferences, start_time: datetime, end_time: datetime, tz_str: str) -> tuple:
+    """Return the coalescing key for a conditions fetch (~1 km, hour buckets)."""
+    return (
+        round(prefs.latitude, 2),
+        round(prefs.longitude, 2),
+        tz_str,
+        start_time.replace(minute=0, second=0, microsecond=0),
+        end_time.replace(minute=0, second=0, microsecond=0),
     )
 
 
+def _remember_fetch(key: tuple, conditions: BikeConditions, ttl: int) -> None:
+    """Store a completed fetch, pruning expired entries."""
+    now = time.monotonic()
+    for stale in [k for k, (ts, _c) in _recent_fetches.items() if now - ts >= ttl]:
+        _recent_fetches.pop(stale, None)
+    _recent_fetches[key] = (now, conditions)
+
+
+async def _fetch_shared(
+    prefs: UserPreferences, start_time: datetime, end_time: datetime, tz_str: str, *, reuse_recent: bool = True
+) -> BikeConditions:
+    """Fetch conditions upstream, sharing in-flight and (unless reuse_recent=False) recent results for the same key."""
+    key = _fetch_key(prefs, start_time, end_time, tz_str)
+    ttl = settings.conditions_fetch_cache_seconds
+    recent = _recent_fetches.get(key) if reuse_recent else None
+    if recent and time.monotonic() - recent[0] < ttl:
+        return recent[1]
+
+    while (pending := _inflight_fetches.get(key)) is not None:
+        logger.debug("Joining in-flight conditions fetch for %s", key)
+        try:
+            return await asyncio.shield(pending)
+        except asyncio.CancelledError:
+            # Only our own cancellation propagates; if the leader was cancelled, take over the fetch.
+            if not pending.cancelled() or asyncio.current_task().cancelling():
+                raise
+
+    future = asyncio.get_running_loop().create_future()
+    _inflight_fetches[key] = future
+    try:
+        conditions = await run_in_threadpool(
+            get_bike_conditions_for_window,
+            latitude=prefs.latitude,
+            longitude=prefs.longitude,
+            timezone=tz_str,
+            start_local=start_time,
+            end_local=end_time,
+            forecast_hours=settings.forecast_hours,
+            data_source=DATA_SOURCE,
+        )
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except Exception as exc:
+        future.set_exception(exc)
+        future.exception()  # mark retrieved; followers (if any) still receive it
+        raise
+    else:
+        future.set_result(conditions)
+        if ttl > 0:
+            _remember_fetch(key, conditions, ttl)
+        return conditions
+    finally:
+        _inflight_fetches.pop(key, None)
+
+
 def _ensure_conditions_present(conditions: BikeConditions) -> None:
     """Raise a 404 if current or forecast data is missing."""
     if not conditions.current:
@@ -221,68 +383,87 @@ def _ensure_conditions_present(conditions: BikeConditions) -> None:
         raise HTTPException(status_code=404, detail="No forecast data available.")
 
 
-def _wrap_conditions(conditions: BikeConditions) -> CachedConditions:
+def _wrap_conditions(conditions: BikeConditions, now: datetime | None = None) -> CachedConditions:
     """Attach a timestamp so we can enforce a freshness TTL."""
-    return CachedConditions(data=conditions, fetched_at=datetime.now(tz=timezone.utc))
+    return CachedConditions(data=conditions, fetched_at=now or _utcnow())
+
+
+def _dict_conditions(value: dict) -> Optional[BikeConditions]:
+    """Return BikeConditions from a legacy {"data": ...} cache dict."""
+    data = value.get("data")
+    return data if isinstance(data, BikeConditions) else None
+
+
+# Keyed on exact type: the wrappers are plain dataclasses/dicts, so one dict lookup
+# replaces the isinstance ladder.
+_UNWRAP_CONDITIONS = {
+    BikeConditions: lambda v: v,
+    dict: _dict_conditions,
+    CachedConditions: lambda v: v.data,
+}
 
 
 def _unwrap_conditions(value: CachedConditions | BikeConditions | dict | None) -> Optional[BikeConditions]:
     """Return BikeConditions from supported cache wrappers."""
-    if not value:
+    if value is None:
         return None
-    if isinstance(value, BikeConditions):
-        return value
-    if isinstance(value, dict):
-        data = value.get("data")
-        return data if isinstance(data, BikeConditions) else None
-    if isinstance(value, CachedConditions):
-        return value.data
-    return None
+    handler = _UNWRAP_CONDITIONS.get(type(value))
+    return handler(value) if handler else None
 
 
-def _conditions_are_fresh(value: CachedConditions | BikeConditions | dict | None) -> bool:
-    """Check whether cached conditions are within the TTL window."""
-    if not value:
+def _fetched_within_ttl(fetched_at, now: datetime | None) -> bool:
+    """Return True if a fetch timestamp is within the conditions TTL."""
+    if not isinstance(fetched_at, datetime):
         return False
-    if isinstance(value, BikeConditions):
-        return True  # legacy/raw payload; treat as fresh
-    if isinstance(value, dict):
-        ts = value.get("fetched_at")
-        if isinstance(ts, datetime):
-            age = datetime.now(tz=timezone.utc) - ts
-            return age.total_seconds() < settings.conditions_ttl_seconds
+    return ((now or _utcnow()) - fetched_at).total_seconds() < settings.conditions_ttl_seconds
+
+
+_CONDITIONS_FRESH = {
+    BikeConditions: lambda v, now: True,  # legacy/raw payload; treat as fresh
+    dict: lambda v, now: _fetched_within_ttl(v.get("fetched_at"), now),
+    CachedConditions: lambda v, now: _fetched_within_ttl(v.fetched_at, now),
+}
+
+
+def _conditions_are_fresh(
+    value: CachedConditions | BikeConditions | dict | None, now: datetime | None = None
+) -> bool:
+    """Check whether cached conditions are within the TTL window."""
+    if value is None:
         return False
-    if isinstance(value, CachedConditions):
-        age = datetime.now(tz=timezone.utc) - value.fetched_at
-        return age.total_seconds() < settings.conditions_ttl_seconds
-    return False
+    handler = _CONDITIONS_FRESH.get(type(value))
+    return handler(value, now) if handler else False
+
+
+# Defaults/env overrides are fixed for the process lifetime, so validate them once.
+_DEFAULT_PREFS = UserPreferences()
 
 
 def default_preferences() -> UserPreferences:
-    """Create preferences using defaults/env overrides."""
-    # Single source of truth: defer to UserPreferences defaults/env overrides
-    prefs = UserPreferences()
-    logger.debug(f"Using default preferences: {prefs}")
+    """Return a copy of the default preferences (defaults/env overrides)."""
+    prefs = _DEFAULT_PREFS.model_copy()
+    logger.debug("Using default preferences: %s", prefs)
     return prefs
 
 
 @router.post("/session/start", response_model=StartResponse)
-def start_session():
+async def start_session():
     """Create a new session and return current conditions/forecast."""
     prefs = default_preferences()
-    tz_str, _tz, start_time, end_time = _resolve_time_window(prefs)
+    now = _utcnow()
+    tz_str, _tz, start_time, end_time = _resolve_time_window(prefs, now)
 
-    logger.info(f"Starting session for {tz_str} at {start_time}")
-    logger.info(f"User preferences: {prefs}")
-    logger.info(f"Getting weather conditions for {start_time} to {end_time}")
-    conditions = _fetch_conditions(prefs, start_time, end_time, tz_str)
+    logger.info("Starting session for %s at %s", tz_str, start_time)
+    logger.info("User preferences: %s", prefs)
+    logger.info("Getting weather conditions for %s to %s", start_time, end_time)
+    conditions = await _fetch_conditions(prefs, start_time, end_time, tz_str, now=now)
     _ensure_conditions_present(conditions)
 
-    logger.debug(f"Got weather conditions: {conditions}")
+    logger.debug("Got weather conditions: %s", conditions)
 
     # Create empty session; a client will trigger initial LLM call separately so it can show
     # preferences/conditions immediately.
-    session_id = create_session([], prefs, _wrap_conditions(conditions))
+    session_id = await run_in_threadpool(create_session, [], prefs, _wrap_conditions(conditions, now))
 
     return StartResponse(
         session_id=session_id,
@@ -293,45 +474,55 @@ def start_session():
     )
 
 
+def _initial_assessment(
+    conditions: BikeConditions, prefs: UserPreferences
+) -> tuple[AgentAssessmentPayload, list[dict], str]:
+    """Build the assessment, narration messages and summary reply for a session's first turn."""
+    assessment_payload = build_assessment_payload(conditions, prefs)
+    base_messages = build_narration_messages(assessment_payload)
+    initial_response = _format_summary_markdown(assessment_payload.summary)
+    if initial_response:
+        base_messages = [
+            *base_messages,
+            {"role": "assistant", "content": initial_response},
+        ]
+    return assessment_payload, base_messages, initial_response
+
+
 @router.post("/session/{session_id}/initial", response_model=StartResponse)
-def run_initial(session_id: str):
+async def run_initial(session_id: str):
     """Run the initial assessment/narration for an existing session."""
-    session = get_session(session_id)
+    session = await run_in_threadpool(get_session, session_id)
     if session is None:
         raise HTTPException(status_code=404, detail="Unknown session ID")
 
     _messages, prefs, conditions_cached, _assessment = session
-    tz_str, _tz, start_time, end_time = _resolve_time_window(prefs)
+    now = _utcnow()
+    tz_str, _tz, start_time, end_time = _resolve_time_window(prefs, now)
 
-    conditions = _fetch_conditions(
+    conditions = await _fetch_conditions(
         prefs,
         start_time,
         end_time,
         tz_str,
         cached=conditions_cached,
         require_fresh=True,
+        now=now,
     )
     _ensure_conditions_present(conditions)
 
-    assessment_payload = build_assessment_payload(conditions, prefs)
-    base_messages = build_narration_messages(assessment_payload)
-    initial_response = _format_summary_markdown(assessment_payload.summary)
-    if initial_response:
-        base_messages = [
-            *base_messages,
-            {"role": "assistant", "content": initial_response},
-        ]
+    assessment_payload, base_messages, initial_response = await run_in_threadpool(
+        _initial_assessment, conditions, prefs
+    )
 
-    try:
-        update_session(
-            session_id,
-            messages=base_messages,
-            preferences=prefs,
-            conditions=_wrap_conditions(conditions),
-            assessment=assessment_payload,
-        )
-    except TypeError:
-        update_session(session_id, messages=base_messages, preferences=prefs, conditions=_wrap_conditions(conditions))
+    await run_in_threadpool(
+        update_session,
+        session_id,
+        messages=base_messages,
+        preferences=prefs,
+        conditions=_wrap_conditions(conditions, now),
+        assessment=assessment_payload,
+    )
 
     return StartResponse(
         session_id=session_id,
@@ -343,10 +534,9 @@ def run_initial(session_id: str):
     )
 
 
-@router.post("/session/{session_id}/chat", response_model=ChatResponse)
-def continue_chat(session_id: str, req: ChatRequest):
-    """Append a user message, narrate assessment, and persist state."""
-    session = get_session(session_id)
+async def _prepare_chat(session_id: str, req: ChatRequest) -> tuple[list, AgentAssessmentPayload, dict]:
+    """Load the session for a chat turn; return (messages, assessment, session updates)."""
+    session = await run_in_threadpool(get_session, session_id)
     if session is None:
         raise HTTPException(status_code=404, detail="Unknown session ID")
 
@@ -355,34 +545,76 @@ def continue_chat(session_id: str, req: ChatRequest):
                             detail=f"Message too long; limit {settings.max_user_message_chars} characters.")
 
     messages, prefs, conditions_cached, assessment = session
-    tz_str, _tz, start_time, end_time = _resolve_time_window(prefs)
-
-    cached_is_fresh = _conditions_are_fresh(conditions_cached)
-    conditions = _fetch_conditions(
-        prefs,
-        start_time,
-        end_time,
-        tz_str,
-        cached=conditions_cached,
-        require_fresh=True,
-    )
+    now = _utcnow()
+    tz_str, _tz, start_time, end_time = _resolve_time_window(prefs, now)
+
+    # Reuse fresh cached conditions directly; only a refetch invalidates the stored assessment.
+    cached = _unwrap_conditions(conditions_cached) if _conditions_are_fresh(conditions_cached, now) else None
+    refreshed = cached is None
+    if refreshed:
+        conditions = await _fetch_conditions(prefs, start_time, end_time, tz_str, now=now)
+    else:
+        conditions = cached
     _ensure_conditions_present(conditions)
 
-    if assessment is None or not cached_is_fresh:
-        assessment = build_assessment_payload(conditions, prefs)
+    if assessment is None or refreshed:
+        assessment = await run_in_threadpool(build_assessment_payload, conditions, prefs)
+
+    update_kwargs = {"assessment": assessment}
+    if refreshed:
+        update_kwargs["conditions"] = _wrap_conditions(conditions, now)
+    return messages, assessment, update_kwargs
+
+
+@router.post("/session/{session_id}/chat", response_model=ChatResponse)
+async def continue_chat(session_id: str, req: ChatRequest):
+    """Append a user message, narrate assessment, and persist state."""
+    messages, assessment, update_kwargs = await _prepare_chat(session_id, req)
 
-    messages, assistant_content = narrate_assessment(
+    messages, assistant_content = await narrate_assessment(
         assessment, user_message=req.message, prior_messages=messages or None
     )
 
-    update_kwargs = {"messages": messages, "assessment": assessment}
-    if not cached_is_fresh:
-        update_kwargs["conditions"] = _wrap_conditions(conditions)
-    update_session(session_id, **update_kwargs)
+    await run_in_threadpool(update_session, session_id, messages=messages, **update_kwargs)
 
     return ChatResponse(response=assistant_content, assessment=assessment)
 
 
+def _sse(data: str, event: str | None = None) -> str:
+    """Format one server-sent event."""
+    prefix = f"event: {event}\n" if event else ""
+    return f"{prefix}data: {data}\n\n"
+
+
+@stream_router.post("/session/{session_id}/chat/stream")
+async def continue_chat_stream(session_id: str, req: ChatRequest):
+    """Like /chat, but stream the reply as server-sent events while the LLM generates it.
+
+    Each `data:` event carries `{"delta": ...}`; a final `done` event carries the ChatResponse
+    (validated reply + assessment), sent after the session is persisted. Failures mid-stream
+    end with an `error` event.
+    """
+    prior_messages, assessment, update_kwargs = await _prepare_chat(session_id, req)
+
+    async def events():
+        """Relay narration deltas, then persist the turn and send the final payload."""
+        messages: list[dict] = []
+        try:
+            async for delta in stream_narration(
+                assessment, messages, user_message=req.message, prior_messages=prior_messages or None
+            ):
+                yield _sse(json.dumps({"delta": delta}))
+        except Exception as exc:
+            logger.exception("Streaming narration failed for session %s", session_id)
+            yield _sse(json.dumps({"detail": str(exc)}), event="error")
+            return
+        await run_in_threadpool(update_session, session_id, messages=messages, **update_kwargs)
+        final = ChatResponse(response=messages[-1]["content"], assessment=assessment)
+        yield _sse(final.model_dump_json(), event="done")
+
+    return StreamingResponse(events(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
+
+
 @router.get("/session/{session_id}/preferences", response_model=PreferencesResponse)
 def get_preferences(session_id: str):
     """Return stored preferences for a session."""
@@ -390,7 +622,7 @@ def get_preferences(session_id: str):
     if session is None:
         raise HTTPException(status_code=404, detail="Unknown session ID")
     _messages, prefs, _conditions, _assessment = session
-    return PreferencesResponse(preferences=prefs or UserPreferences())
+    return PreferencesResponse(preferences=prefs or _DEFAULT_PREFS)
 
 
 @router.post("/session/{session_id}/preferences", response_model=PreferencesResponse)
@@ -406,25 +638,28 @@ def set_preferences(session_id: str, prefs: PreferencesRequest):
 
 
 @router.post("/session/{session_id}/refresh", response_model=StartResponse)
-def refresh_outlook(session_id: str):
+async def refresh_outlook(session_id: str):
     """Refresh weather/assessment for an existing session."""
-    session = get_session(session_id)
+    session = await run_in_threadpool(get_session, session_id)
     if session is None:
         raise HTTPException(status_code=404, detail="Unknown session ID")
 
     messages, prefs, _conditions, _assessment = session
 
-    tz_str, _tz, start_time, end_time = _resolve_time_window(prefs)
+    now = _utcnow()
+    tz_str, _tz, start_time, end_time = _resolve_time_window(prefs, now)
 
-    conditions = _fetch_conditions(prefs, start_time, end_time, tz_str)
+    # An explicit refresh may join an in-flight fetch but never reuses an earlier result.
+    conditions = await _fetch_conditions(prefs, start_time, end_time, tz_str, now=now, reuse_recent=False)
     _ensure_conditions_present(conditions)
 
-    assessment = build_assessment_payload(conditions, prefs)
-    update_session(
+    assessment = await run_in_threadpool(build_assessment_payload, conditions, prefs)
+    await run_in_threadpool(
+        update_session,
         session_id,
         messages=messages,
         preferences=prefs,
-        conditions=_wrap_conditions(conditions),
+        conditions=_wrap_conditions(conditions, now),
         assessment=assessment,
     )
 
@@ -7,9 +7,14 @@ is included here.
 
 from __future__ import annotations
 
+from dataclasses import fields, is_dataclass
 from datetime import datetime, timedelta
-from math import ceil
-from typing import Any, Mapping, Sequence
+from functools import lru_cache
+from math import ceil, sqrt
+from operator import attrgetter
+from typing import Any, Callable, Iterable, Iterator, Mapping, NamedTuple, Sequence
+
+import numpy as np
 
 from app.domain import (
     Decision,
@@ -27,7 +32,8 @@ from app.domain import (
     MeasureDirectionality,
     WindowRecommendation,
 )
-from app.forecast_service import BikeConditions
+from app.config import settings
+from app.forecast_service import SCORING_FIELDS, BikeConditions, _normalize_is_day
 
 
 def _get_field(hour: Any, key: str, default=None):
@@ -39,251 +45,91 @@ def _get_field(hour: Any, key: str, default=None):
     return getattr(hour, key, default)
 
 
-def _clamp_score(score: float) -> float:
-    """Clamp a score to the 0-10 range."""
-    return max(0.0, min(10.0, score))
-
-
-def _maybe_add_risk(risks: list[RiskFlag], code: RiskCode, severity: RiskSeverity, evidence: Sequence[str]):
-    """Append a risk flag with evidence to the running list."""
-    risks.append(RiskFlag(code=code, severity=severity, evidence=list(evidence)))
-
-
-def _judge_temperature(temp_f: float | None, prefs: RiderPreferences, risks: list[RiskFlag]) -> MeasureJudgment:
-    """Judge temperature against rider preferences and flag risks."""
-    reasons: list[str] = []
-    distance = None
-    severity = None
-
-    range_pref = prefs.preferred_temp_range_f
-    if temp_f is None or range_pref is None:
-        return MeasureJudgment(status=Status.UNKNOWN, reasons=reasons)
-
-    lower, upper = range_pref
-    distance = 0.0
-
-    if temp_f < lower:
-        distance = lower - temp_f
-        if temp_f < 32:
-            severity = RiskSeverity.MAJOR if temp_f <= 25 else RiskSeverity.MODERATE
-            reasons.append(f"Very cold: {temp_f:.1f}F below preferred {lower:.1f}F")
-            _maybe_add_risk(risks, RiskCode.EXTREME_COLD, severity, reasons)
-            return MeasureJudgment(status=Status.AVOID, distance_from_preference=distance, severity=severity, reasons=reasons)
-        if distance > 20:
-            severity = RiskSeverity.MODERATE
-            reasons.append(f"Cold: {temp_f:.1f}F is {distance:.1f}F below preferred")
-            _maybe_add_risk(risks, RiskCode.EXTREME_COLD, severity, reasons)
-            return MeasureJudgment(status=Status.CAUTION, distance_from_preference=distance, severity=severity, reasons=reasons)
-        if distance > 10:
-            severity = RiskSeverity.MODERATE
-            reasons.append(f"Cold: {temp_f:.1f}F is {distance:.1f}F below preferred")
-            _maybe_add_risk(risks, RiskCode.EXTREME_COLD, severity, reasons)
-            return MeasureJudgment(status=Status.CAUTION, distance_from_preference=distance, severity=severity, reasons=reasons)
-        if distance > 5:
-            reasons.append(f"Slightly cool: {temp_f:.1f}F below preferred")
-            return MeasureJudgment(status=Status.ACCEPTABLE, distance_from_preference=distance, reasons=reasons)
-        reasons.append(f"Slightly cool: {temp_f:.1f}F just below preferred")
-        return MeasureJudgment(status=Status.ACCEPTABLE, distance_from_preference=distance, reasons=reasons)
-
-    if temp_f > upper:
-        distance = temp_f - upper
-        if distance > 15:
-            severity = RiskSeverity.MAJOR
-            reasons.append(f"Very hot: {temp_f:.1f}F above preferred {upper:.1f}F")
-            _maybe_add_risk(risks, RiskCode.EXTREME_HEAT, severity, reasons)
-            return MeasureJudgment(status=Status.AVOID, distance_from_preference=distance, severity=severity, reasons=reasons)
-        if distance > 5:
-            severity = RiskSeverity.MODERATE
-            reasons.append(f"Hot: {temp_f:.1f}F is {distance:.1f}F above preferred")
-            _maybe_add_risk(risks, RiskCode.EXTREME_HEAT, severity, reasons)
-            return MeasureJudgment(status=Status.CAUTION, distance_from_preference=distance, severity=severity, reasons=reasons)
-        reasons.append(f"Slightly warm: {temp_f:.1f}F just above preferred")
-        return MeasureJudgment(status=Status.ACCEPTABLE, distance_from_preference=distance, reasons=reasons)
-
-    # Within preferred band
-    reasons.append(f"Comfortable: {temp_f:.1f}F within preferred {lower:.1f}-{upper:.1f}F")
-    return MeasureJudgment(status=Status.IDEAL, distance_from_preference=distance, reasons=reasons)
-
-
-def _judge_wind(wind_mph: float | None, prefs: RiderPreferences, risks: list[RiskFlag]) -> MeasureJudgment:
-    """Judge wind speed against rider preferences and flag risks."""
-    reasons: list[str] = []
-    max_wind = prefs.max_wind_mph or 25.0
-    distance = None
-    severity = None
-
-    if wind_mph is None:
-        return MeasureJudgment(status=Status.UNKNOWN, reasons=reasons)
-
-    if wind_mph > max_wind + 5:
-        severity = RiskSeverity.MAJOR
-        reasons.append(f"Wind {wind_mph:.1f} mph above limit {max_wind:.1f}")
-        _maybe_add_risk(risks, RiskCode.HIGH_WIND, severity, reasons)
-        return MeasureJudgment(status=Status.AVOID, distance_from_preference=wind_mph - max_wind, severity=severity, reasons=reasons)
-
-    if wind_mph > max_wind:
-        severity = RiskSeverity.MODERATE
-        reasons.append(f"Wind {wind_mph:.1f} mph exceeds preferred {max_wind:.1f}")
-        _maybe_add_risk(risks, RiskCode.HIGH_WIND, severity, reasons)
-        return MeasureJudgment(status=Status.CAUTION, distance_from_preference=wind_mph - max_wind, severity=severity, reasons=reasons)
-
-    distance = max_wind - wind_mph
-    if wind_mph > max_wind * 0.8:
-        reasons.append(f"Wind {wind_mph:.1f} mph near limit {max_wind:.1f}")
-        return MeasureJudgment(status=Status.ACCEPTABLE, distance_from_preference=distance, reasons=reasons)
-
-    reasons.append(f"Wind {wind_mph:.1f} mph within preference")
-    return MeasureJudgment(status=Status.IDEAL, distance_from_preference=distance, reasons=reasons)
-
-
-def _judge_gusts(gust_mph: float | None, prefs: RiderPreferences, risks: list[RiskFlag]) -> MeasureJudgment:
-    """Judge wind gusts against rider preferences and flag risks."""
-    reasons: list[str] = []
-    max_wind = prefs.max_wind_mph or 25.0
-    distance = None
-    severity = None
-
-    if gust_mph is None:
-        return MeasureJudgment(status=Status.UNKNOWN, reasons=reasons)
-
-    if gust_mph > max_wind + 15:
-        severity = RiskSeverity.MAJOR
-        reasons.append(f"Gusts {gust_mph:.1f} mph well above limit {max_wind:.1f}")
-        _maybe_add_risk(risks, RiskCode.GUSTY_WIND, severity, reasons)
-        return MeasureJudgment(status=Status.AVOID, distance_from_preference=gust_mph - max_wind, severity=severity, reasons=reasons)
-
-    if gust_mph > max_wind + 5:
-        severity = RiskSeverity.MODERATE
-        reasons.append(f"Gusts {gust_mph:.1f} mph above preferred wind")
-        _maybe_add_risk(risks, RiskCode.GUSTY_WIND, severity, reasons)
-        return MeasureJudgment(status=Status.CAUTION, distance_from_preference=gust_mph - max_wind, severity=severity, reasons=reasons)
-
-    if gust_mph > max_wind:
-        reasons.append(f"Gusts {gust_mph:.1f} mph slightly above preferred wind")
-        return MeasureJudgment(status=Status.ACCEPTABLE, distance_from_preference=gust_mph - max_wind, reasons=reasons)
-
-    distance = max_wind - gust_mph
-    reasons.append(f"Gusts {gust_mph:.1f} mph within preference")
-    return MeasureJudgment(status=Status.IDEAL, distance_from_preference=distance, reasons=reasons)
-
-
-def _judge_aqi(aqi: float | None, prefs: RiderPreferences, risks: list[RiskFlag]) -> MeasureJudgment:
-    """Judge air quality index against rider preferences and flag risks."""
-    reasons: list[str] = []
-    distance = None
-    severity = None
-    max_aqi = prefs.max_aqi or 80
-    avoid_poor = prefs.avoid_poor_aqi is not False
-
-    if aqi is None:
-        return MeasureJudgment(status=Status.UNKNOWN, reasons=reasons)
-
-    distance = aqi - max_aqi
-
-    if aqi >= 151:
-        severity = RiskSeverity.MAJOR
-        reasons.append(f"AQI {aqi:.0f} unhealthy")
-        _maybe_add_risk(risks, RiskCode.POOR_AIR_QUALITY, severity, reasons)
-        return MeasureJudgment(status=Status.AVOID, distance_from_preference=distance, severity=severity, reasons=reasons)
+# Snapshot fields read per hour: time, hour_index, then the measures in SCORING_FIELDS order.
+_SNAPSHOT_FIELDS = ("time", "hour_index", *SCORING_FIELDS)
 
-    if avoid_poor and aqi > max_aqi:
-        severity = RiskSeverity.MODERATE
-        reasons.append(f"AQI {aqi:.0f} exceeds preferred max {max_aqi}")
-        _maybe_add_risk(risks, RiskCode.POOR_AIR_QUALITY, severity, reasons)
-        return MeasureJudgment(status=Status.CAUTION, distance_from_preference=distance, severity=severity, reasons=reasons)
 
-    if aqi <= 50:
-        reasons.append(f"AQI {aqi:.0f} good")
-        return MeasureJudgment(status=Status.IDEAL, distance_from_preference=distance, reasons=reasons)
+def _snapshot_reader(sample: Any) -> Callable[[Any], tuple]:
+    """Pick the cheapest way to read _SNAPSHOT_FIELDS from snapshots shaped like sample."""
+    if isinstance(sample, Mapping):
+        return lambda hour: tuple(map(hour.get, _SNAPSHOT_FIELDS))
+    if is_dataclass(sample) and set(_SNAPSHOT_FIELDS) <= {f.name for f in fields(sample)}:
+        return attrgetter(*_SNAPSHOT_FIELDS)
+    return lambda hour: tuple(_get_field(hour, name) for name in _SNAPSHOT_FIELDS)
 
-    reasons.append(f"AQI {aqi:.0f} within preferred range")
-    return MeasureJudgment(status=Status.ACCEPTABLE, distance_from_preference=distance, reasons=reasons)
 
+def _read_snapshots(hours: Sequence[Any]) -> list[tuple]:
+    """Read every hour's snapshot fields, choosing a reader once per snapshot type."""
+    readers: dict[type, Callable[[Any], tuple]] = {}
+    rows = []
+    for hour in hours:
+        reader = readers.get(type(hour))
+        if reader is None:
+            reader = readers[type(hour)] = _snapshot_reader(hour)
+        rows.append(reader(hour))
+    return rows
 
-def _judge_precip(prob: float | None, prefs: RiderPreferences, risks: list[RiskFlag]) -> MeasureJudgment:
-    """Judge precipitation probability against rider preferences and flag risks."""
-    reasons: list[str] = []
-    avoid_precip = prefs.avoid_precip is not False
-    distance = None
-    severity = None
-
-    if prob is None:
-        return MeasureJudgment(status=Status.UNKNOWN, reasons=reasons)
-
-    if avoid_precip:
-        if prob >= 70:
-            severity = RiskSeverity.MODERATE
-            reasons.append(f"Precipitation probability {prob:.0f}% high")
-            _maybe_add_risk(risks, RiskCode.PRECIPITATION, severity, reasons)
-            return MeasureJudgment(status=Status.AVOID, distance_from_preference=prob, severity=severity, reasons=reasons)
-        if prob >= 50:
-            severity = RiskSeverity.MINOR
-            reasons.append(f"Precipitation probability {prob:.0f}% elevated")
-            _maybe_add_risk(risks, RiskCode.PRECIPITATION, severity, reasons)
-            return MeasureJudgment(status=Status.CAUTION, distance_from_preference=prob, severity=severity, reasons=reasons)
-
-    if prob >= 80:
-        severity = RiskSeverity.MINOR
-        reasons.append(f"Precipitation probability {prob:.0f}% may impact ride")
-        _maybe_add_risk(risks, RiskCode.PRECIPITATION, severity, reasons)
-        return MeasureJudgment(status=Status.CAUTION, distance_from_preference=prob, severity=severity, reasons=reasons)
-
-    if prob >= 20:
-        reasons.append(f"Precipitation probability {prob:.0f}% low")
-        return MeasureJudgment(status=Status.ACCEPTABLE, distance_from_preference=prob, reasons=reasons)
-
-    reasons.append("Precipitation probability minimal")
-    return MeasureJudgment(status=Status.IDEAL, distance_from_preference=prob, reasons=reasons)
-
-
-def _judge_daylight(is_day: bool | None, prefs: RiderPreferences, risks: list[RiskFlag]) -> MeasureJudgment:
-    """Judge daylight preference and flag darkness risk."""
-    reasons: list[str] = []
-    if not prefs.prefer_daylight:
-        return MeasureJudgment(status=Status.IDEAL, reasons=reasons)
 
-    if is_day is None:
-        return MeasureJudgment(status=Status.UNKNOWN, reasons=reasons)
+def _clamp_score(score: float) -> float:
+    """Clamp a score to the 0-10 range."""
+    return max(0.0, min(10.0, score))
 
-    if not is_day:
-        reasons.append("Riding in darkness")
-        _maybe_add_risk(risks, RiskCode.DARKNESS, RiskSeverity.MINOR, reasons)
-        return MeasureJudgment(status=Status.CAUTION, reasons=reasons)
 
-    reasons.append("Daylight ride")
-    return MeasureJudgment(status=Status.IDEAL, reasons=reasons)
+def _maybe_add_risk(risks: list[RiskFlag], code: RiskCode, severity: RiskSeverity, evidence: tuple[str, ...]):
+    """Append a risk flag with evidence to the running list."""
+    risks.append(RiskFlag.model_construct(code=code, severity=severity, evidence=evidence))
 
 
 def _compute_decision(judgments: dict[str, MeasureJudgment]) -> Decision:
     """Collapse measure judgments into a single decision."""
-    statuses = {j.status for j in judgments.values()}
-    if Status.AVOID in statuses:
-        return Decision.AVOID
-    if Status.CAUTION in statuses:
+    caution = False
+    all_unknown = True
+    for j in judgments.values():
+        status = j.status
+        if status == Status.AVOID:
+            return Decision.AVOID
+        if status == Status.CAUTION:
+            caution = True
+        elif status != Status.UNKNOWN:
+            all_unknown = False
+    if caution:
         return Decision.GO_WITH_CAUTION
-    if statuses == {Status.UNKNOWN} or not statuses:
-        return Decision.UNKNOWN
-    return Decision.GO
+    return Decision.UNKNOWN if all_unknown else Decision.GO
+
+
+# Each status gets one bit; an hour's OR-ed status bits index a decision table built
+# from _compute_decision, so the column path resolves decisions without scanning judgments.
+_STATUS_BITS = {status: 1 << i for i, status in enumerate(Status)}
+_DECISION_BY_MASK = tuple(
+    _compute_decision({s.value: MeasureJudgment(status=s) for s in Status if mask & _STATUS_BITS[s]})
+    for mask in range(1 << len(Status))
+)
 
 
 def _temperature_penalty(distance: float | None) -> float:
     """Return a penalty based on distance from preferred temperature."""
     if not distance or distance <= 0:
         return 0.0
-    scaled = (distance / 10.0) ** 1.5 * 2.0
+    scaled = distance / 10.0
+    scaled = scaled * sqrt(scaled) * 2.0  # x ** 1.5 without a general pow()
     return min(4.0, scaled)
 
 
+# Points taken off the 10-point hour score per measure status.
+_STATUS_PENALTY = {Status.AVOID: 4.0, Status.CAUTION: 2.0, Status.ACCEPTABLE: 1.0}
+
+
+def _temperature_penalties(distances: np.ndarray) -> np.ndarray:
+    """Vectorized _temperature_penalty; NaN (unknown) distances score no penalty."""
+    scaled = np.where(distances > 0, distances, 0.0) / 10.0
+    return np.minimum(4.0, scaled * np.sqrt(scaled) * 2.0)
+
+
 def _score_hour(judgments: dict[str, MeasureJudgment]) -> float:
     """Translate measure judgments into a 0-10 suitability score."""
     score = 10.0
     for key, j in judgments.items():
-        if j.status == Status.AVOID:
-            score -= 4.0
-        elif j.status == Status.CAUTION:
-            score -= 2.0
-        elif j.status == Status.ACCEPTABLE:
-            score -= 1.0
+        score -= _STATUS_PENALTY.get(j.status, 0.0)
         if key == "temperature_f":
             score -= _temperature_penalty(j.distance_from_preference)
     return _clamp_score(score)
@@ -291,42 +137,410 @@ def _score_hour(judgments: dict[str, MeasureJudgment]) -> float:
 
 def assess_hour(preferences: RiderPreferences, hour_snapshot: Any) -> HourAssessment:
     """Pure function: evaluate a single hour and return structured assessment."""
-    time_val = _get_field(hour_snapshot, "time")
-    if not isinstance(time_val, datetime):
+    return _assess_row(preferences, _snapshot_reader(hour_snapshot)(hour_snapshot))
+
+
+def _assess_row(preferences: RiderPreferences, row: tuple) -> HourAssessment:
+    """Evaluate one hour from a tuple of _SNAPSHOT_FIELDS values."""
+    if not isinstance(row[0], datetime):
         raise ValueError("hour_snapshot.time must be a datetime")
+    return _assess_values(preferences, *row)
+
+
+def _assess_values(
+    preferences: RiderPreferences,
+    time_val: datetime,
+    hour_index: int | None,
+    temp_f: float | None,
+    wind_speed: float | None,
+    wind_gusts: float | None,
+    aqi: float | None,
+    precip_prob: float | None,
+    is_day: bool | None,
+) -> HourAssessment:
+    """Evaluate one hour from already-extracted scalar inputs (argument order follows SCORING_FIELDS)."""
+    # Mapping snapshots may carry raw is_day values ("true", 1, ...); the cascade needs a bool.
+    values = (temp_f, wind_speed, wind_gusts, aqi, precip_prob, _normalize_is_day(is_day))
+    decision, hour_score, judged, flagged = _assess_core(_prefs_key(preferences), values)
+    # The cached core is shared; hand out fresh objects since trends are written onto judgments later.
+    return HourAssessment.model_construct(
+        time=time_val,
+        hour_index=hour_index,
+        decision=decision,
+        judgments={
+            key: MeasureJudgment.model_construct(
+                status=status, distance_from_preference=distance, severity=severity, reasons=list(reasons)
+            )
+            for key, status, distance, severity, reasons in judged
+        },
+        risks=[RiskFlag.model_construct(code=code, severity=severity, evidence=evidence) for code, severity, evidence in flagged],
+        hour_score=hour_score,
+        notes=[],
+    )
 
-    hour_index = _get_field(hour_snapshot, "hour_index")
-    temp_f = _get_field(hour_snapshot, "temperature")
-    wind_speed = _get_field(hour_snapshot, "wind_speed")
-    wind_gusts = _get_field(hour_snapshot, "wind_gusts")
-    aqi = _get_field(hour_snapshot, "us_aqi")
-    precip_prob = _get_field(hour_snapshot, "precipitation_prob")
-    is_day = _get_field(hour_snapshot, "is_day")
 
+@lru_cache(maxsize=settings.assessment_cache_size)
+def _assess_core(prefs_key: tuple, values: tuple) -> tuple[Decision, float, tuple[tuple, ...], tuple[tuple, ...]]:
+    """Judge one hour's measure values; the result is keyed on inputs only, so re-polled hours hit the cache."""
     risks: list[RiskFlag] = []
     judgments: dict[str, MeasureJudgment] = {}
+    for (key, _, conditions, branches), value in zip(_judgers_for(prefs_key), values):
+        judgments[key] = _judge_scalar(conditions, branches, value, risks)
+
+    return (
+        _compute_decision(judgments),
+        _score_hour(judgments),
+        tuple((key, j.status, j.distance_from_preference, j.severity, tuple(j.reasons)) for key, j in judgments.items()),
+        tuple((r.code, r.severity, r.evidence) for r in risks),
+    )
 
-    judgments["temperature_f"] = _judge_temperature(temp_f, preferences, risks)
-    judgments["wind_speed_mph"] = _judge_wind(wind_speed, preferences, risks)
-    judgments["wind_gusts_mph"] = _judge_gusts(wind_gusts, preferences, risks)
-    judgments["us_aqi"] = _judge_aqi(aqi, preferences, risks)
-    judgments["precipitation_prob_percent"] = _judge_precip(precip_prob, preferences, risks)
-    judgments["daylight"] = _judge_daylight(is_day, preferences, risks)
 
-    decision = _compute_decision(judgments)
-    hour_score = _score_hour(judgments)
+class _Branch(NamedTuple):
+    """One outcome of a measure's threshold cascade, materialized into a MeasureJudgment."""
+    status: Status
+    reason: Callable[[float], str] | None = None
+    distance: Callable[[float], float] | None = None
+    severity: RiskSeverity | None = None
+    risk: tuple[RiskCode, RiskSeverity] | None = None
 
-    return HourAssessment(
-        time=time_val,
-        hour_index=hour_index,
-        decision=decision,
-        judgments=judgments,
-        risks=risks,
-        hour_score=hour_score,
-        notes=[],
+
+_UNKNOWN_BRANCH = _Branch(Status.UNKNOWN)
+
+# A cascade pairs a condition function (values -> one mask per branch, first match
+# wins, falling through to the last branch) with the branches it selects from.
+_Cascade = tuple[Callable[[Any], list], list[_Branch]]
+_NO_CONDS: Callable[[Any], list] = lambda values: []
+
+
+def _temperature_branches(prefs: RiderPreferences) -> _Cascade:
+    """Threshold cascade for temperature; conditions work on arrays or scalars."""
+    range_pref = prefs.preferred_temp_range_f
+    if range_pref is None:
+        return _NO_CONDS, [_UNKNOWN_BRANCH]
+    lower, upper = range_pref
+    below = lambda v: lower - v
+    above = lambda v: v - upper
+
+    def conds(t):
+        cold = t < lower
+        hot = t > upper
+        return [
+            np.isnan(t),
+            cold & (t < 32) & (t <= 25),
+            cold & (t < 32),
+            cold & (lower - t > 10),  # covers the >20 and >10 arms, which are identical
+            cold & (lower - t > 5),
+            cold,
+            hot & (t - upper > 15),
+            hot & (t - upper > 5),
+            hot,
+        ]
+
+    very_cold = lambda v: f"Very cold: {v:.1f}F below preferred {lower:.1f}F"
+    branches = [
+        _UNKNOWN_BRANCH,
+        _Branch(Status.AVOID, very_cold, below, RiskSeverity.MAJOR, (RiskCode.EXTREME_COLD, RiskSeverity.MAJOR)),
+        _Branch(Status.AVOID, very_cold, below, RiskSeverity.MODERATE, (RiskCode.EXTREME_COLD, RiskSeverity.MODERATE)),
+        _Branch(
+            Status.CAUTION,
+            lambda v: f"Cold: {v:.1f}F is {lower - v:.1f}F below preferred",
+            below,
+            RiskSeverity.MODERATE,
+            (RiskCode.EXTREME_COLD, RiskSeverity.MODERATE),
+        ),
+        _Branch(Status.ACCEPTABLE, lambda v: f"Slightly cool: {v:.1f}F below preferred", below),
+        _Branch(Status.ACCEPTABLE, lambda v: f"Slightly cool: {v:.1f}F just below preferred", below),
+        _Branch(
+            Status.AVOID,
+            lambda v: f"Very hot: {v:.1f}F above preferred {upper:.1f}F",
+            above,
+            RiskSeverity.MAJOR,
+            (RiskCode.EXTREME_HEAT, RiskSeverity.MAJOR),
+        ),
+        _Branch(
+            Status.CAUTION,
+            lambda v: f"Hot: {v:.1f}F is {v - upper:.1f}F above preferred",
+            above,
+            RiskSeverity.MODERATE,
+            (RiskCode.EXTREME_HEAT, RiskSeverity.MODERATE),
+        ),
+        _Branch(Status.ACCEPTABLE, lambda v: f"Slightly warm: {v:.1f}F just above preferred", above),
+        _Branch(
+            Status.IDEAL,
+            lambda v: f"Comfortable: {v:.1f}F within preferred {lower:.1f}-{upper:.1f}F",
+            lambda v: 0.0,
+        ),
+    ]
+    return conds, branches
+
+
+def _wind_branches(prefs: RiderPreferences) -> _Cascade:
+    """Threshold cascade for wind speed; conditions work on arrays or scalars."""
+    max_wind = prefs.max_wind_mph or 25.0
+    over = lambda v: v - max_wind
+    under = lambda v: max_wind - v
+    conds = lambda w: [np.isnan(w), w > max_wind + 5, w > max_wind, w > max_wind * 0.8]
+    branches = [
+        _UNKNOWN_BRANCH,
+        _Branch(
+            Status.AVOID,
+            lambda v: f"Wind {v:.1f} mph above limit {max_wind:.1f}",
+            over,
+            RiskSeverity.MAJOR,
+            (RiskCode.HIGH_WIND, RiskSeverity.MAJOR),
+        ),
+        _Branch(
+            Status.CAUTION,
+            lambda v: f"Wind {v:.1f} mph exceeds preferred {max_wind:.1f}",
+            over,
+            RiskSeverity.MODERATE,
+            (RiskCode.HIGH_WIND, RiskSeverity.MODERATE),
+        ),
+        _Branch(Status.ACCEPTABLE, lambda v: f"Wind {v:.1f} mph near limit {max_wind:.1f}", under),
+        _Branch(Status.IDEAL, lambda v: f"Wind {v:.1f} mph within preference", under),
+    ]
+    return conds, branches
+
+
+def _gust_branches(prefs: RiderPreferences) -> _Cascade:
+    """Threshold cascade for wind gust; conditions work on arrays or scalars."""
+    max_wind = prefs.max_wind_mph or 25.0
+    over = lambda v: v - max_wind
+    conds = lambda g: [np.isnan(g), g > max_wind + 15, g > max_wind + 5, g > max_wind]
+    branches = [
+        _UNKNOWN_BRANCH,
+        _Branch(
+            Status.AVOID,
+            lambda v: f"Gusts {v:.1f} mph well above limit {max_wind:.1f}",
+            over,
+            RiskSeverity.MAJOR,
+            (RiskCode.GUSTY_WIND, RiskSeverity.MAJOR),
+        ),
+        _Branch(
+            Status.CAUTION,
+            lambda v: f"Gusts {v:.1f} mph above preferred wind",
+            over,
+            RiskSeverity.MODERATE,
+            (RiskCode.GUSTY_WIND, RiskSeverity.MODERATE),
+        ),
+        _Branch(Status.ACCEPTABLE, lambda v: f"Gusts {v:.1f} mph slightly above preferred wind", over),
+        _Branch(Status.IDEAL, lambda v: f"Gusts {v:.1f} mph within preference", lambda v: max_wind - v),
+    ]
+    return conds, branches
+
+
+def _aqi_branches(prefs: RiderPreferences) -> _Cascade:
+    """Threshold cascade for air quality; conditions work on arrays or scalars."""
+    max_aqi = prefs.max_aqi or 80
+    avoid_poor = prefs.avoid_poor_aqi is not False
+    over = lambda v: v - max_aqi
+    conds = lambda a: [np.isnan(a), a >= 151, (a > max_aqi) & avoid_poor, a <= 50]
+    branches = [
+        _UNKNOWN_BRANCH,
+        _Branch(
+            Status.AVOID,
+            lambda v: f"AQI {v:.0f} unhealthy",
+            over,
+            RiskSeverity.MAJOR,
+            (RiskCode.POOR_AIR_QUALITY, RiskSeverity.MAJOR),
+        ),
+        _Branch(
+            Status.CAUTION,
+            lambda v: f"AQI {v:.0f} exceeds preferred max {max_aqi}",
+            over,
+            RiskSeverity.MODERATE,
+            (RiskCode.POOR_AIR_QUALITY, RiskSeverity.MODERATE),
+        ),
+        _Branch(Status.IDEAL, lambda v: f"AQI {v:.0f} good", over),
+        _Branch(Status.ACCEPTABLE, lambda v: f"AQI {v:.0f} within preferred range", over),
+    ]
+    return conds, branches
+
+
+def _precip_branches(prefs: RiderPreferences) -> _Cascade:
+    """Threshold cascade for precipitation; conditions work on arrays or scalars."""
+    avoid_precip = prefs.avoid_precip is not False
+    same = lambda v: v
+    conds = lambda p: [np.isnan(p), (p >= 70) & avoid_precip, (p >= 50) & avoid_precip, p >= 80, p >= 20]
+    branches = [
+        _UNKNOWN_BRANCH,
+        _Branch(
+            Status.AVOID,
+            lambda v: f"Precipitation probability {v:.0f}% high",
+            same,
+            RiskSeverity.MODERATE,
+            (RiskCode.PRECIPITATION, RiskSeverity.MODERATE),
+        ),
+        _Branch(
+            Status.CAUTION,
+            lambda v: f"Precipitation probability {v:.0f}% elevated",
+            same,
+            RiskSeverity.MINOR,
+            (RiskCode.PRECIPITATION, RiskSeverity.MINOR),
+        ),
+        _Branch(
+            Status.CAUTION,
+            lambda v: f"Precipitation probability {v:.0f}% may impact ride",
+            same,
+            RiskSeverity.MINOR,
+            (RiskCode.PRECIPITATION, RiskSeverity.MINOR),
+        ),
+        _Branch(Status.ACCEPTABLE, lambda v: f"Precipitation probability {v:.0f}% low", same),
+        _Branch(Status.IDEAL, lambda v: "Precipitation probability minimal", same),
+    ]
+    return conds, branches
+
+
+def _daylight_branches(prefs: RiderPreferences) -> _Cascade:
+    """Threshold cascade for daylight; conditions work on arrays or scalars."""
+    if not prefs.prefer_daylight:
+        return _NO_CONDS, [_Branch(Status.IDEAL)]
+    conds = lambda d: [np.isnan(d), d == 0]
+    branches = [
+        _UNKNOWN_BRANCH,
+        # The darkness risk is flagged MINOR, but the judgment itself carries no severity.
+        _Branch(Status.CAUTION, lambda v: "Riding in darkness", risk=(RiskCode.DARKNESS, RiskSeverity.MINOR)),
+        _Branch(Status.IDEAL, lambda v: "Daylight ride"),
+    ]
+    return conds, branches
+
+
+# Judgment key, scoring column and branch builder, in the order assess_hour evaluates them.
+_VECTOR_JUDGES = (
+    ("temperature_f", "temperature", _temperature_branches),
+    ("wind_speed_mph", "wind_speed", _wind_branches),
+    ("wind_gusts_mph", "wind_gusts", _gust_branches),
+    ("us_aqi", "us_aqi", _aqi_branches),
+    ("precipitation_prob_percent", "precipitation_prob", _precip_branches),
+    ("daylight", "is_day", _daylight_branches),
+)
+
+
+# Preference fields the cascades read; judgers are built once per distinct combination.
+_JUDGE_PREF_FIELDS = ("preferred_temp_range_f", "max_wind_mph", "max_aqi", "avoid_poor_aqi", "avoid_precip", "prefer_daylight")
+
+
+@lru_cache(maxsize=64)
+def _judgers_for(prefs_key: tuple) -> tuple[tuple[str, str, Callable[[Any], list], list[_Branch]], ...]:
+    """Build every measure's cascade for one preferences key."""
+    prefs = RiderPreferences.model_construct(**dict(zip(_JUDGE_PREF_FIELDS, prefs_key)))
+    return tuple((key, field, *build(prefs)) for key, field, build in _VECTOR_JUDGES)
+
+
+def _prefs_key(prefs: RiderPreferences) -> tuple:
+    """Hashable snapshot of the preference fields the cascades read."""
+    key = tuple(getattr(prefs, name) for name in _JUDGE_PREF_FIELDS)
+    if isinstance(key[0], list):
+        # model_construct() callers may hand over the temperature range as a list.
+        key = (tuple(key[0]), *key[1:])
+    return key
+
+
+def _make_judgers(prefs: RiderPreferences) -> tuple[tuple[str, str, Callable[[Any], list], list[_Branch]], ...]:
+    """Return (judgment key, column, conditions, branches) per measure with preference lookups hoisted."""
+    return _judgers_for(_prefs_key(prefs))
+
+
+def _branch_distances(branches: list[_Branch], picks: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """Evaluate each hour's branch distance over the column (NaN where a branch has none)."""
+    distances = np.full(len(values), np.nan)
+    for idx, branch in enumerate(branches):
+        if branch.distance is None:
+            continue
+        hit = picks == idx
+        if hit.any():
+            distances[hit] = branch.distance(values[hit])
+    return distances
+
+
+def _judge_columns(
+    prefs: RiderPreferences, columns: Mapping[str, np.ndarray]
+) -> tuple[list[tuple[str, list[_Branch], list[int], list[float]]], list[int], list[float]]:
+    """Resolve every judge cascade for all hours at once.
+
+    Returns per-measure branch indexes plus each hour's status mask and hour score.
+    """
+    resolved = []
+    masks = 0
+    # Same operation order as _score_hour, so vectorized scores match it exactly.
+    scores = 10.0
+    for key, field, conditions, branches in _make_judgers(prefs):
+        values = columns[field]
+        conds = conditions(values)
+        if conds:
+            picks = np.select(conds, np.arange(len(conds)), default=len(conds))
+        else:
+            picks = np.zeros(len(values), dtype=np.intp)
+        masks = masks | np.array([_STATUS_BITS[b.status] for b in branches])[picks]
+        scores = scores - np.array([_STATUS_PENALTY.get(b.status, 0.0) for b in branches])[picks]
+        if key == "temperature_f":
+            scores = scores - _temperature_penalties(_branch_distances(branches, picks, values))
+        resolved.append((key, branches, picks.tolist(), values.tolist()))
+    return resolved, masks.tolist(), np.clip(scores, 0.0, 10.0).tolist()
+
+
+def _reason_text(branch: _Branch, value: float, memo: dict | None) -> str:
+    """Format a branch reason, reusing the string when the same value repeats."""
+    if memo is None:
+        return branch.reason(value)
+    key = (branch.reason, value)
+    text = memo.get(key)
+    if text is None:
+        text = memo[key] = branch.reason(value)
+    return text
+
+
+def _materialize_judgment(branch: _Branch, value: float, risks: list[RiskFlag], memo: dict | None = None) -> MeasureJudgment:
+    """Build the MeasureJudgment (and risk flag) for one resolved branch."""
+    # Branch tables only hold enum members and the values are floats, so the models
+    # are constructed without re-running validation.
+    reasons = [_reason_text(branch, value, memo)] if branch.reason else []
+    if branch.risk:
+        _maybe_add_risk(risks, branch.risk[0], branch.risk[1], tuple(reasons))
+    return MeasureJudgment.model_construct(
+        status=branch.status,
+        distance_from_preference=branch.distance(value) if branch.distance else None,
+        severity=branch.severity,
+        reasons=reasons,
     )
 
 
+def _judge_scalar(
+    conditions: Callable[[Any], list], branches: list[_Branch], value: float | bool | None, risks: list[RiskFlag]
+) -> MeasureJudgment:
+    """Resolve one measure for a single hour by picking the first matching branch."""
+    v = np.nan if value is None else float(value)
+    conds = conditions(v)
+    pick = next((i for i, hit in enumerate(conds) if hit), len(conds))
+    return _materialize_judgment(branches[pick], v, risks)
+
+
+def _assess_columns(preferences: RiderPreferences, hours: Sequence[Any], columns: Mapping[str, np.ndarray], order: Sequence[int]) -> Iterator[HourAssessment]:
+    """Yield forecast hour assessments from column arrays, resolving thresholds vectorized."""
+    resolved, status_masks, hour_scores = _judge_columns(preferences, columns)
+    # Forecast values repeat a lot (integer AQI/precip, constant daylight text), so
+    # each distinct reason string is formatted once per timeline.
+    reason_memo: dict = {}
+    for i in order:
+        h = hours[i]
+        if not isinstance(h.time, datetime):
+            raise ValueError("hour_snapshot.time must be a datetime")
+        risks: list[RiskFlag] = []
+        judgments = {
+            key: _materialize_judgment(branches[picks[i]], values[i], risks, reason_memo)
+            for key, branches, picks, values in resolved
+        }
+        yield HourAssessment.model_construct(
+            time=h.time,
+            hour_index=h.hour_index,
+            decision=_DECISION_BY_MASK[status_masks[i]],
+            judgments=judgments,
+            risks=risks,
+            hour_score=hour_scores[i],
+            notes=[],
+        )
+
+
 def _trend_direction(value: float, prev: float, policy: MeasurePolicy) -> Trend:
     """Compute trend direction given a policy and two points."""
     delta = value - prev
@@ -343,12 +557,12 @@ def _trend_direction(value: float, prev: float, policy: MeasurePolicy) -> Trend:
     return Trend.IMPROVING if delta < 0 else Trend.WORSENING
 
 
-def _apply_trends(current: HourAssessment, prev: HourAssessment | None, policies: dict[str, MeasurePolicy]) -> None:
-    """Annotate judgments with trend metadata when possible."""
+def _apply_trends(current: HourAssessment, prev: HourAssessment | None, policies: Mapping[str, MeasurePolicy]) -> None:
+    """Annotate judgments with trend metadata when possible (policies already merged over the defaults)."""
     if prev is None:
         return
     for key, judgment in current.judgments.items():
-        policy = policies.get(key, DEFAULT_MEASURE_POLICIES.get(key))
+        policy = policies.get(key)
         if not policy:
             continue
         prev_j = prev.judgments.get(key)
@@ -383,116 +597,142 @@ def assess_timeline(preferences: RiderPreferences, conditions: BikeConditions, *
 
     # Evaluate forecast hours, skipping None entries
     hours = [h for h in (conditions.forecast or []) if h is not None]
-    # Ensure chronological ordering by time then hour_index
-    hours.sort(key=lambda h: (_get_field(h, "time"), _get_field(h, "hour_index") or 0))
-
-    for h in hours:
-        hourly_assessments.append(assess_hour(preferences, h))
-
-    # Enforce consistent judgment keys across all assessments
-    if hourly_assessments or current_assessment:
-        key_source = (current_assessment or hourly_assessments[0]).judgments.keys()
-        key_set = set(key_source)
-        for a in hourly_assessments:
-            missing = key_set - set(a.judgments.keys())
-            for k in missing:
-                a.judgments[k] = MeasureJudgment(status=Status.UNKNOWN, reasons=[])
+    rows = _read_snapshots(hours)
+    # Ensure chronological ordering by time then hour_index; keys are extracted once
+    # so the sort itself only compares plain tuples.
+    sort_keys = [(row[0], row[1] or 0) for row in rows]
+    order = sorted(range(len(hours)), key=sort_keys.__getitem__)
+
+    if isinstance(conditions, BikeConditions):
+        # Resolve all threshold cascades over the column arrays, then build objects per hour.
+        assessed = _assess_columns(preferences, hours, conditions.columns, order)
+    else:
+        assessed = (_assess_row(preferences, rows[i]) for i in order)
 
-    # Apply trends vs previous hour (forecast only)
-    policy_map = policies or DEFAULT_MEASURE_POLICIES
+    # Single sweep: enforce consistent judgment keys and apply trends vs the previous hour.
+    # Merge once so each hour x measure is a single lookup.
+    policy_map = {**DEFAULT_MEASURE_POLICIES, **policies} if policies else DEFAULT_MEASURE_POLICIES
+    key_set = set(current_assessment.judgments) if current_assessment else None
     prev: HourAssessment | None = current_assessment
-    for a in hourly_assessments:
+    for a in assessed:
+        if key_set is None:
+            key_set = set(a.judgments)
+        else:
+            for k in key_set - a.judgments.keys():
+                a.judgments[k] = MeasureJudgment(status=Status.UNKNOWN, reasons=[])
         _apply_trends(a, prev, policy_map)
+        hourly_assessments.append(a)
         prev = a
 
     return current_assessment, hourly_assessments
 
 
-def _consecutive(hours: list[HourAssessment]) -> bool:
-    """Return True if the list represents hourly-consecutive timestamps."""
-    if len(hours) < 2:
-        return True
-    for prev, curr in zip(hours, hours[1:]):
-        delta = (curr.time - prev.time).total_seconds()
-        if abs(delta - 3600) > 90:  # allow small drift
-            return False
-    return True
+def _hour_gaps(hours: Sequence[HourAssessment]) -> list[bool]:
+    """Flag index i when hours[i + 1] is not one hour after hours[i] (small drift allowed)."""
+    return [abs((curr.time - prev.time).total_seconds() - 3600) > 90 for prev, curr in zip(hours, hours[1:])]
 
 
-def _aggregate_decision(hours: list[HourAssessment]) -> Decision:
-    """Aggregate hour decisions to a window decision."""
-    decisions = {h.decision for h in hours}
-    if Decision.AVOID in decisions:
-        return Decision.AVOID
-    if Decision.GO_WITH_CAUTION in decisions:
-        return Decision.GO_WITH_CAUTION
-    if Decision.GO in decisions:
-        return Decision.GO
-    return Decision.UNKNOWN
+def _next_flagged(flags: Sequence[bool]) -> list[int]:
+    """Return, for each index, the first index at or after it whose flag is set (len(flags) if none)."""
+    nxt = [len(flags)] * (len(flags) + 1)
+    for i in range(len(flags) - 1, -1, -1):
+        nxt[i] = i if flags[i] else nxt[i + 1]
+    return nxt
 
 
 def compute_window_recommendations(
     hourly: list[HourAssessment],
     *,
     durations_minutes: Sequence[int] = (45, 60, 90, 120),
+    top_k: int | None = None,
 ) -> list[WindowRecommendation]:
     """
     Score contiguous windows and return recommendations.
 
     - Windows containing any Decision.AVOID hour are skipped.
     - window_score is the average of included hour_scores.
+    - With top_k, only the best top_k windows are built and returned.
     """
     if not hourly:
         return []
 
     hourly_sorted = sorted(hourly, key=lambda h: h.time)
-    recs: list[WindowRecommendation] = []
 
-    for start_idx in range(len(hourly_sorted)):
-        for duration in durations_minutes:
-            needed_hours = ceil(duration / 60)
-            slice_hours = hourly_sorted[start_idx : start_idx + needed_hours]
-            if len(slice_hours) < needed_hours:
-                continue
-            if not _consecutive(slice_hours):
-                continue
-            if any(h.decision == Decision.AVOID for h in slice_hours):
+    # Flatten the per-hour numbers once so each window is an index lookup
+    # rather than a walk over HourAssessment objects.
+    decisions = [h.decision for h in hourly_sorted]
+    next_avoid = _next_flagged([d == Decision.AVOID for d in decisions])
+    next_caution = _next_flagged([d == Decision.GO_WITH_CAUTION for d in decisions])
+    next_go = _next_flagged([d == Decision.GO for d in decisions])
+    next_gap = _next_flagged(_hour_gaps(hourly_sorted))
+    hour_scores = [h.hour_score or 0.0 for h in hourly_sorted]
+    spans = [(duration, ceil(duration / 60)) for duration in durations_minutes]
+    total_hours = len(hourly_sorted)
+    # A window starting at i may end (exclusively) no later than the next AVOID hour
+    # or one past the next gap, whichever comes first; this also caps at total_hours.
+    reach = [min(avoid_at, gap_at + 1) for avoid_at, gap_at in zip(next_avoid, next_gap)]
+
+    # Score every candidate first; WindowRecommendation objects are only built for
+    # the windows that are returned.
+    candidates: list[tuple[int, int, int]] = []
+    scores: list[float] = []
+    for start_idx in range(total_hours):
+        limit = reach[start_idx]
+        if limit == start_idx:
+            continue
+        for duration, needed_hours in spans:
+            end_idx = start_idx + needed_hours
+            if end_idx > limit:
                 continue
+            candidates.append((start_idx, end_idx, duration))
+            # Average the window's own slice: differences of running totals carry rounding
+            # error that can push a score past 10 and reorder tied windows.
+            scores.append(sum(hour_scores[start_idx:end_idx]) / needed_hours)
 
-            window_score = sum((h.hour_score or 0.0) for h in slice_hours) / needed_hours
-            decision = _aggregate_decision(slice_hours)
-            risks = []
-            for h in slice_hours:
-                risks.extend(h.risks)
-            reasons = [f"Average score {window_score:.1f} over {needed_hours} hour(s)"]
-
-            recs.append(
-                WindowRecommendation(
-                    start=slice_hours[0].time,
-                    end=slice_hours[-1].time,
-                    duration=timedelta(minutes=duration),
-                    decision=decision,
-                    window_score=window_score,
-                    reasons=reasons,
-                    risks=risks,
-                )
-            )
+    # Sort best windows by score desc then earliest start. Candidates are generated in
+    # start order, so a stable sort on score alone keeps ties earliest-first.
+    order = np.argsort(-np.array(scores, dtype=np.float64), kind="stable")
+    if top_k is not None:
+        order = order[:top_k]
 
-    # Sort best windows by score desc then earliest start
-    recs.sort(key=lambda r: (-1 if r.window_score is None else -r.window_score, r.start))
+    recs: list[WindowRecommendation] = []
+    for i in order.tolist():
+        start_idx, end_idx, duration = candidates[i]
+        window_score = scores[i]
+        needed_hours = end_idx - start_idx
+        slice_hours = hourly_sorted[start_idx:end_idx]
+        if next_caution[start_idx] < end_idx:
+            decision = Decision.GO_WITH_CAUTION
+        elif next_go[start_idx] < end_idx:
+            decision = Decision.GO
+        else:
+            decision = Decision.UNKNOWN
+        recs.append(
+            WindowRecommendation(
+                start=slice_hours[0].time,
+                end=slice_hours[-1].time,
+                duration=timedelta(minutes=duration),
+                decision=decision,
+                window_score=window_score,
+                reasons=[f"Average score {window_score:.1f} over {needed_hours} hour(s)"],
+                risks=[r for h in slice_hours for r in h.risks],
+            )
+        )
     return recs
 
 
 def _overall_decision(hours: list[HourAssessment]) -> Decision:
     """Compute the overall decision for a set of assessments."""
-    decisions = {h.decision for h in hours}
-    if Decision.AVOID in decisions:
-        return Decision.AVOID
-    if Decision.GO_WITH_CAUTION in decisions:
-        return Decision.GO_WITH_CAUTION
-    if Decision.GO in decisions:
-        return Decision.GO
-    return Decision.UNKNOWN
+    overall = Decision.UNKNOWN
+    for h in hours:
+        decision = h.decision
+        if decision == Decision.AVOID:
+            return Decision.AVOID
+        if decision == Decision.GO_WITH_CAUTION:
+            overall = Decision.GO_WITH_CAUTION
+        elif decision == Decision.GO and overall == Decision.UNKNOWN:
+            overall = Decision.GO
+    return overall
 
 
 def _suitability_score(hours: list[HourAssessment]) -> float | None:
@@ -503,25 +743,20 @@ def _suitability_score(hours: list[HourAssessment]) -> float | None:
     return sum(scored) / len(scored)
 
 
-def _dedupe_limit_flags(flags: list[RiskFlag], max_flags: int = 3) -> list[RiskFlag]:
-    """Deduplicate and return the most important risk flags."""
+def _top_limiters(risk_lists: Iterable[Sequence[RiskFlag]], max_flags: int = 3) -> list[RiskFlag]:
+    """Stream risk flags, keeping the first of each (code, severity) and stopping at max_flags."""
     seen = set()
     unique: list[RiskFlag] = []
-    for f in flags:
-        key = (f.code, f.severity)
-        if key in seen:
-            continue
-        seen.add(key)
-        unique.append(f)
-    return unique[:max_flags]
-
-
-def _primary_limiters(hours: list[HourAssessment], max_flags: int = 3) -> list[RiskFlag]:
-    """Collect and deduplicate risks from hours."""
-    flags: list[RiskFlag] = []
-    for h in hours:
-        flags.extend(h.risks)
-    return _dedupe_limit_flags(flags, max_flags=max_flags)
+    for risks in risk_lists:
+        for f in risks:
+            key = (f.code, f.severity)
+            if key in seen:
+                continue
+            seen.add(key)
+            unique.append(f)
+            if len(unique) >= max_flags:
+                return unique
+    return unique
 
 
 def build_summary(hours: list[HourAssessment], windows: list[WindowRecommendation]) -> AssessmentSummary:
@@ -529,13 +764,7 @@ def build_summary(hours: list[HourAssessment], windows: list[WindowRecommendatio
     overall = _overall_decision(hours)
     score = _suitability_score(hours)
     best = windows[:3]
-    if best:
-        window_flags: list[RiskFlag] = []
-        for w in best:
-            window_flags.extend(w.risks)
-        primary_limiters = _dedupe_limit_flags(window_flags)
-    else:
-        primary_limiters = _primary_limiters(hours)
+    primary_limiters = _top_limiters(w.risks for w in best) if best else _top_limiters(h.risks for h in hours)
     return AssessmentSummary(
         overall_decision=overall,
         suitability_score=score,
@@ -1,12 +1,21 @@
 # app/check_ollama.py
 """Health checks and optional auto-pulling for required Ollama models."""
+from __future__ import annotations
 
 import os
 import sys
-from typing import Iterable, Optional, Dict, Any
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import cache
+from typing import Iterable, Optional, Dict, Any, NamedTuple, Tuple
 
 import requests
 
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
 from utils.logging_utils import setup_logging, get_tagged_logger
 
 setup_logging(level=os.getenv("LOG_LEVEL", "INFO"))
@@ -20,37 +29,92 @@ _AUTO_PULL_DEFAULT = os.getenv("AGENT_AUTO_PULL_OLLAMA_MODELS", "true").lower()
 )
 
 
+@cache
 def _base_url() -> str:
     """Return the configured Ollama base URL without a trailing slash."""
     return os.getenv("AGENT_OLLAMA_BASE_URL", "http://localhost:11434").rstrip("/")
 
 
+@cache
 def _tags_url() -> str:
     """Return the Ollama tags endpoint URL."""
     return f"{_base_url()}/api/tags"
 
 
+@cache
 def _pull_url() -> str:
     """Return the Ollama pull endpoint URL."""
     return f"{_base_url()}/api/pull"
 
 
+def _refresh_urls() -> None:
+    """Forget the cached URLs so the next call re-reads AGENT_OLLAMA_BASE_URL."""
+    for fn in (_base_url, _tags_url, _pull_url):
+        fn.cache_clear()
+
+
 def _installed_model_names(tags_json: dict) -> set[str]:
     """Extract model names (including base names) from tags JSON."""
-    models = tags_json.get("models", [])
-    names: set[str] = set()
-    for m in models:
-        name = m.get("name")
-        if not name:
-            continue
-        names.add(name)
-        # Also include the base name without a tag so callers can require either form.
-        base = name.split(":")[0]
-        names.add(base)
+    names = {n for m in tags_json.get("models", []) if (n := m.get("name"))}
+    # Also include the base name without a tag so callers can require either form.
+    names |= {n.partition(":")[0] for n in names}
     return names
 
 
-def get_ollama_status(required_models: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+# Liveness/readiness probes arrive in bursts; answers this recent are reused outright,
+# and older ones are revalidated with If-None-Match when Ollama sent an ETag.
+TAGS_MICRO_CACHE_SECONDS = 2.0
+
+
+class _TagsSnapshot(NamedTuple):
+    """Last successful /api/tags answer; names are sorted once per change, not per probe."""
+
+    etag: Optional[str]
+    installed: frozenset
+    sorted_names: Tuple[str, ...]
+    fetched_at: float
+
+
+_tags_cache: Optional[_TagsSnapshot] = None
+
+
+def _reset_tags_cache() -> None:
+    """Drop the remembered /api/tags answer (after pulls, or between tests)."""
+    global _tags_cache
+    _tags_cache = None
+
+
+def _fetch_installed_models() -> _TagsSnapshot:
+    """Return installed model names from /api/tags, reusing the last answer when still valid."""
+    global _tags_cache
+    cached = _tags_cache
+    now = time.monotonic()
+    if cached is not None and now - cached.fetched_at < TAGS_MICRO_CACHE_SECONDS:
+        return cached
+
+    headers = {"If-None-Match": cached.etag} if cached is not None and cached.etag else {}
+    resp = requests.get(_tags_url(), timeout=3, headers=headers)
+    # some test doubles may not expose .text; fall back gracefully
+    body_text = getattr(resp, "text", "<no-body>")
+    logger.debug(f"Ollama tags response: {body_text}")
+    if resp.status_code == 304 and cached is not None:
+        _tags_cache = cached._replace(fetched_at=now)
+        return _tags_cache
+    resp.raise_for_status()
+
+    tags = orjson.loads(resp.content) if orjson is not None else resp.json()
+    installed = frozenset(_installed_model_names(tags))
+    _tags_cache = _TagsSnapshot(
+        getattr(resp, "headers", {}).get("ETag"), installed, tuple(sorted(installed)), now
+    )
+    return _tags_cache
+
+
+def get_ollama_status(
+    required_models: Optional[Iterable[str]] = None,
+    *,
+    list_installed: bool = False,
+) -> Dict[str, Any]:
     """
     Non-fatal probe of Ollama.
 
@@ -66,6 +130,9 @@ def get_ollama_status(required_models: Optional[Iterable[str]] = None) -> Dict[s
       "error": "...",   # present if something went wrong
     }
 
+    With no required models and list_installed=False this is a plain liveness ping of the
+    base URL; /api/tags is only fetched when installed models are actually needed.
+
     This NEVER sys.exit(). Suitable for health checks.
     """
     required_models = list(required_models or [])
@@ -80,21 +147,26 @@ def get_ollama_status(required_models: Optional[Iterable[str]] = None) -> Dict[s
         "error": None,
     }
 
+    if not required_models and not list_installed:
+        try:
+            resp = requests.get(_base_url(), timeout=2)
+            resp.raise_for_status()
+        except Exception as e:
+            status["error"] = str(e)
+            return status
+        status["reachable"] = status["models_ok"] = status["ok"] = True
+        return status
+
     try:
-        resp = requests.get(_tags_url(), timeout=3)
-        # some test doubles may not expose .text; fall back gracefully
-        body_text = getattr(resp, "text", "<no-body>")
-        logger.debug(f"Ollama tags response: {body_text}")
-        resp.raise_for_status()
+        snapshot = _fetch_installed_models()
     except Exception as e:
         status["error"] = str(e)
         # ok/reachable/models_ok all remain False
         return status
 
     status["reachable"] = True
-    tags = resp.json()
-    installed = _installed_model_names(tags)
-    status["installed_models"] = sorted(installed)
+    installed = snapshot.installed
+    status["installed_models"] = list(snapshot.sorted_names)
 
     if required_models:
         missing = [m for m in required_models if m not in installed]
@@ -107,42 +179,62 @@ def get_ollama_status(required_models: Optional[Iterable[str]] = None) -> Dict[s
     return status
 
 
+PULL_CHUNK_SIZE = 65536
+MAX_CONCURRENT_PULLS = 4
+_STATUS_MARKER = b'"status"'
+
+
+def _status_lines(chunks: Iterable[bytes]) -> Iterable[str]:
+    """Split streamed NDJSON bytes into lines, decoding only those that carry a status."""
+    buf = bytearray()
+    for chunk in chunks:
+        buf += chunk
+        start = 0
+        while (end := buf.find(b"\n", start)) != -1:
+            line = buf[start:end]
+            start = end + 1
+            if _STATUS_MARKER in line:
+                yield line.rstrip(b"\r").decode("utf-8", "replace")
+        del buf[:start]
+    if _STATUS_MARKER in buf:
+        yield buf.rstrip(b"\r").decode("utf-8", "replace")
+
+
 def _pull_model(name: str) -> None:
     """
     Ask Ollama to pull a model by name via /api/pull.
 
-    This will block until the pull finishes or fails.
+    This will block until the pull finishes or fails; failures are logged and re-raised.
     """
     logger.info(f"⏳ Model '{name}' not found; requesting Ollama to pull it...")
 
     try:
         with requests.post(_pull_url(), json={"name": name}, stream=True, timeout=None) as resp:
             resp.raise_for_status()
-            for line in resp.iter_lines():
-                if not line:
-                    continue
-                try:
-                    msg = line.decode("utf-8")
-                except Exception:
-                    continue
-                if '"status"' in msg:
-                    logger.info(f"   [ollama] {msg}")
+            for msg in _status_lines(resp.iter_content(chunk_size=PULL_CHUNK_SIZE)):
+                logger.info(f"   [ollama {name}] {msg}")
     except Exception as e:
         logger.exception(f"\nERROR: Failed to pull Ollama model '{name}'.\n"
                          f"   Details: {e}\n"
                          f"   Try pulling manually inside your Ollama environment:\n"
                          f"     ollama pull {name}")
-        sys.exit(1)
+        raise
 
-    # Verify it really exists now
-    status = get_ollama_status(required_models=[name])
+    _reset_tags_cache()
+    logger.info(f"Model '{name}' pull finished.")
+
+
+def _verify_pulled(names: list[str]) -> None:
+    """Confirm with one /api/tags call that every pulled model is now visible."""
+    status = get_ollama_status(required_models=names)
+    still_missing = status.get("missing_models") or []
     if not status.get("models_ok"):
-        logger.error(f"\nERROR: Model '{name}' still not visible after pull.\n"
+        logger.error(f"\nERROR: Model(s) still not visible after pull: {', '.join(still_missing) or ', '.join(names)}\n"
                      f"   Ollama may be in an unhealthy state.")
         logger.debug(f"   Ollama status: {status}")
         sys.exit(1)
 
-    logger.info(f"Model '{name}' is now available.")
+    logger.info(f"Models now available: {', '.join(names)}")
 
 
 def check_ollama(
@@ -164,7 +256,7 @@ def check_ollama(
         # Nothing specifically required; just make sure Ollama is up.
         required_models = []
 
-    status = get_ollama_status(required_models=required_models)
+    status = get_ollama_status(required_models=required_models, list_installed=not required_models)
 
     if not status["reachable"]:
         logger.error(f"\nERROR: Ollama does not appear to be running or is unreachable.\n"
@@ -189,8 +281,23 @@ def check_ollama(
 
     # We have missing models.
     if auto_pull:
-        for name in missing:
-            _pull_model(name)
+        # Pulls are I/O-bound and Ollama serves them concurrently; cap the fan-out so
+        # the daemon's disk is not saturated.
+        failed = []
+        with ThreadPoolExecutor(max_workers=min(len(missing), MAX_CONCURRENT_PULLS)) as pool:
+            futures = {pool.submit(_pull_model, name): name for name in missing}
+            for future in as_completed(futures):
+                if future.cancelled():
+                    continue
+                if future.exception() is not None:
+                    failed.append(futures[future])
+                    # Startup fails anyway; don't start pulls that are still queued.
+                    for pending in futures:
+                        pending.cancel()
+        if failed:
+            logger.error(f"\nERROR: Could not pull Ollama model(s): {', '.join(failed)}")
+            sys.exit(1)
+        _verify_pulled(missing)
         return
 
     # No auto-pull; fail with a helpful message.
@@ -16,14 +16,24 @@ class Settings(BaseSettings):
     api_key: str | None = None
     api_key_redis_url: str | None = None
     api_key_redis_set: str = "api_keys"
+    api_key_cache_ttl_seconds: int = 300  # 0 disables caching of Redis-validated keys
+    api_key_cache_max_entries: int = 4096
+    api_key_pepper: str | None = None  # HMAC key for cached key digests; random per process if unset
     session_redis_url: str | None = None
     session_ttl_seconds: int = 3600
+    redis_max_connections: int = 32  # per Redis URL; shared by sessions and the Open-Meteo cache
+    redis_pool_timeout_seconds: float = 5.0  # wait this long for a free pooled connection
     conditions_ttl_seconds: int = 900
+    conditions_fetch_cache_seconds: int = 60  # share upstream fetches for the same location/window; 0 disables
     ollama_base_url: str = "http://localhost:11434"
     ollama_model: str = "llama3.2:3b"
+    ollama_keep_alive: str | None = "30m"  # keep the model (and its prompt cache) resident between calls
+    ollama_warmup_enabled: bool = True
+    assessment_cache_size: int = 4096  # memoized single-hour assessments; 0 disables
     forecast_days: int = 7
     forecast_hours: int = 12
     max_user_message_chars: int = 4000
+    validate_response_conditions: bool = False  # re-validate serialized conditions (debugging aid)
     ollama_options: dict = Field(
         default_factory=lambda: {
             "temperature": float(os.getenv("AGENT_OLLAMA_TEMPERATURE", 0.2)),
@@ -0,0 +1,135 @@
+"""Redis-backed response cache for Open-Meteo fetches, with stale-on-error fallback."""
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import time
+from typing import Any, Callable, Dict, Mapping, Optional
+
+from app.config import settings
+from app.redis_pool import redis_client
+from utils.logging_utils import get_tagged_logger
+
+logger = get_tagged_logger(__name__, tag="meteo_cache")
+
+try:
+    import redis  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    redis = None
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+_dumps = orjson.dumps if orjson is not None else (lambda obj: json.dumps(obj).encode())
+_loads = orjson.loads if orjson is not None else json.loads
+
+KEY_PREFIX = "meteo:"
+COORD_DECIMALS = 2  # ~1 km; nearby callers share an entry
+MIN_FRESH_SECONDS = 60
+RESPONSE_TIME_FACTOR = 5
+# Entries outlive their freshness so an upstream outage can still be answered from Redis.
+STALE_RETENTION_SECONDS = 6 * 3600
+
+# Upper bound on freshness per policy; None means settings.conditions_ttl_seconds.
+POLICY_MAX_FRESH_SECONDS: Dict[str, Optional[int]] = {
+    "normal": None,
+    "current": 300,
+}
+# Open-Meteo publishes hourly data on the hour and current conditions every 15 minutes, so an
+# entry never stays fresh past the next such boundary (UTC epoch multiples).
+POLICY_UPDATE_INTERVAL_SECONDS: Dict[str, Optional[int]] = {
+    "normal": 3600,
+    "current": 900,
+}
+
+_redis_client = None
+if settings.session_redis_url and redis:
+    try:
+        _redis_client = redis_client(settings.session_redis_url)
+        logger.info("Open-Meteo responses will be cached in Redis", extra={"redis_url": settings.session_redis_url})
+    except Exception as exc:  # pragma: no cover - safety net
+        logger.warning("Failed to configure Redis for Open-Meteo caching; fetching uncached",
+                       extra={"error": str(exc)})
+
+
+def cache_key(url: str, params: Mapping[str, Any]) -> str:
+    """Build the cache key from the endpoint, rounded coordinates and remaining params."""
+    lat = round(float(params["latitude"]), COORD_DECIMALS)
+    lon = round(float(params["longitude"]), COORD_DECIMALS)
+    rest = sorted((k, str(v)) for k, v in params.items() if k not in ("latitude", "longitude"))
+    raw = f"{url}|{lat}|{lon}|{rest}"
+    return KEY_PREFIX + hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+
+def fresh_seconds(policy: str, response_seconds: float, now: Optional[float] = None) -> float:
+    """Return how long a response stays fresh, proportional to how slow it was to produce.
+
+    When `now` (epoch seconds) is given, freshness also ends at the policy's next upstream update.
+    """
+    cap = POLICY_MAX_FRESH_SECONDS.get(policy)
+    if cap is None:
+        cap = settings.conditions_ttl_seconds
+    if now is not None and (interval := POLICY_UPDATE_INTERVAL_SECONDS.get(policy)):
+        cap = min(cap, interval - now % interval)
+    return min(cap, max(response_seconds * RESPONSE_TIME_FACTOR, MIN_FRESH_SECONDS))
+
+
+def _read(client, key: str) -> Optional[Dict[bytes, bytes]]:
+    """Return the stored hash for key, or None if missing or Redis is unreachable."""
+    try:
+        entry = client.hgetall(key)
+    except Exception as exc:
+        logger.warning("Open-Meteo cache read failed", extra={"error": str(exc)})
+        return None
+    return entry or None
+
+
+def _write(client, key: str, body: bytes, generated_at: float, stale_at: float) -> None:
+    """Store a response body with its freshness timestamps; failures are logged and ignored."""
+    try:
+        pipe = client.pipeline()
+        pipe.hset(key, mapping={"generated_at": generated_at, "stale_at": stale_at, "body": body})
+        pipe.expire(key, int(stale_at - generated_at) + STALE_RETENTION_SECONDS)
+        pipe.execute()
+    except Exception as exc:
+        logger.warning("Open-Meteo cache write failed", extra={"error": str(exc)})
+
+
+def cached_meteo(policy: str = "normal") -> Callable:
+    """Cache a `(url, params) -> JSON dict` fetcher in Redis, serving stale entries on error."""
+
+    def decorator(fetch: Callable[[str, Mapping[str, Any]], Any]) -> Callable[[str, Mapping[str, Any]], Any]:
+        @functools.wraps(fetch)
+        def wrapper(url: str, params: Mapping[str, Any]) -> Any:
+            client = _redis_client
+            if client is None:
+                return fetch(url, params)
+
+            key = cache_key(url, params)
+            entry = _read(client, key)
+            now = time.time()
+            if entry is not None and float(entry[b"stale_at"]) > now:
+                return _loads(entry[b"body"])
+
+            started = time.perf_counter()
+            try:
+                data = fetch(url, params)
+            except Exception as exc:
+                if entry is None:
+                    raise
+                logger.warning(
+                    "Open-Meteo fetch failed; serving stale cached response",
+                    extra={"error": str(exc), "generated_at": float(entry[b"generated_at"])},
+                )
+                return _loads(entry[b"body"])
+
+            elapsed = time.perf_counter() - started
+            _write(client, key, _dumps(data), now, now + fresh_seconds(policy, elapsed, now))
+            return data
+
+        return wrapper
+
+    return decorator
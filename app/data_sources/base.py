@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Callable, List, Protocol
+from operator import attrgetter
+from typing import Callable, Protocol, Sequence
 
 from app.data_sources.open_meteo_client import AirHour, WeatherHour
 
@@ -45,7 +46,7 @@ class ForecastDataSource(Protocol):
         temperature_unit: str = "fahrenheit",
         wind_speed_unit: str = "mph",
         precipitation_unit: str = "mm",
-    ) -> List[WeatherHour]:
+    ) -> Sequence[WeatherHour]:
         """Return hourly weather observations."""
         ...
 
@@ -56,32 +57,24 @@ class ForecastDataSource(Protocol):
         *,
         timezone: str = "auto",
         forecast_days: int | None = None,
-    ) -> List[AirHour]:
+    ) -> Sequence[AirHour]:
         """Return hourly air-quality observations."""
         ...
 
 
 @dataclass
 class CallableForecastDataSource(ForecastDataSource):
-    """Wrap four callables so they can be swapped for different backends."""
+    """Wrap four callables so they can be swapped for different backends.
+
+    Each fetch_* attribute returns the wrapped callable itself, so calls skip a delegating frame.
+    """
 
     weather_current: Callable[..., WeatherHour]
     air_current: Callable[..., AirHour]
-    weather_hours: Callable[..., List[WeatherHour]]
-    air_hours: Callable[..., List[AirHour]]
-
-    def fetch_weather_current(self, *args, **kwargs) -> WeatherHour:
-        """Delegate to the configured current-weather callable."""
-        return self.weather_current(*args, **kwargs)
-
-    def fetch_air_current(self, *args, **kwargs) -> AirHour:
-        """Delegate to the configured current air-quality callable."""
-        return self.air_current(*args, **kwargs)
-
-    def fetch_weather_hours(self, *args, **kwargs) -> List[WeatherHour]:
-        """Delegate to the configured hourly-weather callable."""
-        return self.weather_hours(*args, **kwargs)
+    weather_hours: Callable[..., Sequence[WeatherHour]]
+    air_hours: Callable[..., Sequence[AirHour]]
 
-    def fetch_air_hours(self, *args, **kwargs) -> List[AirHour]:
-        """Delegate to the configured hourly air-quality callable."""
-        return self.air_hours(*args, **kwargs)
+    fetch_weather_current = property(attrgetter("weather_current"))
+    fetch_air_current = property(attrgetter("air_current"))
+    fetch_weather_hours = property(attrgetter("weather_hours"))
+    fetch_air_hours = property(attrgetter("air_hours"))
@@ -2,11 +2,17 @@
 from __future__ import annotations
 
 import datetime as dt
-from dataclasses import dataclass
-from typing import List, Optional
+import logging
+from collections.abc import Sequence
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from typing import Dict, List, Optional
 from zoneinfo import ZoneInfo
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+from app.data_sources._cache import cached_meteo
 from utils.logging_utils import get_tagged_logger
 logger = get_tagged_logger(__name__, tag='open_meteo_client')
 
@@ -19,11 +25,41 @@ except ImportError:
     requests_cache = None
     retry = None
 
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+# Fetches run concurrently from the API threadpool; requests' default pool keeps only
+# 10 sockets per host and discards the rest, forcing fresh TLS handshakes.
+HTTP_POOL_CONNECTIONS = 4
+HTTP_POOL_MAXSIZE = 32
+
+
+# Used when retry_requests is unavailable, so the plain session still rides out gateway blips.
+FALLBACK_RETRY = Retry(total=3, backoff_factor=0.2, status_forcelist=(502, 503, 504))
+
+
+def _pool_session(sess: requests.Session, max_retries: Retry | None = None) -> requests.Session:
+    """Remount the session's adapters with a larger keep-alive pool, preserving retries."""
+    for prefix in ("http://", "https://"):
+        current = sess.get_adapter(prefix)
+        sess.mount(
+            prefix,
+            HTTPAdapter(
+                max_retries=max_retries if max_retries is not None else getattr(current, "max_retries", 0),
+                pool_connections=HTTP_POOL_CONNECTIONS,
+                pool_maxsize=HTTP_POOL_MAXSIZE,
+            ),
+        )
+    return sess
+
+
 if requests_cache and retry:
     cache_session = requests_cache.CachedSession('.cache', expire_after=3600)
-    session = retry(cache_session, retries=5, backoff_factor=0.2)
+    session = _pool_session(retry(cache_session, retries=5, backoff_factor=0.2))
 else:
-    session = requests.Session()
+    session = _pool_session(requests.Session(), max_retries=FALLBACK_RETRY)
 
 OPEN_METEO_WEATHER_URL = "https://api.open-meteo.com/v1/forecast"
 OPEN_METEO_AIR_URL = "https://air-quality-api.open-meteo.com/v1/air-quality"
@@ -51,28 +87,53 @@ EXPECTED_AIR_UNITS = {
 
 # Acceptable alternative units that should not trigger warnings (API/localized differences).
 ALLOWED_WEATHER_UNIT_SYNONYMS = {
-    "temperature_2m": {"°C", "°F"},
-    "relative_humidity_2m": {"%", "percent"},
-    "apparent_temperature": {"°C", "°F"},
-    "precipitation_probability": {"%", "percent"},
-    "precipitation": {"mm", "inch"},
-    "cloud_cover": {"%", "percent"},
-    "wind_speed_10m": {"mph", "km/h"},
-    "wind_gusts_10m": {"mph", "km/h"},
-    "wind_direction_10m": {"°", "deg", "degrees"},
-    "dew_point_2m": {"°C", "°F"},
+    "temperature_2m": frozenset({"°C", "°F"}),
+    "relative_humidity_2m": frozenset({"%", "percent"}),
+    "apparent_temperature": frozenset({"°C", "°F"}),
+    "precipitation_probability": frozenset({"%", "percent"}),
+    "precipitation": frozenset({"mm", "inch"}),
+    "cloud_cover": frozenset({"%", "percent"}),
+    "wind_speed_10m": frozenset({"mph", "km/h"}),
+    "wind_gusts_10m": frozenset({"mph", "km/h"}),
+    "wind_direction_10m": frozenset({"°", "deg", "degrees"}),
+    "dew_point_2m": frozenset({"°C", "°F"}),
 }
 
 ALLOWED_AIR_UNIT_SYNONYMS = {
-    "pm2_5": {"µg/m³", "ug/m3"},
-    "pm10": {"µg/m³", "ug/m3"},
-    "us_aqi": {"USAQI", "aqi", "US AQI"},
-    "ozone": {"µg/m³", "ug/m3"},
-    "uv_index": {"", "index", "UV-index"},
+    "pm2_5": frozenset({"µg/m³", "ug/m3"}),
+    "pm10": frozenset({"µg/m³", "ug/m3"}),
+    "us_aqi": frozenset({"USAQI", "aqi", "US AQI"}),
+    "ozone": frozenset({"µg/m³", "ug/m3"}),
+    "uv_index": frozenset({"", "index", "UV-index"}),
 }
 
 
-@dataclass
+# Units dicts that already passed validation; Open-Meteo returns the same units on every
+# call, so the per-field scan normally runs once per process and distinct request shape.
+_VALIDATED_UNITS_MAX = 64
+_validated_weather_units: set = set()
+_validated_air_units: set = set()
+
+
+def _already_validated(units: dict, validated: set) -> tuple[bool, frozenset | None]:
+    """Return whether this exact units mapping passed before, plus its hashable key."""
+    try:
+        key = frozenset(units.items())
+    except TypeError:
+        return False, None
+    return key in validated, key
+
+
+def _remember_validated(key: frozenset | None, validated: set) -> None:
+    """Record a units mapping that produced no warnings."""
+    if key is None:
+        return
+    if len(validated) >= _VALIDATED_UNITS_MAX:
+        validated.clear()
+    validated.add(key)
+
+
+@dataclass(slots=True)
 class WeatherHour:
     """Normalized hourly weather reading returned by Open-Meteo."""
     time: dt.datetime  # timezone-aware
@@ -100,7 +161,7 @@ class WeatherHour:
     is_day: Optional[bool]
 
 
-@dataclass
+@dataclass(slots=True)
 class AirHour:
     """Normalized hourly air-quality reading returned by Open-Meteo."""
     time: dt.datetime  # timezone-aware
@@ -116,34 +177,116 @@ class AirHour:
     uv_index_unit: Optional[str]
 
 
+class _ConstantColumn:
+    """Column stand-in whose every index reads as the same value (units, absent variables)."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        """Store the value returned for every index."""
+        self.value = value
+
+    def __getitem__(self, index):
+        """Return the constant value for any index."""
+        return self.value
+
+
+_NONES = _ConstantColumn(None)
+
+
+class HourlySeries(Sequence):
+    """Hourly Open-Meteo rows kept column-wise; row objects are built only when indexed.
+
+    Callers usually keep a small window out of a multi-day forecast, so `times` is
+    exposed for filtering before any WeatherHour/AirHour is materialized.
+    """
+
+    def __init__(self, row_type: type, times: List[dt.datetime], columns: Dict[str, Sequence], units: Dict[str, Optional[str]]):
+        """Store parsed times, per-field value columns and the shared unit fields."""
+        self.row_type = row_type
+        self.times = times
+        # One indexable per dataclass field, in declaration order, so rows are built positionally.
+        sources = {"time": times, **columns, **{k: _ConstantColumn(v) for k, v in units.items()}}
+        self._layout = tuple(sources[f.name] for f in fields(row_type))
+
+    def __len__(self) -> int:
+        """Return the number of hours in the series."""
+        return len(self.times)
+
+    def __getitem__(self, index):
+        """Build the row object (or list of rows for a slice) at index."""
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        return self.row_type(*[column[index] for column in self._layout])
+
+
+@lru_cache(maxsize=64)
+def _zone(tz_name: str) -> ZoneInfo:
+    """Return the ZoneInfo for tz_name, skipping ZoneInfo's own cache lookup on repeat calls."""
+    return ZoneInfo(tz_name)
+
+
+def _parse_local_times(times: List[str], tz_name: str) -> List[dt.datetime]:
+    """Interpret a column of Open-Meteo local time strings as being in tz_name."""
+    tz = _zone(tz_name)
+    return [dt.datetime.fromisoformat(t).replace(tzinfo=tz) for t in times]
+
+
+def _get_json(url: str, params: dict) -> dict:
+    """GET an Open-Meteo endpoint and return the decoded JSON body."""
+    resp = session.get(url, params=params, timeout=10)
+    resp.raise_for_status()
+    if orjson is not None:
+        return orjson.loads(resp.content)
+    return resp.json()
+
+
+# Current readings go stale faster than the hourly forecast, so they get a shorter cap.
+_get_hourly_json = cached_meteo(policy="normal")(_get_json)
+_get_current_json = cached_meteo(policy="current")(_get_json)
+
+
 def _iso_to_dt_with_tz(s: str, tz_name: str) -> dt.datetime:
     """Interpret Open-Meteo local time string as being in tz_name."""
     naive = dt.datetime.fromisoformat(s)
     # Treat the given timestamp as local time in tz_name
-    return naive.replace(tzinfo=ZoneInfo(tz_name))
+    return naive.replace(tzinfo=_zone(tz_name))
 
 
 def _warn_on_unexpected_units(units: dict, *, context: str):
     """Log a warning if Open-Meteo returns units we did not request/expect."""
-    if not units:
+    if not units or not logger.isEnabledFor(logging.WARNING):
         return
+    seen, key = _already_validated(units, _validated_weather_units)
+    if seen:
+        return
+    clean = True
     for field, expected in EXPECTED_WEATHER_UNITS.items():
         if field not in units:
             continue
         actual = units.get(field)
         if actual and actual != expected:
-            allowed = ALLOWED_WEATHER_UNIT_SYNONYMS.get(field, set())
+            allowed = ALLOWED_WEATHER_UNIT_SYNONYMS.get(field, frozenset())
             if actual not in allowed:
+                clean = False
                 logger.warning(
                     "Unexpected Open-Meteo unit",
                     extra={"context": context, "field": field, "unit": actual, "expected": expected, "allowed": sorted(allowed)},
                 )
+    if clean:
+        _remember_validated(key, _validated_weather_units)
 
 
 def _warn_on_unexpected_air_units(units: dict, *, context: str):
     """Log a warning if Open-Meteo returns unexpected air-quality units."""
-    if not units:
+    if not units or not logger.isEnabledFor(logging.WARNING):
+        return
+    seen, key = _already_validated(units, _validated_air_units)
+    if seen:
         return
+    clean = True
     for field, expected in EXPECTED_AIR_UNITS.items():
         if field not in units:
             continue
@@ -153,12 +296,15 @@ def _warn_on_unexpected_air_units(units: dict, *, context: str):
         if expected == "" and actual == "":
             continue
         if actual != expected:
-            allowed = ALLOWED_AIR_UNIT_SYNONYMS.get(field, set())
+            allowed = ALLOWED_AIR_UNIT_SYNONYMS.get(field, frozenset())
             if actual not in allowed:
+                clean = False
                 logger.warning(
                     "Unexpected Open-Meteo air unit",
                     extra={"context": context, "field": field, "unit": actual, "expected": expected, "allowed": sorted(allowed)},
                 )
+    if clean:
+        _remember_validated(key, _validated_air_units)
 
 
 def fetch_weather_current(latitude: float,
@@ -183,9 +329,7 @@ def fetch_weather_current(latitude: float,
         "precipitation_unit": precipitation_unit,
     }
 
-    resp = session.get(OPEN_METEO_WEATHER_URL, params=params, timeout=10)
-    resp.raise_for_status()
-    data = resp.json()
+    data = _get_current_json(OPEN_METEO_WEATHER_URL, params)
 
     current = data["current"]
     current_units = data["current_units"]
@@ -251,7 +395,7 @@ def fetch_weather_hours(
     temperature_unit: str = "fahrenheit",
     wind_speed_unit: str = "mph",
     precipitation_unit: str = "mm",
-) -> List[WeatherHour]:
+) -> HourlySeries:
     """Fetch up to `forecast_days` of hourly weather and return as structured objects."""
     hourly_vars = [
         "temperature_2m",
@@ -278,66 +422,42 @@ def fetch_weather_hours(
         "precipitation_unit": precipitation_unit,
     }
 
-    resp = session.get(OPEN_METEO_WEATHER_URL, params=params, timeout=10)
-    resp.raise_for_status()
-    data = resp.json()
+    data = _get_hourly_json(OPEN_METEO_WEATHER_URL, params)
 
     hourly = data["hourly"]
     hourly_units = data["hourly_units"]
     _warn_on_unexpected_units(hourly_units, context="weather_hourly")
     times = hourly["time"]
-    temp = hourly["temperature_2m"]
-    temp_unit = hourly_units["temperature_2m"]
-    rel_humidity = hourly.get("relative_humidity_2m", [None] * len(times))
-    rel_humidity_unit = hourly_units.get("relative_humidity_2m", None)
-    dew_point = hourly.get("dew_point_2m", [None] * len(times))
-    dew_point_unit = hourly_units.get("dew_point_2m", None)
-    apparent = hourly.get("apparent_temperature", [None] * len(times))
-    apparent_unit = hourly_units.get("apparent_temperature", None)
-    precip_prob = hourly.get("precipitation_probability", [None] * len(times))
-    precip_prob_unit = hourly_units.get("precipitation_probability", None)
-    precip = hourly.get("precipitation", [None] * len(times))
-    precip_unit = hourly_units.get("precipitation", None)
-    cloud = hourly.get("cloud_cover", [None] * len(times))
-    cloud_unit = hourly_units.get("cloud_cover", None)
-    wind_speed = hourly.get("wind_speed_10m", [None] * len(times))
-    wind_speed_unit = hourly_units.get("wind_speed_10m", None)
-    wind_gusts = hourly.get("wind_gusts_10m", [None] * len(times))
-    wind_gusts_unit = hourly_units.get("wind_gusts_10m", None)
-    wind_dir = hourly.get("wind_direction_10m", [None] * len(times))
-    wind_dir_unit = hourly_units.get("wind_direction_10m", None)
-    is_day = hourly.get("is_day", [None] * len(times))
-
-    out: List[WeatherHour] = []
-    for i, t in enumerate(times):
-        out.append(
-            WeatherHour(
-                time=_iso_to_dt_with_tz(t, timezone),
-                hour_index=i,
-                temperature=temp[i],
-                temperature_unit=temp_unit,
-                rel_humidity=rel_humidity[i],
-                rel_humidity_unit=rel_humidity_unit,
-                dew_point=dew_point[i],
-                dew_point_unit=dew_point_unit,
-                apparent_temperature=apparent[i],
-                apparent_temperature_unit=apparent_unit,
-                precipitation_prob=precip_prob[i],
-                precipitation_prob_unit=precip_prob_unit,
-                precipitation=precip[i],
-                precipitation_unit=precip_unit,
-                cloud_cover=cloud[i],
-                cloud_cover_unit=cloud_unit,
-                wind_speed=wind_speed[i],
-                wind_speed_unit=wind_speed_unit,
-                wind_gusts=wind_gusts[i],
-                wind_gusts_unit=wind_gusts_unit,
-                wind_direction=wind_dir[i],
-                wind_direction_unit=wind_dir_unit,
-                is_day=is_day[i],
-            )
-        )
-    return out
+    return HourlySeries(
+        WeatherHour,
+        _parse_local_times(times, timezone),
+        {
+            "hour_index": range(len(times)),
+            "temperature": hourly["temperature_2m"],
+            "rel_humidity": hourly.get("relative_humidity_2m") or _NONES,
+            "dew_point": hourly.get("dew_point_2m") or _NONES,
+            "apparent_temperature": hourly.get("apparent_temperature") or _NONES,
+            "precipitation_prob": hourly.get("precipitation_probability") or _NONES,
+            "precipitation": hourly.get("precipitation") or _NONES,
+            "cloud_cover": hourly.get("cloud_cover") or _NONES,
+            "wind_speed": hourly.get("wind_speed_10m") or _NONES,
+            "wind_gusts": hourly.get("wind_gusts_10m") or _NONES,
+            "wind_direction": hourly.get("wind_direction_10m") or _NONES,
+            "is_day": hourly.get("is_day") or _NONES,
+        },
+        {
+            "temperature_unit": hourly_units["temperature_2m"],
+            "rel_humidity_unit": hourly_units.get("relative_humidity_2m", None),
+            "dew_point_unit": hourly_units.get("dew_point_2m", None),
+            "apparent_temperature_unit": hourly_units.get("apparent_temperature", None),
+            "precipitation_prob_unit": hourly_units.get("precipitation_probability", None),
+            "precipitation_unit": hourly_units.get("precipitation", None),
+            "cloud_cover_unit": hourly_units.get("cloud_cover", None),
+            "wind_speed_unit": hourly_units.get("wind_speed_10m", None),
+            "wind_gusts_unit": hourly_units.get("wind_gusts_10m", None),
+            "wind_direction_unit": hourly_units.get("wind_direction_10m", None),
+        },
+    )
 
 
 def fetch_air_current(
@@ -364,9 +484,7 @@ def fetch_air_current(
         "timezone": timezone,
     }
 
-    resp = session.get(OPEN_METEO_AIR_URL, params=params, timeout=10)
-    resp.raise_for_status()
-    data = resp.json()
+    data = _get_current_json(OPEN_METEO_AIR_URL, params)
 
     current = data["current"]
     current_units = data["current_units"]
@@ -406,7 +524,7 @@ def fetch_air_hours(
     *,
     timezone: str = "America/Chicago",
     forecast_days: int = 5,
-) -> List[AirHour]:
+) -> HourlySeries:
     """Fetch up to 5 days of hourly air quality forecast."""
     hourly_vars = [
         "pm2_5",
@@ -424,40 +542,27 @@ def fetch_air_hours(
         "timezone": timezone,
     }
 
-    resp = session.get(OPEN_METEO_AIR_URL, params=params, timeout=10)
-    resp.raise_for_status()
-    data = resp.json()
+    data = _get_hourly_json(OPEN_METEO_AIR_URL, params)
 
     hourly = data["hourly"]
     hourly_units = data["hourly_units"]
     _warn_on_unexpected_air_units(hourly_units, context="air_hourly")
     times = hourly["time"]
-    pm25 = hourly.get("pm2_5", [None] * len(times))
-    pm25_unit = hourly_units.get("pm2_5", None)
-    pm10 = hourly.get("pm10", [None] * len(times))
-    pm10_unit = hourly_units.get("pm10", None)
-    ozone = hourly.get("ozone", [None] * len(times))
-    ozone_unit = hourly_units.get("ozone", None)
-    uv = hourly.get("uv_index", [None] * len(times))
-    uv_unit = hourly_units.get("uv_index", None)
-    us_aqi = hourly.get("us_aqi", [None] * len(times))
-    us_aqi_unit = hourly_units.get("us_aqi", None)
-
-    out: List[AirHour] = []
-    for i, t in enumerate(times):
-        out.append(
-            AirHour(
-                time=_iso_to_dt_with_tz(t, timezone),
-                pm2_5=pm25[i],
-                pm2_5_unit=pm25_unit,
-                pm10=pm10[i],
-                pm10_unit=pm10_unit,
-                ozone=ozone[i],
-                ozone_unit=ozone_unit,
-                uv_index=uv[i],
-                uv_index_unit=uv_unit,
-                us_aqi=us_aqi[i],
-                us_aqi_unit=us_aqi_unit,
-            )
-        )
-    return out
+    return HourlySeries(
+        AirHour,
+        _parse_local_times(times, timezone),
+        {
+            "pm2_5": hourly.get("pm2_5") or _NONES,
+            "pm10": hourly.get("pm10") or _NONES,
+            "ozone": hourly.get("ozone") or _NONES,
+            "uv_index": hourly.get("uv_index") or _NONES,
+            "us_aqi": hourly.get("us_aqi") or _NONES,
+        },
+        {
+            "pm2_5_unit": hourly_units.get("pm2_5", None),
+            "pm10_unit": hourly_units.get("pm10", None),
+            "ozone_unit": hourly_units.get("ozone", None),
+            "uv_index_unit": hourly_units.get("uv_index", None),
+            "us_aqi_unit": hourly_units.get("us_aqi", None),
+        },
+    )
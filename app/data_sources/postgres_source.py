@@ -4,23 +4,404 @@ Defaults now point at the `stg.open_meteo_weather` and `stg.open_meteo_air`
 tables produced by the event-driven-open-weather-insight project. Column names
 may follow either our earlier normalized schema (e.g., temperature) or
 Open-Meteo's raw naming (e.g., temperature_2m); both are supported.
+
+Every query filters on (latitude, longitude) and orders by open_meteo_start_time,
+so the tables should carry the index from `recommended_index_ddl()`.
 """
 
 from __future__ import annotations
 
 import datetime as dt
-from typing import List, Mapping
+import threading
+import time
+from functools import lru_cache
+from operator import itemgetter
+from typing import Any, Callable, Dict, Iterator, List, Mapping, NamedTuple, Optional, Sequence, Tuple
 from zoneinfo import ZoneInfo
 
-from sqlalchemy import create_engine, text
+from sqlalchemy import TextClause, bindparam, create_engine, text
 from sqlalchemy.engine import Engine
 
-from app.data_sources.base import ForecastDataSource
+from app.data_sources.base import CallableForecastDataSource, ForecastDataSource
 from app.data_sources.open_meteo_client import AirHour, WeatherHour
 from utils.logging_utils import get_tagged_logger
 
 logger = get_tagged_logger(__name__, tag="postgres_data_source")
 
+DEFAULT_TIMEZONE = "UTC"
+FETCH_BATCH_ROWS = 500  # rows per server-side cursor fetch (yield_per implies stream_results)
+# Hourly queries also select the start time as UTC epoch seconds, which EXTRACT computes with the same
+# naive-means-UTC rule as `_localize`, so rows only need a single fromtimestamp() in the target zone.
+START_EPOCH_SQL = "CAST(EXTRACT(EPOCH FROM open_meteo_start_time) AS DOUBLE PRECISION) AS open_meteo_start_epoch"
+CURRENT_CACHE_SECONDS = 60.0  # reuse a location's latest row this long; 0 disables
+CURRENT_CACHE_MAX_ENTRIES = 1024
+
+
+@lru_cache(maxsize=64)
+def _zoneinfo_for(name: str) -> ZoneInfo:
+    """Return the ZoneInfo for name, or UTC if it is not a valid zone (warned once per name)."""
+    try:
+        return ZoneInfo(name)
+    except Exception:
+        logger.warning("Invalid timezone; falling back to UTC", extra={"tz_name": name})
+        return ZoneInfo(DEFAULT_TIMEZONE)
+
+
+Converter = Callable[[Optional[float], Optional[str]], Tuple[Optional[float], Optional[str]]]
+
+_FAHRENHEIT = frozenset({"fahrenheit", "f", "°f"})
+_CELSIUS = frozenset({"celsius", "c", "°c"})
+_MPH = frozenset({"mph", "mi/h"})
+_KMH = frozenset({"km/h", "kph"})
+_MPS = frozenset({"m/s", "ms^-1", "mps"})
+_INCH = frozenset({"inch", "in"})
+_MM = frozenset({"mm", "millimeter", "millimetre"})
+
+# Per target family: (target aliases, output label, ((source matcher, conversion, SQL conversion), ...)).
+# Source matchers are ("prefix", text) or ("in", aliases) over the lower-cased stored unit; the
+# Python and SQL conversions must apply the same floating-point operations in the same order.
+_TEMPERATURE_UNITS = (
+    (_FAHRENHEIT, "°F", ((("prefix", "c"), lambda v: (v * 9 / 5) + 32, "(({v} * 9) / 5) + 32"),)),
+    (_CELSIUS, "°C", ((("prefix", "f"), lambda v: (v - 32) * 5 / 9, "(({v} - 32) * 5) / 9"),)),
+)
+_WIND_SPEED_UNITS = (
+    (_MPH, "mph", (
+        (("in", _KMH), lambda v: v * 0.621371, "{v} * 0.621371"),
+        (("in", _MPS), lambda v: v * 2.23694, "{v} * 2.23694"),
+    )),
+    (_KMH, "km/h", (
+        (("in", _MPH), lambda v: v / 0.621371, "{v} / 0.621371"),
+        (("in", _MPS), lambda v: v * 3.6, "{v} * 3.6"),
+    )),
+    (_MPS, "m/s", (
+        (("in", _MPH), lambda v: v / 2.23694, "{v} / 2.23694"),
+        (("in", _KMH), lambda v: v / 3.6, "{v} / 3.6"),
+    )),
+)
+_PRECIPITATION_UNITS = (
+    (_INCH, "inch", ((("in", _MM), lambda v: v / 25.4, "{v} / 25.4"),)),
+    (_MM, "mm", ((("in", _INCH), lambda v: v * 25.4, "{v} * 25.4"),)),
+)
+_UNIT_FAMILIES = {
+    "temperature": _TEMPERATURE_UNITS,
+    "wind_speed": _WIND_SPEED_UNITS,
+    "precipitation": _PRECIPITATION_UNITS,
+}
+
+
+def _python_matcher(spec: Tuple[str, Any]) -> Callable[[str], bool]:
+    """Compile a source-unit matcher spec into a predicate over the lower-cased unit."""
+    kind, arg = spec
+    if kind == "prefix":
+        return lambda src: src.startswith(arg)
+    return arg.__contains__
+
+
+def _build_converter(target_unit: str | None, families) -> Converter:
+    """Specialize a `(value, unit) -> (value, unit)` converter for one target unit."""
+    target = (target_unit or "").lower()
+    for aliases, label, conversions in families:
+        if target in aliases:
+            compiled = tuple((_python_matcher(spec), fn) for spec, fn, _ in conversions)
+
+            def convert(value, unit, label=label, conversions=compiled):
+                """Convert value from unit into the pre-selected target unit."""
+                if value is None:
+                    return None, label
+                src = (unit or "").lower()
+                for matches, fn in conversions:
+                    if matches(src):
+                        return fn(value), label
+                return value, unit or label
+
+            return convert
+
+    def passthrough(value, unit):
+        """Leave values in an unknown target unit untouched."""
+        if value is None:
+            return None, target_unit or unit
+        return value, unit
+
+    return passthrough
+
+
+def _sql_literal(value: str) -> str:
+    """Quote a constant string for inclusion in generated SQL."""
+    return "'" + value.replace("'", "''") + "'"
+
+
+def _sql_matcher(spec: Tuple[str, Any], src_sql: str) -> str:
+    """Render a source-unit matcher spec as a SQL predicate over src_sql."""
+    kind, arg = spec
+    if kind == "prefix":
+        return f"{src_sql} LIKE {_sql_literal(arg + '%')}"
+    return f"{src_sql} IN ({', '.join(_sql_literal(a) for a in sorted(arg))})"
+
+
+@lru_cache(maxsize=64)
+def _sql_converted(value_col: str, unit_col: str, target_unit: str | None, kind: str) -> Tuple[str, str]:
+    """Return (value expression, unit expression) computing a converter's result in SQL."""
+    target = (target_unit or "").lower()
+    for aliases, label, conversions in _UNIT_FAMILIES[kind]:
+        if target in aliases:
+            src = f"lower(COALESCE({unit_col}, ''))"
+            as_double = f"CAST({value_col} AS DOUBLE PRECISION)"
+            matchers = [_sql_matcher(spec, src) for spec, _, _ in conversions]
+            value_sql = "CASE {} ELSE {} END".format(
+                " ".join(f"WHEN {m} THEN {sql.format(v=as_double)}" for m, (_, _, sql) in zip(matchers, conversions)),
+                value_col,
+            )
+            unit_sql = "CASE WHEN {} IS NULL OR {} THEN {} ELSE COALESCE(NULLIF({}, ''), {}) END".format(
+                value_col, " OR ".join(matchers), _sql_literal(label), unit_col, _sql_literal(label)
+            )
+            return value_sql, unit_sql
+    if target_unit:
+        return value_col, f"CASE WHEN {value_col} IS NULL THEN {_sql_literal(target_unit)} ELSE {unit_col} END"
+    return value_col, unit_col
+
+
+# Only columns a row mapper reads; ids, end times and the (already filtered) coordinates stay server-side.
+_WEATHER_SELECT_COLUMNS = (
+    "open_meteo_start_time",
+    "temperature", "temperature_unit", "rel_humidity", "rel_humidity_unit", "dew_point", "dew_point_unit",
+    "apparent_temperature", "apparent_temperature_unit", "precipitation_prob", "precipitation_prob_unit",
+    "precipitation", "precipitation_unit", "cloud_cover", "cloud_cover_unit", "wind_speed", "wind_speed_unit",
+    "wind_gusts", "wind_gusts_unit", "wind_direction", "wind_direction_unit", "is_day",
+)
+# (value column, unit column, unit family) converted server-side for weather queries.
+_SQL_CONVERTED_COLUMNS = (
+    ("temperature", "temperature_unit", "temperature"),
+    ("dew_point", "dew_point_unit", "temperature"),
+    ("apparent_temperature", "apparent_temperature_unit", "temperature"),
+    ("wind_speed", "wind_speed_unit", "wind_speed"),
+    ("wind_gusts", "wind_gusts_unit", "wind_speed"),
+    ("precipitation", "precipitation_unit", "precipitation"),
+)
+
+
+@lru_cache(maxsize=16)
+def _weather_select_list(
+    temperature_unit: str | None,
+    wind_speed_unit: str | None,
+    precipitation_unit: str | None,
+    fields: frozenset[str] | None = None,
+) -> str:
+    """Build the weather SELECT list with values and units already converted to the targets.
+
+    `fields` narrows the list to those columns plus the start time; converted values keep their unit
+    column so labels stay correct, and unselected values map to None.
+    """
+    columns = _WEATHER_SELECT_COLUMNS
+    if fields is not None:
+        wanted = {"open_meteo_start_time", *fields}
+        wanted.update(unit for value, unit, _ in _SQL_CONVERTED_COLUMNS if value in fields)
+        columns = tuple(col for col in columns if col in wanted)
+    targets = {"temperature": temperature_unit, "wind_speed": wind_speed_unit, "precipitation": precipitation_unit}
+    expressions = {}
+    for value_col, unit_col, kind in _SQL_CONVERTED_COLUMNS:
+        value_sql, unit_sql = _sql_converted(value_col, unit_col, targets[kind], kind)
+        expressions[value_col] = f"{value_sql} AS {value_col}"
+        expressions[unit_col] = f"{unit_sql} AS {unit_col}"
+    return ",\n                   ".join(expressions.get(col, col) for col in columns)
+
+
+# The table is owned by the warehouse, so the index is created there rather than migrated from here.
+# Not partial: index predicates must be immutable, which rules out a rolling now()-based window.
+INDEX_DDL = (
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+    "ON {table} (latitude, longitude, open_meteo_start_time DESC)"
+)
+
+_AIR_SELECT_LIST = ",\n                   ".join((
+    "open_meteo_start_time", "pm2_5", "pm2_5_unit", "pm10", "pm10_unit", "us_aqi", "us_aqi_unit", "ozone", "ozone_unit",
+    "uv_index", "uv_index_unit",
+))
+
+
+@lru_cache(maxsize=32)
+def _current_query(table: str, select_list: str) -> TextClause:
+    """Build (once per table and select list) the latest-row query for a location."""
+    return text(
+        f"""
+            SELECT {select_list}
+              FROM {table}
+             WHERE latitude = :lat AND longitude = :lon
+             ORDER BY open_meteo_start_time DESC
+             LIMIT 1
+            """
+    )
+
+
+@lru_cache(maxsize=32)
+def _hourly_query(table: str, select_list: str) -> TextClause:
+    """Build (once per table and select list) the forecast-window query for a location."""
+    return text(
+        f"""
+            SELECT {select_list},
+                   {START_EPOCH_SQL}
+              FROM {table}
+             WHERE latitude = :lat AND longitude = :lon
+               AND open_meteo_start_time >= timezone(:tz, now())
+               AND open_meteo_start_time < timezone(:tz, now()) + make_interval(days => :days)
+             ORDER BY open_meteo_start_time
+            """
+    )
+
+
+@lru_cache(maxsize=32)
+def _hourly_batch_query(table: str, select_list: str) -> TextClause:
+    """Build (once per table and select list) the forecast-window query for several locations."""
+    return text(
+        f"""
+            SELECT {select_list},
+                   latitude,
+                   longitude,
+                   {START_EPOCH_SQL}
+              FROM {table}
+             WHERE (latitude, longitude) IN :points
+               AND open_meteo_start_time >= timezone(:tz, now())
+               AND open_meteo_start_time < timezone(:tz, now()) + make_interval(days => :days)
+             ORDER BY latitude, longitude, open_meteo_start_time
+            """
+    ).bindparams(bindparam("points", expanding=True))
+
+
+def _unchanged(value, unit):
+    """Converter for values the query already converted."""
+    return value, unit
+
+
+_PRECONVERTED = (_unchanged, _unchanged, _unchanged)
+
+
+@lru_cache(maxsize=16)
+def _temperature_converter(target_unit: str | None) -> Converter:
+    """Return the cached temperature converter for target_unit."""
+    return _build_converter(target_unit, _TEMPERATURE_UNITS)
+
+
+@lru_cache(maxsize=16)
+def _wind_speed_converter(target_unit: str | None) -> Converter:
+    """Return the cached wind-speed converter for target_unit."""
+    return _build_converter(target_unit, _WIND_SPEED_UNITS)
+
+
+@lru_cache(maxsize=16)
+def _precipitation_converter(target_unit: str | None) -> Converter:
+    """Return the cached precipitation converter for target_unit."""
+    return _build_converter(target_unit, _PRECIPITATION_UNITS)
+
+
+# Candidate column names per output value, in the order the row mappers unpack them. Both
+# our normalized schema and Open-Meteo's raw names are accepted; the first non-null wins.
+_WEATHER_COLUMNS = (
+    ("temperature", "temperature_2m"),
+    ("temperature_unit", "temperature_2m_unit"),
+    ("dew_point", "dew_point_2m"),
+    ("dew_point_unit", "dew_point_2m_unit"),
+    ("apparent_temperature",),
+    ("apparent_temperature_unit",),
+    ("wind_speed", "wind_speed_10m"),
+    ("wind_speed_unit", "wind_speed_10m_unit"),
+    ("wind_gusts", "wind_gusts_10m"),
+    ("wind_gusts_unit", "wind_gusts_10m_unit"),
+    ("precipitation",),
+    ("precipitation_unit",),
+    ("relative_humidity", "relative_humidity_2m"),
+    ("relative_humidity_unit", "relative_humidity_2m_unit"),
+    ("precipitation_prob", "precipitation_probability"),
+    ("precipitation_prob_unit", "precipitation_probability_unit"),
+    ("cloud_cover",),
+    ("cloud_cover_unit",),
+    ("wind_direction", "wind_direction_10m"),
+    ("wind_direction_unit", "wind_direction_10m_unit"),
+    ("is_day",),
+)
+# Same order as the AirHour fields after `time`.
+_AIR_COLUMNS = tuple(
+    (name,)
+    for name in (
+        "pm2_5", "pm2_5_unit", "pm10", "pm10_unit", "us_aqi", "us_aqi_unit",
+        "ozone", "ozone_unit", "uv_index", "uv_index_unit",
+    )
+)
+_COLUMN_SPECS = {"weather": _WEATHER_COLUMNS, "air": _AIR_COLUMNS}
+
+
+class _RowLayout(NamedTuple):
+    """Per-result accessors: start time, optional hour_index, then one getter per spec entry."""
+
+    start_time: Callable
+    hour_index: Callable | None
+    values: Tuple[Callable, ...]
+    start_is_epoch: bool = False
+
+
+def _always_none(row) -> None:
+    """Getter for a value none of whose candidate columns were selected."""
+    return None
+
+
+def _first_non_null(getters: Tuple[Callable, ...]) -> Callable:
+    """Return a getter yielding the first non-null value among several candidate columns."""
+
+    def get(row):
+        """Read the candidates in order and return the first non-null one."""
+        for candidate in getters:
+            value = candidate(row)
+            if value is not None:
+                return value
+        return None
+
+    return get
+
+
+def _missing_start_time(row):
+    """Mirror mapping access for results lacking the required start-time column."""
+    raise KeyError("open_meteo_start_time")
+
+
+@lru_cache(maxsize=32)
+def _row_layout(keys: Tuple[str, ...], kind: str, positional: bool) -> _RowLayout:
+    """Resolve column positions (or names, for Mapping rows) once per result shape."""
+    slots = {key: (i if positional else key) for i, key in enumerate(keys)}
+
+    def getter(*candidates: str) -> Callable:
+        """Build the accessor for one value from the candidate columns actually selected."""
+        present = [itemgetter(slots[name]) for name in candidates if name in slots]
+        if not present:
+            return _always_none
+        return present[0] if len(present) == 1 else _first_non_null(tuple(present))
+
+    if "open_meteo_start_epoch" in slots:
+        start_time, start_is_epoch = itemgetter(slots["open_meteo_start_epoch"]), True
+    elif "open_meteo_start_time" in slots:
+        start_time, start_is_epoch = getter("open_meteo_start_time"), False
+    else:
+        start_time, start_is_epoch = _missing_start_time, False
+    return _RowLayout(
+        start_time=start_time,
+        hour_index=itemgetter(slots["hour_index"]) if "hour_index" in slots else None,
+        values=tuple(getter(*candidates) for candidates in _COLUMN_SPECS[kind]),
+        start_is_epoch=start_is_epoch,
+    )
+
+
+def _mapping_layout(row: Mapping, kind: str) -> _RowLayout:
+    """Layout for reading a Mapping row by column name."""
+    return _row_layout(tuple(row.keys()), kind, False)
+
+
+def _weather_converters(
+    temperature_unit: str | None, wind_speed_unit: str | None, precipitation_unit: str | None
+) -> Tuple[Converter, Converter, Converter]:
+    """Resolve the three weather converters for a request's target units."""
+    return (
+        _temperature_converter(temperature_unit),
+        _wind_speed_converter(wind_speed_unit),
+        _precipitation_converter(precipitation_unit),
+    )
+
 
 class PostgresForecastDataSource(ForecastDataSource):
     """Fetch forecasts from Postgres instead of Open-Meteo."""
@@ -35,6 +416,7 @@ class PostgresForecastDataSource(ForecastDataSource):
         forecast_weather_table: str = "mart.fct_open_meteo_latest_weather_air_forecast",
         current_air_table: str = "mart.fct_open_meteo_current_weather_air_conditions",
         forecast_air_table: str = "mart.fct_open_meteo_latest_weather_air_forecast",
+        current_cache_seconds: float = CURRENT_CACHE_SECONDS,
     ) -> None:
         """Bind to a database engine and optionally override source tables."""
         self.engine = engine
@@ -42,6 +424,47 @@ class PostgresForecastDataSource(ForecastDataSource):
         self.current_air_table = current_air_table
         self.forecast_weather_table = forecast_weather_table
         self.forecast_air_table = forecast_air_table
+        # Current conditions are polled far more often than the warehouse refreshes them; entries
+        # are (expires_at, row) and lookup failures are never cached.
+        self.current_cache_seconds = current_cache_seconds
+        self._current_cache: dict[tuple, tuple[float, Any]] = {}
+        self._current_cache_lock = threading.Lock()
+
+    def cache_clear(self) -> None:
+        """Forget memoized current-conditions rows."""
+        with self._current_cache_lock:
+            self._current_cache.clear()
+
+    def _cached_current(self, key: tuple, fetch: Callable[[], Any]) -> Any:
+        """Return the memoized row for key while fresh, otherwise fetch and remember it."""
+        ttl = self.current_cache_seconds
+        if ttl <= 0:
+            return fetch()
+        with self._current_cache_lock:
+            hit = self._current_cache.get(key)
+        if hit is not None and hit[0] > time.monotonic():
+            return hit[1]
+        row = fetch()
+        now = time.monotonic()
+        with self._current_cache_lock:
+            cache = self._current_cache
+            if len(cache) >= CURRENT_CACHE_MAX_ENTRIES:
+                for stale in [k for k, (expires_at, _row) in cache.items() if expires_at <= now]:
+                    del cache[stale]
+                while len(cache) >= CURRENT_CACHE_MAX_ENTRIES:
+                    cache.pop(next(iter(cache)))
+            cache[key] = (now + ttl, row)
+        return row
+
+    def recommended_index_ddl(self) -> List[str]:
+        """Return the CREATE INDEX statements serving this source's lookups, one per distinct table."""
+        tables = dict.fromkeys((
+            self.current_weather_table, self.current_air_table, self.forecast_weather_table, self.forecast_air_table,
+        ))
+        return [
+            INDEX_DDL.format(name=f"ix_{table.rsplit('.', 1)[-1]}_lat_lon_time", table=table)
+            for table in tables
+        ]
 
     @classmethod
     def from_url(cls, database_url: str, **kwargs) -> "PostgresForecastDataSource":
@@ -49,6 +472,15 @@ class PostgresForecastDataSource(ForecastDataSource):
         engine = create_engine(database_url, future=True)
         return cls(engine, **kwargs)
 
+    def as_callable(self) -> CallableForecastDataSource:
+        """Expose this source's bound fetch methods as a CallableForecastDataSource."""
+        return CallableForecastDataSource(
+            self.fetch_weather_current,
+            self.fetch_air_current,
+            self.fetch_weather_hours,
+            self.fetch_air_hours,
+        )
+
     @classmethod
     def _resolve_timezone(cls, tz_name: str | None) -> str:
         """Resolve sentinel/default timezone names to a real tz."""
@@ -59,195 +491,112 @@ class PostgresForecastDataSource(ForecastDataSource):
     @classmethod
     def _normalize_timezone(cls, tz_name: str | None) -> str:
         """Return a timezone name valid for both SQL and Python, falling back to UTC."""
-        resolved = cls._resolve_timezone(tz_name)
-        try:
-            ZoneInfo(resolved)
-            return resolved
-        except Exception:
-            logger.warning("Invalid timezone; falling back to UTC", extra={"tz_name": tz_name})
-            return cls.DEFAULT_TIMEZONE
+        return _zoneinfo_for(cls._resolve_timezone(tz_name)).key
 
     @classmethod
-    def _localize(cls, ts: dt.datetime, tz_name: str) -> dt.datetime:
-        """Return a timezone-aware timestamp, falling back to UTC on errors."""
-        resolved_tz = cls._normalize_timezone(tz_name)
-        tzinfo = ZoneInfo(resolved_tz)
+    def _localize(cls, ts: dt.datetime, tz: dt.tzinfo | str) -> dt.datetime:
+        """Return a timezone-aware timestamp in tz (a resolved tzinfo, or a name to resolve)."""
+        tzinfo = _zoneinfo_for(cls._resolve_timezone(tz)) if isinstance(tz, str) else tz
         if ts.tzinfo is None:
             ts = ts.replace(tzinfo=dt.timezone.utc)
         return ts.astimezone(tzinfo)
 
-    @staticmethod
-    def _get_value(row: Mapping, *keys):
-        """Return the first non-null value for the provided keys."""
-        for key in keys:
-            if key in row and row[key] is not None:
-                return row[key]
-        return None
+    @classmethod
+    def _start_time(cls, layout: _RowLayout, row: Sequence | Mapping, tz: dt.tzinfo | str) -> dt.datetime:
+        """Return a row's start time in tz, reading the UTC epoch column when the query selected it."""
+        if layout.start_is_epoch:
+            tzinfo = _zoneinfo_for(cls._resolve_timezone(tz)) if isinstance(tz, str) else tz
+            return dt.datetime.fromtimestamp(layout.start_time(row), tzinfo)
+        return cls._localize(layout.start_time(row), tz)
 
     @staticmethod
     def _convert_temperature(
         value: float | None, unit: str | None, target_unit: str | None
     ) -> tuple[float | None, str | None]:
         """Convert temperature to a requested unit, preserving unknown units."""
-        src = (unit or "").lower()
-        target = (target_unit or "").lower()
-        if value is None:
-            if target in {"fahrenheit", "f", "°f"}:
-                return None, "°F"
-            if target in {"celsius", "c", "°c"}:
-                return None, "°C"
-            return None, target_unit or unit
-        if target in {"fahrenheit", "f", "°f"}:
-            if src.startswith("c"):
-                return (value * 9 / 5) + 32, "°F"
-            return value, unit or "°F"
-        if target in {"celsius", "c", "°c"}:
-            if src.startswith("f"):
-                return (value - 32) * 5 / 9, "°C"
-            return value, unit or "°C"
-        return value, unit
+        return _temperature_converter(target_unit)(value, unit)
 
     @staticmethod
     def _convert_wind_speed(
         value: float | None, unit: str | None, target_unit: str | None
     ) -> tuple[float | None, str | None]:
         """Convert wind speed to a requested unit, preserving unknown units."""
-        src = (unit or "").lower()
-        target = (target_unit or "").lower()
-        if value is None:
-            if target in {"mph", "mi/h"}:
-                return None, "mph"
-            if target in {"km/h", "kph"}:
-                return None, "km/h"
-            if target in {"m/s", "ms^-1", "mps"}:
-                return None, "m/s"
-            return None, target_unit or unit
-        if target in {"mph", "mi/h"}:
-            if src in {"km/h", "kph"}:
-                return value * 0.621371, "mph"
-            if src in {"m/s", "ms^-1", "mps"}:
-                return value * 2.23694, "mph"
-            return value, unit or "mph"
-        if target in {"km/h", "kph"}:
-            if src in {"mph", "mi/h"}:
-                return value / 0.621371, "km/h"
-            if src in {"m/s", "ms^-1", "mps"}:
-                return value * 3.6, "km/h"
-            return value, unit or "km/h"
-        if target in {"m/s", "ms^-1", "mps"}:
-            if src in {"mph", "mi/h"}:
-                return value / 2.23694, "m/s"
-            if src in {"km/h", "kph"}:
-                return value / 3.6, "m/s"
-            return value, unit or "m/s"
-        return value, unit
+        return _wind_speed_converter(target_unit)(value, unit)
 
     @staticmethod
     def _convert_precipitation(
         value: float | None, unit: str | None, target_unit: str | None
     ) -> tuple[float | None, str | None]:
         """Convert precipitation depth to a requested unit."""
-        src = (unit or "").lower()
-        target = (target_unit or "").lower()
-        if value is None:
-            if target in {"inch", "in"}:
-                return None, "inch"
-            if target in {"mm", "millimeter", "millimetre"}:
-                return None, "mm"
-            return None, target_unit or unit
-        if target in {"inch", "in"}:
-            if src in {"mm", "millimeter", "millimetre"}:
-                return value / 25.4, "inch"
-            return value, unit or "inch"
-        if target in {"mm", "millimeter", "millimetre"}:
-            if src in {"inch", "in"}:
-                return value * 25.4, "mm"
-            return value, unit or "mm"
-        return value, unit
+        return _precipitation_converter(target_unit)(value, unit)
 
     def _row_to_weather(
         self,
-        row: Mapping,
-        tz_name: str,
+        row: Sequence | Mapping,
+        tz: dt.tzinfo | str,
         idx: int | None = None,
         *,
         temperature_unit: str = "fahrenheit",
         wind_speed_unit: str = "mph",
         precipitation_unit: str = "mm",
+        converters: Tuple[Converter, Converter, Converter] | None = None,
+        layout: _RowLayout | None = None,
     ) -> WeatherHour:
-        """Map a weather row from Postgres into a WeatherHour."""
-        temp, temp_unit = self._convert_temperature(
-            self._get_value(row, "temperature", "temperature_2m"),
-            self._get_value(row, "temperature_unit", "temperature_2m_unit"),
-            temperature_unit,
-        )
-        dew_point, dew_point_unit = self._convert_temperature(
-            self._get_value(row, "dew_point", "dew_point_2m"),
-            self._get_value(row, "dew_point_unit", "dew_point_2m_unit"),
-            temperature_unit,
-        )
-        apparent, apparent_unit = self._convert_temperature(
-            self._get_value(row, "apparent_temperature"),
-            self._get_value(row, "apparent_temperature_unit"),
-            temperature_unit,
-        )
-        wind_speed, wind_speed_unit_out = self._convert_wind_speed(
-            self._get_value(row, "wind_speed", "wind_speed_10m"),
-            self._get_value(row, "wind_speed_unit", "wind_speed_10m_unit"),
-            wind_speed_unit,
-        )
-        wind_gusts, wind_gusts_unit_out = self._convert_wind_speed(
-            self._get_value(row, "wind_gusts", "wind_gusts_10m"),
-            self._get_value(row, "wind_gusts_unit", "wind_gusts_10m_unit"),
-            wind_speed_unit,
-        )
-        precipitation, precipitation_unit_out = self._convert_precipitation(
-            self._get_value(row, "precipitation"),
-            self._get_value(row, "precipitation_unit"),
-            precipitation_unit,
-        )
+        """Map a weather row (a Mapping, or a positional Row read through `layout`) into a WeatherHour."""
+        if converters is None:
+            converters = _weather_converters(temperature_unit, wind_speed_unit, precipitation_unit)
+        if layout is None:
+            layout = _mapping_layout(row, "weather")
+        (
+            temp, temp_unit, dew_point, dew_point_unit, apparent, apparent_unit,
+            wind_speed, wind_speed_unit_out, wind_gusts, wind_gusts_unit_out, precipitation, precipitation_unit_out,
+            rel_humidity, rel_humidity_unit, precipitation_prob, precipitation_prob_unit,
+            cloud_cover, cloud_cover_unit, wind_direction, wind_direction_unit, is_day,
+        ) = [get(row) for get in layout.values]
+        # Rows from the fetch_* queries arrive converted by SQL; only other callers pay for conversion here.
+        if converters is not _PRECONVERTED:
+            convert_temperature, convert_wind_speed, convert_precipitation = converters
+            temp, temp_unit = convert_temperature(temp, temp_unit)
+            dew_point, dew_point_unit = convert_temperature(dew_point, dew_point_unit)
+            apparent, apparent_unit = convert_temperature(apparent, apparent_unit)
+            wind_speed, wind_speed_unit_out = convert_wind_speed(wind_speed, wind_speed_unit_out)
+            wind_gusts, wind_gusts_unit_out = convert_wind_speed(wind_gusts, wind_gusts_unit_out)
+            precipitation, precipitation_unit_out = convert_precipitation(precipitation, precipitation_unit_out)
 
+        # Positional, in WeatherHour field order: about half the cost of binding 23 keywords per row.
         return WeatherHour(
-            time=self._localize(row["open_meteo_start_time"], tz_name),
-            hour_index=row.get("hour_index", idx or 0),
-            temperature=temp,
-            temperature_unit=temp_unit or "°F",
-            rel_humidity=self._get_value(row, "relative_humidity", "relative_humidity_2m"),
-            rel_humidity_unit=self._get_value(row, "relative_humidity_unit", "relative_humidity_2m_unit"),
-            dew_point=dew_point,
-            dew_point_unit=dew_point_unit or temp_unit,
-            apparent_temperature=apparent,
-            apparent_temperature_unit=apparent_unit or temp_unit,
-            precipitation_prob=self._get_value(row, "precipitation_prob", "precipitation_probability"),
-            precipitation_prob_unit=self._get_value(row, "precipitation_prob_unit", "precipitation_probability_unit"),
-            precipitation=precipitation,
-            precipitation_unit=precipitation_unit_out,
-            cloud_cover=self._get_value(row, "cloud_cover"),
-            cloud_cover_unit=self._get_value(row, "cloud_cover_unit"),
-            wind_speed=wind_speed,
-            wind_speed_unit=wind_speed_unit_out or wind_speed_unit,
-            wind_gusts=wind_gusts,
-            wind_gusts_unit=wind_gusts_unit_out or wind_speed_unit,
-            wind_direction=self._get_value(row, "wind_direction", "wind_direction_10m"),
-            wind_direction_unit=self._get_value(row, "wind_direction_unit", "wind_direction_10m_unit"),
-            is_day=self._get_value(row, "is_day"),
+            self._start_time(layout, row, tz),
+            layout.hour_index(row) if layout.hour_index is not None else idx or 0,
+            temp,
+            temp_unit or "°F",
+            rel_humidity,
+            rel_humidity_unit,
+            dew_point,
+            dew_point_unit or temp_unit,
+            apparent,
+            apparent_unit or temp_unit,
+            precipitation_prob,
+            precipitation_prob_unit,
+            precipitation,
+            precipitation_unit_out,
+            cloud_cover,
+            cloud_cover_unit,
+            wind_speed,
+            wind_speed_unit_out or wind_speed_unit,
+            wind_gusts,
+            wind_gusts_unit_out or wind_speed_unit,
+            wind_direction,
+            wind_direction_unit,
+            is_day,
         )
 
-    def _row_to_air(self, row: Mapping, tz_name: str) -> AirHour:
-        """Map an air-quality row from Postgres into an AirHour."""
-        return AirHour(
-            time=self._localize(row["open_meteo_start_time"], tz_name),
-            pm2_5=self._get_value(row, "pm2_5"),
-            pm2_5_unit=self._get_value(row, "pm2_5_unit"),
-            pm10=self._get_value(row, "pm10"),
-            pm10_unit=self._get_value(row, "pm10_unit"),
-            us_aqi=self._get_value(row, "us_aqi"),
-            us_aqi_unit=self._get_value(row, "us_aqi_unit"),
-            ozone=self._get_value(row, "ozone"),
-            ozone_unit=self._get_value(row, "ozone_unit"),
-            uv_index=self._get_value(row, "uv_index"),
-            uv_index_unit=self._get_value(row, "uv_index_unit"),
-        )
+    def _row_to_air(
+        self, row: Sequence | Mapping, tz: dt.tzinfo | str, *, layout: _RowLayout | None = None
+    ) -> AirHour:
+        """Map an air-quality row (a Mapping, or a positional Row read through `layout`) into an AirHour."""
+        if layout is None:
+            layout = _mapping_layout(row, "air")
+        return AirHour(self._start_time(layout, row, tz), *[get(row) for get in layout.values])
 
     def fetch_weather_current(
         self,
@@ -259,53 +608,40 @@ class PostgresForecastDataSource(ForecastDataSource):
         wind_speed_unit: str = "mph",
         precipitation_unit: str = "mm",
     ) -> WeatherHour:
-        """Fetch the latest weather record for a location."""
+        """Fetch the latest weather record for a location (memoized for current_cache_seconds)."""
         tz_name = self._normalize_timezone(timezone)
-        query = text(
-            f"""
-            SELECT weather_event_id,
-                   open_meteo_start_time,
-                   open_meteo_end_time,
-                   latitude,
-                   longitude,
-                   temperature,
-                   temperature_unit,
-                   rel_humidity,
-                   rel_humidity_unit,
-                   dew_point,
-                   dew_point_unit,
-                   apparent_temperature,
-                   apparent_temperature_unit,
-                   precipitation_prob,
-                   precipitation_prob_unit,
-                   precipitation,
-                   precipitation_unit,
-                   cloud_cover,
-                   cloud_cover_unit,
-                   wind_speed,
-                   wind_speed_unit,
-                   wind_gusts,
-                   wind_gusts_unit,
-                   wind_direction,
-                   wind_direction_unit,
-                   is_day
-              FROM {self.current_weather_table}
-             WHERE latitude = :lat AND longitude = :lon
-             ORDER BY open_meteo_start_time DESC
-             LIMIT 1
-            """
-        )
-        logger.debug(f"Executing query for location ({latitude},{longitude}): {query}")
+        key = ("weather", latitude, longitude, tz_name, temperature_unit, wind_speed_unit, precipitation_unit)
+        return self._cached_current(key, lambda: self._query_weather_current(
+            latitude, longitude, tz_name, temperature_unit, wind_speed_unit, precipitation_unit
+        ))
+
+    def _query_weather_current(
+        self,
+        latitude: float,
+        longitude: float,
+        tz_name: str,
+        temperature_unit: str,
+        wind_speed_unit: str,
+        precipitation_unit: str,
+    ) -> WeatherHour:
+        """Run the latest-weather query for a location."""
+        select_list = _weather_select_list(temperature_unit, wind_speed_unit, precipitation_unit)
+        query = _current_query(self.current_weather_table, select_list)
+        logger.debug("Executing query for location (%s,%s): %s", latitude, longitude, query)
         with self.engine.connect() as conn:
-            row = conn.execute(query, {"lat": latitude, "lon": longitude}).mappings().first()
+            result = conn.execute(query, {"lat": latitude, "lon": longitude})
+            layout = _row_layout(tuple(result.keys()), "weather", True)
+            row = result.first()
         if not row:
             raise LookupError("No weather data found")
         return self._row_to_weather(
             row,
-            tz_name,
+            _zoneinfo_for(tz_name),
             temperature_unit=temperature_unit,
             wind_speed_unit=wind_speed_unit,
             precipitation_unit=precipitation_unit,
+            converters=_PRECONVERTED,
+            layout=layout,
         )
 
     def fetch_air_current(
@@ -316,37 +652,23 @@ class PostgresForecastDataSource(ForecastDataSource):
         timezone: str = "auto",
         forecast_days: int = 5,
     ) -> AirHour:
-        """Fetch the latest air-quality record for a location."""
+        """Fetch the latest air-quality record for a location (memoized for current_cache_seconds)."""
         tz_name = self._normalize_timezone(timezone)
-        query = text(
-            f"""
-            SELECT air_event_id,
-                   open_meteo_start_time,
-                   open_meteo_end_time,
-                   latitude,
-                   longitude,
-                   pm2_5,
-                   pm2_5_unit,
-                   pm10,
-                   pm10_unit,
-                   us_aqi,
-                   us_aqi_unit,
-                   ozone,
-                   ozone_unit,
-                   uv_index,
-                   uv_index_unit
-              FROM {self.current_air_table}
-             WHERE latitude = :lat AND longitude = :lon
-             ORDER BY open_meteo_start_time DESC
-             LIMIT 1
-            """
+        return self._cached_current(
+            ("air", latitude, longitude, tz_name), lambda: self._query_air_current(latitude, longitude, tz_name)
         )
-        logger.debug(f"Executing query for location ({latitude},{longitude}): {query}")
+
+    def _query_air_current(self, latitude: float, longitude: float, tz_name: str) -> AirHour:
+        """Run the latest-air-quality query for a location."""
+        query = _current_query(self.current_air_table, _AIR_SELECT_LIST)
+        logger.debug("Executing query for location (%s,%s): %s", latitude, longitude, query)
         with self.engine.connect() as conn:
-            row = conn.execute(query, {"lat": latitude, "lon": longitude}).mappings().first()
+            result = conn.execute(query, {"lat": latitude, "lon": longitude})
+            layout = _row_layout(tuple(result.keys()), "air", True)
+            row = result.first()
         if not row:
             raise LookupError("No air quality data found")
-        return self._row_to_air(row, tz_name)
+        return self._row_to_air(row, _zoneinfo_for(tz_name), layout=layout)
 
     def fetch_weather_hours(
         self,
@@ -358,59 +680,101 @@ class PostgresForecastDataSource(ForecastDataSource):
         temperature_unit: str = "fahrenheit",
         wind_speed_unit: str = "mph",
         precipitation_unit: str = "mm",
+        fields: frozenset[str] | None = None,
     ) -> List[WeatherHour]:
         """Fetch an hourly weather forecast for the requested number of days."""
+        return list(self.iter_weather_hours(
+            latitude,
+            longitude,
+            timezone=timezone,
+            forecast_days=forecast_days,
+            temperature_unit=temperature_unit,
+            wind_speed_unit=wind_speed_unit,
+            precipitation_unit=precipitation_unit,
+            fields=fields,
+        ))
+
+    def iter_weather_hours(
+        self,
+        latitude: float,
+        longitude: float,
+        *,
+        timezone: str = "auto",
+        forecast_days: int | None = None,
+        temperature_unit: str = "fahrenheit",
+        wind_speed_unit: str = "mph",
+        precipitation_unit: str = "mm",
+        fields: frozenset[str] | None = None,
+    ) -> Iterator[WeatherHour]:
+        """Yield hourly weather rows as they stream from the server; the connection is held until exhausted.
+
+        Pass `fields` (weather column names) to fetch only what the caller reads.
+        """
         tz_name = self._normalize_timezone(timezone)
         days = forecast_days or 7
-        query = text(
-            f"""
-            SELECT weather_event_id,
-                   open_meteo_start_time,
-                   open_meteo_end_time,
-                   latitude,
-                   longitude,
-                   temperature,
-                   temperature_unit,
-                   rel_humidity,
-                   rel_humidity_unit,
-                   dew_point,
-                   dew_point_unit,
-                   apparent_temperature,
-                   apparent_temperature_unit,
-                   precipitation_prob,
-                   precipitation_prob_unit,
-                   precipitation,
-                   precipitation_unit,
-                   cloud_cover,
-                   cloud_cover_unit,
-                   wind_speed,
-                   wind_speed_unit,
-                   wind_gusts,
-                   wind_gusts_unit,
-                   wind_direction,
-                   wind_direction_unit,
-                   is_day
-              FROM {self.forecast_weather_table}
-             WHERE latitude = :lat AND longitude = :lon
-               AND open_meteo_start_time >= timezone(:tz, now())
-               AND open_meteo_start_time < timezone(:tz, now()) + make_interval(days => :days)
-             ORDER BY open_meteo_start_time               
-            """
-        )
-        logger.debug(f"Executing query for location ({latitude},{longitude}): {query}")
+        select_list = _weather_select_list(temperature_unit, wind_speed_unit, precipitation_unit, fields)
+        query = _hourly_query(self.forecast_weather_table, select_list)
+        logger.debug("Executing query for location (%s,%s): %s", latitude, longitude, query)
+        tzinfo = _zoneinfo_for(tz_name)
         with self.engine.connect() as conn:
-            rows = conn.execute(query, {"lat": latitude, "lon": longitude, "days": days, "tz": tz_name}).mappings().all()
-        return [
-            self._row_to_weather(
-                row,
-                tz_name,
-                idx=i,
-                temperature_unit=temperature_unit,
-                wind_speed_unit=wind_speed_unit,
-                precipitation_unit=precipitation_unit,
+            result = conn.execution_options(yield_per=FETCH_BATCH_ROWS).execute(
+                query, {"lat": latitude, "lon": longitude, "days": days, "tz": tz_name}
             )
-            for i, row in enumerate(rows)
-        ]
+            layout = _row_layout(tuple(result.keys()), "weather", True)
+            for i, row in enumerate(result):
+                yield self._row_to_weather(
+                    row,
+                    tzinfo,
+                    idx=i,
+                    wind_speed_unit=wind_speed_unit,
+                    converters=_PRECONVERTED,
+                    layout=layout,
+                )
+
+    def fetch_weather_hours_batch(
+        self,
+        points: Sequence[Tuple[float, float]],
+        *,
+        timezone: str = "auto",
+        forecast_days: int | None = None,
+        temperature_unit: str = "fahrenheit",
+        wind_speed_unit: str = "mph",
+        precipitation_unit: str = "mm",
+    ) -> Dict[Tuple[float, float], List[WeatherHour]]:
+        """Fetch hourly weather forecasts for several locations in one query, keyed by (latitude, longitude).
+
+        Every requested point gets an entry, empty when the table has no rows for it.
+        """
+        forecasts: Dict[Tuple[float, float], List[WeatherHour]] = {
+            (float(lat), float(lon)): [] for lat, lon in points
+        }
+        if not forecasts:
+            return forecasts
+        tz_name = self._normalize_timezone(timezone)
+        days = forecast_days or 7
+        select_list = _weather_select_list(temperature_unit, wind_speed_unit, precipitation_unit)
+        query = _hourly_batch_query(self.forecast_weather_table, select_list)
+        logger.debug("Executing batch query for %d locations: %s", len(forecasts), query)
+        tzinfo = _zoneinfo_for(tz_name)
+        with self.engine.connect() as conn:
+            result = conn.execution_options(yield_per=FETCH_BATCH_ROWS).execute(
+                query, {"points": list(forecasts), "days": days, "tz": tz_name}
+            )
+            keys = tuple(result.keys())
+            layout = _row_layout(keys, "weather", True)
+            location = itemgetter(keys.index("latitude"), keys.index("longitude"))
+            for row in result:
+                lat, lon = location(row)
+                hours = forecasts.setdefault((float(lat), float(lon)), [])
+                hours.append(self._row_to_weather(
+                    row,
+                    tzinfo,
+                    idx=len(hours),
+                    wind_speed_unit=wind_speed_unit,
+                    converters=_PRECONVERTED,
+                    layout=layout,
+                ))
+        return forecasts
 
     def fetch_air_hours(
         self,
@@ -421,33 +785,26 @@ class PostgresForecastDataSource(ForecastDataSource):
         forecast_days: int | None = None,
     ) -> List[AirHour]:
         """Fetch an hourly air-quality forecast for the requested number of days."""
+        return list(self.iter_air_hours(latitude, longitude, timezone=timezone, forecast_days=forecast_days))
+
+    def iter_air_hours(
+        self,
+        latitude: float,
+        longitude: float,
+        *,
+        timezone: str = "auto",
+        forecast_days: int | None = None,
+    ) -> Iterator[AirHour]:
+        """Yield hourly air-quality rows as they stream from the server; the connection is held until exhausted."""
         tz_name = self._normalize_timezone(timezone)
         days = forecast_days or 5
-        query = text(
-            f"""
-            SELECT air_event_id,
-                   open_meteo_start_time,
-                   open_meteo_end_time,
-                   latitude,
-                   longitude,
-                   pm2_5,
-                   pm2_5_unit,
-                   pm10,
-                   pm10_unit,
-                   us_aqi,
-                   us_aqi_unit,
-                   ozone,
-                   ozone_unit,
-                   uv_index,
-                   uv_index_unit
-              FROM {self.forecast_air_table}            
-             WHERE latitude = :lat AND longitude = :lon
-               AND open_meteo_start_time >= timezone(:tz, now())
-               AND open_meteo_start_time < timezone(:tz, now()) + make_interval(days => :days)
-             ORDER BY open_meteo_start_time
-            """
-        )
-        logger.debug(f"Executing query for location ({latitude},{longitude}): {query}")
+        query = _hourly_query(self.forecast_air_table, _AIR_SELECT_LIST)
+        logger.debug("Executing query for location (%s,%s): %s", latitude, longitude, query)
+        tzinfo = _zoneinfo_for(tz_name)
         with self.engine.connect() as conn:
-            rows = conn.execute(query, {"lat": latitude, "lon": longitude, "days": days, "tz": tz_name}).mappings().all()
-        return [self._row_to_air(row, tz_name) for row in rows]
+            result = conn.execution_options(yield_per=FETCH_BATCH_ROWS).execute(
+                query, {"lat": latitude, "lon": longitude, "days": days, "tz": tz_name}
+            )
+            layout = _row_layout(tuple(result.keys()), "air", True)
+            for row in result:
+                yield self._row_to_air(row, tzinfo, layout=layout)
@@ -9,9 +9,10 @@ from __future__ import annotations
 
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Dict, List, Tuple
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Tuple
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 
 class _StrictBaseModel(BaseModel):
@@ -87,13 +88,15 @@ class MeasureDirectionality(str, Enum):
 
 class MeasurePolicy(_StrictBaseModel):
     """Policy metadata for a measure used in scoring and trends."""
+    model_config = ConfigDict(extra="forbid", frozen=True)  # shared by every assessment
+
     name: str
     unit: str | None = None
     trend_deadband: float | None = None
     directionality: MeasureDirectionality = MeasureDirectionality.UNKNOWN
 
 
-DEFAULT_MEASURE_POLICIES: Dict[str, MeasurePolicy] = {
+DEFAULT_MEASURE_POLICIES: Mapping[str, MeasurePolicy] = MappingProxyType({
     "temperature_f": MeasurePolicy(
         name="temperature_f",
         unit="F",
@@ -142,7 +145,7 @@ DEFAULT_MEASURE_POLICIES: Dict[str, MeasurePolicy] = {
         trend_deadband=0.2,
         directionality=MeasureDirectionality.LOWER_IS_BETTER,
     ),
-}
+})
 
 
 class MeasureJudgment(_StrictBaseModel):
@@ -162,7 +165,7 @@ class RiskFlag(_StrictBaseModel):
     severity: RiskSeverity
     confidence: float | None = Field(default=None, ge=0.0, le=1.0)
     priority: Priority = Priority.NORMAL
-    evidence: List[str] = Field(default_factory=list)
+    evidence: Tuple[str, ...] = ()  # immutable so cached assessments can share it
 
 
 class HourAssessment(_StrictBaseModel):
@@ -193,6 +196,8 @@ class AssessmentSummary(_StrictBaseModel):
     suitability_score: float | None = None
     primary_limiters: List[RiskFlag] = Field(default_factory=list)
     best_windows: List[WindowRecommendation] = Field(default_factory=list)
+    # Rendered markdown, filled on first use by the API; not serialized.
+    _markdown: str | None = PrivateAttr(default=None)
 
 
 class RiderPreferences(_StrictBaseModel):
@@ -227,3 +232,5 @@ class AgentAssessmentPayload(_StrictBaseModel):
     hourly: List[HourAssessment] = Field(default_factory=list)
     summary: AssessmentSummary | None = None
     policies: Dict[str, MeasurePolicy] = Field(default_factory=dict)
+    # Rendered narration user message, filled on first use by narration; not serialized.
+    _narration_user_content: str | None = PrivateAttr(default=None)
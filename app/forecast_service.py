@@ -2,9 +2,13 @@
 from __future__ import annotations
 
 import datetime as dt
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 import math
-from typing import List, Optional, Dict, Union
+from operator import attrgetter
+from typing import List, Optional, Dict, Sequence, Union
+
+import numpy as np
 
 from app.data_sources import CallableForecastDataSource, ForecastDataSource
 from app.data_sources.open_meteo_client import (
@@ -20,14 +24,62 @@ logger = get_tagged_logger(__name__, tag="forecast_service")
 # TODO: incorporate NWS alerts/discussions into conditions payload for hazard-aware scoring.
 
 
-@dataclass
+# Shared pool for the per-window upstream fetches (four per window); sized to the
+# Open-Meteo session's keep-alive pool.
+FETCH_MAX_WORKERS = 32
+_FETCH_POOL = ThreadPoolExecutor(max_workers=FETCH_MAX_WORKERS, thread_name_prefix="forecast-fetch")
+
+
+# Field order of BikeHourConditions.to_display_tuple; matches the API's CurrentConditions model.
+DISPLAY_FIELDS = (
+    "timestamp_utc",
+    "temperature",
+    "relative_humidity",
+    "dew_point",
+    "apparent_temperature",
+    "precipitation_prob",
+    "precipitation",
+    "cloud_cover",
+    "wind_speed",
+    "wind_gusts",
+    "wind_direction",
+    "is_day",
+    "pm2_5",
+    "pm10",
+    "us_aqi",
+    "ozone",
+    "uv_index",
+)
+
+# Numeric fields read by the assessment engine, exposed column-wise by BikeConditions.columns.
+SCORING_FIELDS = ("temperature", "wind_speed", "wind_gusts", "us_aqi", "precipitation_prob", "is_day")
+
+
+@dataclass(slots=True)
 class BikeConditions:
     """Bundle of current and forecast bike conditions."""
     current: BikeHourConditions
     forecast: List[BikeHourConditions]
-
-
-@dataclass
+    # Memo for `columns` (slots rule out cached_property).
+    _columns: Dict[str, np.ndarray] | None = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def columns(self) -> Dict[str, np.ndarray]:
+        """Scoring fields of the non-empty forecast hours as parallel float64 arrays (NaN = missing)."""
+        if self._columns is None:
+            hours = [h for h in self.forecast or [] if h is not None]
+            self._columns = {}
+            for name in SCORING_FIELDS:
+                values = [getattr(h, name, None) for h in hours]
+                if name == "is_day":
+                    values = [_normalize_is_day(v) for v in values]
+                self._columns[name] = np.array(
+                    [np.nan if v is None else float(v) for v in values], dtype=np.float64
+                )
+        return self._columns
+
+
+@dataclass(slots=True)
 class BikeHourConditions:
     """Merged weather/air-quality conditions for a single hour."""
     time: dt.datetime  # timezone-aware
@@ -75,28 +127,43 @@ class BikeHourConditions:
         except Exception:
             return ""
 
+    def to_display_tuple(self) -> tuple | None:
+        """Return display values in DISPLAY_FIELDS order (timestamp kept as a datetime)."""
+        fmt = self._fmt
+        try:
+            return (
+                self.time,
+                fmt(self.temperature, self.temperature_unit, "{:.1f}"),
+                fmt(self.rel_humidity, self.rel_humidity_unit, "{:.0f}"),
+                fmt(self.dew_point, self.dew_point_unit, "{:.1f}"),
+                fmt(self.apparent_temperature, self.apparent_temperature_unit, "{:.1f}"),
+                fmt(self.precipitation_prob, self.precipitation_prob_unit, "{:.0f}"),
+                fmt(self.precipitation, self.precipitation_unit, "{:.0f}"),
+                fmt(self.cloud_cover, self.cloud_cover_unit, "{:.0f}"),
+                fmt(self.wind_speed, self.wind_speed_unit, "{:.1f}"),
+                fmt(self.wind_gusts, self.wind_gusts_unit, "{:.1f}"),
+                fmt(self.wind_direction, self.wind_direction_unit, "{:.0f}"),
+                "true" if self.is_day is True else "false" if self.is_day is False else "",
+                fmt(self.pm2_5, self.pm2_5_unit, "{:.0f}"),
+                fmt(self.pm10, self.pm10_unit, "{:.0f}"),
+                fmt(self.us_aqi, self.us_aqi_unit, "{:.0f}"),
+                fmt(self.ozone, self.ozone_unit, "{:.0f}"),
+                fmt(self.uv_index, self.uv_index_unit, "{:.0f}"),
+            )
+        except Exception as e:
+            logger.error(
+                "Error converting BikeHourConditions to display strings: %s",
+                e,
+            )
+            return None
+
     def to_display_strings(self) -> Union[dict | None]:
         """Return a display-friendly dict for API serialization."""
+        values = self.to_display_tuple()
+        if values is None:
+            return None
         try:
-            return {
-                "timestamp_utc": self.time.isoformat(),
-                "temperature": self._fmt(self.temperature, self.temperature_unit, "{:.1f}"),
-                "relative_humidity": self._fmt(self.rel_humidity, self.rel_humidity_unit, "{:.0f}"),
-                "dew_point": self._fmt(self.dew_point, self.dew_point_unit, "{:.1f}"),
-                "apparent_temperature": self._fmt(self.apparent_temperature, self.apparent_temperature_unit, "{:.1f}"),
-                "precipitation_prob": self._fmt(self.precipitation_prob, self.precipitation_prob_unit, "{:.0f}"),
-                "precipitation": self._fmt(self.precipitation, self.precipitation_unit, "{:.0f}"),
-                "cloud_cover": self._fmt(self.cloud_cover, self.cloud_cover_unit, "{:.0f}"),
-                "wind_speed": self._fmt(self.wind_speed, self.wind_speed_unit, "{:.1f}"),
-                "wind_gusts": self._fmt(self.wind_gusts, self.wind_gusts_unit, "{:.1f}"),
-                "wind_direction": self._fmt(self.wind_direction, self.wind_direction_unit, "{:.0f}"),
-                "is_day": "true" if self.is_day is True else "false" if self.is_day is False else "",
-                "pm2_5": self._fmt(self.pm2_5, self.pm2_5_unit, "{:.0f}"),
-                "pm10": self._fmt(self.pm10, self.pm10_unit, "{:.0f}"),
-                "us_aqi": self._fmt(self.us_aqi, self.us_aqi_unit, "{:.0f}"),
-                "ozone": self._fmt(self.ozone, self.ozone_unit, "{:.0f}"),
-                "uv_index": self._fmt(self.uv_index, self.uv_index_unit, "{:.0f}"),
-            }
+            return {"timestamp_utc": self.time.isoformat(), **dict(zip(DISPLAY_FIELDS[1:], values[1:]))}
         except Exception as e:
             logger.error(
                 "Error converting BikeHourConditions to display strings: %s",
@@ -129,68 +196,92 @@ class BikeHourConditions:
         ]
 
 
+# Spellings of is_day accepted from string-typed sources.
+_IS_DAY_WORDS: Dict[str, bool] = {
+    **dict.fromkeys(("1", "true", "t", "yes", "y"), True),
+    **dict.fromkeys(("0", "false", "f", "no", "n"), False),
+}
+
+
 def _normalize_is_day(value: Optional[object]) -> Optional[bool]:
     """Normalize Open-Meteo is_day values (0/1, bool, string) into bool or None."""
     if value is None:
         return None
-    if isinstance(value, bool):
+    # Exact-type checks short-circuit the common case (this runs once per hour); isinstance
+    # still admits subclasses such as numpy float64.
+    kind = type(value)
+    if kind is bool:
         return value
-    if isinstance(value, (int, float)):
+    if kind is int or kind is float or isinstance(value, (int, float)):
         return bool(int(value))
-    if isinstance(value, str):
-        lowered = value.strip().lower()
-        if lowered in {"1", "true", "t", "yes", "y"}:
-            return True
-        if lowered in {"0", "false", "f", "no", "n"}:
-            return False
+    if kind is str or isinstance(value, str):
+        normalized = _IS_DAY_WORDS.get(value.strip().lower())
+        if normalized is not None:
+            return normalized
     logger.debug("Unrecognized is_day value; treating as unknown", extra={"is_day": value})
     return None
 
 
-def _index_air_by_time(air: List[AirHour]) -> Dict[dt.datetime, AirHour]:
-    """Index air-quality hours by timestamp."""
-    return {a.time: a for a in air}
+def _hour_times(hours: Sequence) -> Sequence[dt.datetime]:
+    """Return the timestamps of hourly rows, using a columnar series' times when present."""
+    times = getattr(hours, "times", None)
+    return times if times is not None else [h.time for h in hours]
+
+
+# Air-quality fields of BikeHourConditions, in field order after is_day.
+_AIR_FIELDS = (
+    "pm2_5", "pm2_5_unit", "pm10", "pm10_unit", "us_aqi", "us_aqi_unit",
+    "ozone", "ozone_unit", "uv_index", "uv_index_unit",
+)
+_NO_AIR = (None,) * len(_AIR_FIELDS)
+
+
+_air_values = attrgetter(*_AIR_FIELDS)
 
 
 def generate_bike_conditions(weather: WeatherHour, air: AirHour) -> BikeHourConditions:
     """Merge weather and air observations into a BikeHourConditions object."""
+    # Positional, in BikeHourConditions field order; the air check happens once instead of per field.
     return BikeHourConditions(
-        time=weather.time,
-        hour_index=weather.hour_index,
-        temperature=weather.temperature,
-        temperature_unit=weather.temperature_unit,
-        rel_humidity=weather.rel_humidity,
-        rel_humidity_unit=weather.rel_humidity_unit,
-        dew_point=weather.dew_point,
-        dew_point_unit=weather.dew_point_unit,
-        apparent_temperature=weather.apparent_temperature,
-        apparent_temperature_unit=weather.apparent_temperature_unit,
-        precipitation_prob=weather.precipitation_prob,
-        precipitation_prob_unit=weather.precipitation_prob_unit,
-        precipitation=weather.precipitation,
-        precipitation_unit=weather.precipitation_unit,
-        cloud_cover=weather.cloud_cover,
-        cloud_cover_unit=weather.cloud_cover_unit,
-        wind_speed=weather.wind_speed,
-        wind_speed_unit=weather.wind_speed_unit,
-        wind_gusts=weather.wind_gusts,
-        wind_gusts_unit=weather.wind_gusts_unit,
-        wind_direction=weather.wind_direction,
-        wind_direction_unit=weather.wind_direction_unit,
-        is_day=_normalize_is_day(weather.is_day),
-        pm2_5=air.pm2_5 if air else None,
-        pm2_5_unit=air.pm2_5_unit if air else None,
-        pm10=air.pm10 if air else None,
-        pm10_unit=air.pm10_unit if air else None,
-        us_aqi=air.us_aqi if air else None,
-        us_aqi_unit=air.us_aqi_unit if air else None,
-        ozone=air.ozone if air else None,
-        ozone_unit=air.ozone_unit if air else None,
-        uv_index=air.uv_index if air else None,
-        uv_index_unit=air.uv_index_unit if air else None,
+        weather.time,
+        weather.hour_index,
+        weather.temperature,
+        weather.temperature_unit,
+        weather.rel_humidity,
+        weather.rel_humidity_unit,
+        weather.dew_point,
+        weather.dew_point_unit,
+        weather.apparent_temperature,
+        weather.apparent_temperature_unit,
+        weather.precipitation_prob,
+        weather.precipitation_prob_unit,
+        weather.precipitation,
+        weather.precipitation_unit,
+        weather.cloud_cover,
+        weather.cloud_cover_unit,
+        weather.wind_speed,
+        weather.wind_speed_unit,
+        weather.wind_gusts,
+        weather.wind_gusts_unit,
+        weather.wind_direction,
+        weather.wind_direction_unit,
+        _normalize_is_day(weather.is_day),
+        *(_air_values(air) if air else _NO_AIR),
     )
 
 
+def _window_predates_forecast(ds: ForecastDataSource, end_local: dt.datetime) -> bool:
+    """Return True if the built-in Open-Meteo hourly forecast cannot contain any hour of the window.
+
+    Open-Meteo's hourly series starts at today's local midnight, so a window ending by then has no
+    rows. Other sources (e.g. a database) may hold history and are always queried.
+    """
+    if ds.fetch_weather_hours is not fetch_weather_hours:
+        return False
+    today = dt.datetime.now(end_local.tzinfo).replace(hour=0, minute=0, second=0, microsecond=0)
+    return end_local <= today
+
+
 def get_bike_conditions_for_window(
     latitude: float,
     longitude: float,
@@ -247,29 +338,40 @@ def get_bike_conditions_for_window(
         fetch_air_hours,
     )
 
-    current_weather = ds.fetch_weather_current(latitude, longitude, timezone=timezone)
-    current_air = ds.fetch_air_current(latitude, longitude, timezone=timezone)
-    logger.debug("Fetched current weather and air")
+    # The four upstream calls are independent; issue them together so the window costs
+    # the slowest call rather than the sum of all four.
+    futures = [
+        _FETCH_POOL.submit(ds.fetch_weather_current, latitude, longitude, timezone=timezone),
+        _FETCH_POOL.submit(ds.fetch_air_current, latitude, longitude, timezone=timezone),
+    ]
+    past_window = _window_predates_forecast(ds, end_local)
+    if past_window:
+        logger.info("Window ended before the forecast starts; skipping hourly fetches",
+                    extra={"end_local": end_local.isoformat()})
+    else:
+        futures += (
+            _FETCH_POOL.submit(ds.fetch_weather_hours, latitude, longitude, timezone=timezone, forecast_days=days or 7),
+            _FETCH_POOL.submit(ds.fetch_air_hours, latitude, longitude, timezone=timezone, forecast_days=days or 7),
+        )
+    current_weather, current_air, *hourly = (f.result() for f in futures)
+    hourly_weather, hourly_air = hourly or ([], [])
+    logger.debug("Fetched current and hourly weather and air")
     current_conditions = generate_bike_conditions(current_weather, current_air)
 
-    hourly_weather = ds.fetch_weather_hours(latitude, longitude, timezone=timezone, forecast_days=days or 7)
-    hourly_air = ds.fetch_air_hours(latitude, longitude, timezone=timezone, forecast_days=days or 7)
-    logger.debug("Fetched weather and air hours")
-
-    air_index = _index_air_by_time(hourly_air)
+    # Filter on timestamps first so only the hours inside the window are built as rows.
+    air_slots = {t: i for i, t in enumerate(_hour_times(hourly_air))}
 
     forecast: List[BikeHourConditions] = []
-    hour_idx: int = 0
-    for w in hourly_weather:
-        if not (start_local <= w.time < end_local):
+    for i, t in enumerate(_hour_times(hourly_weather)):
+        if not (start_local <= t < end_local):
             continue
 
-        a = air_index.get(w.time)
+        j = air_slots.get(t)
+        a = hourly_air[j] if j is not None else None
 
         forecast.append(
-            generate_bike_conditions(w, a)
+            generate_bike_conditions(hourly_weather[i], a)
         )
-        hour_idx += 1
 
     logger.info(
         "Computed bike conditions for window",
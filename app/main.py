@@ -1,25 +1,51 @@
 """FastAPI application setup and static file serving."""
 
+import os
+from contextlib import asynccontextmanager
 from pathlib import Path
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 
-from .api import router as api_router
+from .api import router as api_router, stream_router as api_stream_router
+from .ollama_client import ollama_client
 
-app = FastAPI(title="Biking Conditions Agent")
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    """Release pooled Ollama connections on shutdown."""
+    yield
+    await ollama_client.aclose()
+
+
+app = FastAPI(title="Biking Conditions Agent", lifespan=lifespan)
 
 _STATIC_DIR = Path(__file__).resolve().parent.parent / "static"
+_INDEX_PATH = _STATIC_DIR / "index.html"
+
+
+class RevalidatedStaticFiles(StaticFiles):
+    """StaticFiles that asks browsers to revalidate: assets are not content-hashed, so they
+    must not be cached as immutable, but unchanged files cost only a 304 via the ETag."""
+
+    def file_response(self, *args, **kwargs):
+        """Build the (possibly 304) file response with a no-cache directive."""
+        response = super().file_response(*args, **kwargs)
+        response.headers.setdefault("cache-control", "no-cache")
+        return response
+
+
+_static_files = RevalidatedStaticFiles(directory=_STATIC_DIR)
 
 # Serve /static files
-app.mount("/static", StaticFiles(directory=_STATIC_DIR), name="static")
+app.mount("/static", _static_files, name="static")
 
 # Serve index.html at "/"
 @app.get("/")
-def serve_index():
-    """Serve the static single-page app."""
-    return FileResponse(_STATIC_DIR / "index.html")
+def serve_index(request: Request):
+    """Serve the static single-page app, answering conditional requests with 304."""
+    return _static_files.file_response(_INDEX_PATH, os.stat(_INDEX_PATH), request.scope)
 
 
 # API routes
 app.include_router(api_router, prefix="/v1")
+app.include_router(api_stream_router, prefix="/v1")
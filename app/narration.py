@@ -9,6 +9,9 @@ from typing import Sequence
 from app.domain import AgentAssessmentPayload
 
 
+# Sent verbatim as the first message of every narration and prefilled at startup
+# (OllamaClient.warm_up), so Ollama can reuse its KV cache for this prefix. Keep it
+# static: no timestamps or per-request values.
 SYSTEM_PROMPT_HYBRID = """You are a friendly, safety-first ride coach. All scoring, risks, and windows are precomputed.
 Never recompute numbers, categories, or decisions. Use the provided values.
 If conditions are poor or no good windows exist, clearly say so and suggest an indoor ride as an alternative.
@@ -37,8 +40,11 @@ def _strip_markdown_fences(text: str) -> str:
     return "\n".join(lines).strip()
 
 
-def build_narration_messages(payload: AgentAssessmentPayload, *, max_hours: int = 4) -> list[dict]:
-    """Prepare system+user messages for narration without recomputation."""
+_DEFAULT_MAX_HOURS = 4
+
+
+def _render_user_content(payload: AgentAssessmentPayload, max_hours: int) -> str:
+    """Render the assessment-specific user message."""
     summary = payload.summary
     hours = payload.hourly[:max_hours]
     windows = payload.summary.best_windows if summary else []
@@ -52,18 +58,31 @@ def build_narration_messages(payload: AgentAssessmentPayload, *, max_hours: int
             lines.append(f"Primary limiters: {', '.join(limiter_badges)}")
     if windows:
         lines.append("Best windows:")
-        for w in windows:
-            lines.append(f"- {w.start.isoformat()} to {w.end.isoformat()} ({w.decision}) score={w.window_score}")
+        lines.extend([
+            f"- {w.start.isoformat()} to {w.end.isoformat()} ({w.decision}) score={w.window_score}" for w in windows
+        ])
     if hours:
         lines.append("Hourly samples:")
-        for h in hours:
-            lines.append(f"- {h.time.isoformat()} decision={h.decision} score={h.hour_score}")
+        lines.extend([f"- {h.time.isoformat()} decision={h.decision} score={h.hour_score}" for h in hours])
 
     user_msg = "\n".join([
         "Precomputed ride assessment follows. Do not recompute numbers or decisions.",
         *lines,
         "Answer the user's question in conversational text/markdown using this assessment.",
     ])
+    return user_msg
+
+
+def build_narration_messages(payload: AgentAssessmentPayload, *, max_hours: int = _DEFAULT_MAX_HOURS) -> list[dict]:
+    """Prepare system+user messages for narration without recomputation."""
+    # The system prompt is static; only the user message depends on the payload, and
+    # it is rendered once per payload for the default sample size.
+    if max_hours != _DEFAULT_MAX_HOURS:
+        user_msg = _render_user_content(payload, max_hours)
+    else:
+        user_msg = payload._narration_user_content
+        if user_msg is None:
+            user_msg = payload._narration_user_content = _render_user_content(payload, max_hours)
     return [
         {"role": "system", "content": SYSTEM_PROMPT_HYBRID},
         {"role": "user", "content": user_msg},
@@ -1,7 +1,12 @@
 """Thin client for calling the local Ollama chat API."""
 
+import asyncio
+import json
 import os
 import time
+from typing import AsyncIterator
+
+import httpx
 import requests
 
 from .config import settings
@@ -10,6 +15,15 @@ from utils.logging_utils import setup_logging, get_tagged_logger
 setup_logging(level=os.getenv("LOG_LEVEL", "INFO"))
 logger = get_tagged_logger(__name__, tag="ollama_client")
 
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+_dumps = orjson.dumps if orjson is not None else (lambda obj: json.dumps(obj).encode())
+_loads = orjson.loads if orjson is not None else json.loads
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
 
 def _base_url() -> str:
     """Return Ollama base URL without a trailing slash."""
@@ -18,6 +32,9 @@ def _base_url() -> str:
 
 class OllamaClient:
     """Minimal client for the Ollama chat API."""
+    # Idle keep-alive connections kept by the shared async client.
+    ASYNC_MAX_KEEPALIVE = 10
+
     def __init__(self):
         """Initialize client configuration from settings."""
         self.url = f"{_base_url()}/api/chat"
@@ -25,21 +42,63 @@ class OllamaClient:
         self.options = settings.ollama_options
         self.max_retries = int(os.getenv("AGENT_OLLAMA_RETRIES", "1"))
         self.retry_backoff_sec = float(os.getenv("AGENT_OLLAMA_RETRY_BACKOFF_SEC", "0.5"))
+        self.timeout_sec = 180
+        self.keep_alive = settings.ollama_keep_alive
+        self._async_client: httpx.AsyncClient | None = None
+        self._async_client_loop = None
+        # Strong references to pending closes of replaced clients; the loop only keeps weak ones.
+        self._closing: set[asyncio.Task] = set()
 
-    def chat(self, messages):
-        """Send a chat request and return the assistant content."""
+    def _build_payload(self, messages, options: dict | None = None, stream: bool = False) -> dict:
+        """Build the chat request body (non-streaming unless `stream` is set)."""
         payload = {
             "model": self.model,
             "messages": messages,
-            "stream": False,
-            "options": self.options,
+            "stream": stream,
+            "options": options if options is not None else self.options,
         }
+        if self.keep_alive:
+            payload["keep_alive"] = self.keep_alive
+        return payload
+
+    def _should_retry(self, r, attempt: int) -> bool:
+        """Return True if a non-200 response is a transient EOF worth retrying."""
+        error_text = (r.text or "")[:200]
+        if "EOF" in error_text and attempt < self.max_retries:
+            logger.warning("Ollama returned EOF; retrying (attempt %d/%d).", attempt + 1, self.max_retries + 1)
+            return True
+        return False
+
+    def _status_error(self, r) -> RuntimeError:
+        """Build the error raised for a non-retryable, non-200 response."""
+        error_text = (r.text or "")[:200]
+        return RuntimeError(
+            f"Ollama POST failed with status {r.status_code}: {error_text} "
+            f"(model={self.model}, url={self.url})"
+        )
+
+    @staticmethod
+    def _parse_content(r, loads=None) -> str:
+        """Extract the assistant content from a chat response, decoding the body with `loads` if given."""
+        try:
+            data = loads(r.content) if loads is not None else r.json()
+        except ValueError as exc:
+            raise RuntimeError(f"Ollama returned non-JSON response: {r.text[:200]}") from exc
+        content = data.get("message", {}).get("content", "")
+        # Normalize non-string content to string
+        if isinstance(content, (dict, list)):
+            content = str(content)
+        return content
+
+    def chat(self, messages):
+        """Send a chat request and return the assistant content."""
+        payload = self._build_payload(messages)
 
         last_error = None
         for attempt in range(self.max_retries + 1):
             try:
                 logger.debug("Ollama POST payload: %s", payload)
-                r = requests.post(self.url, json=payload, timeout=180)
+                r = requests.post(self.url, json=payload, timeout=self.timeout_sec)
                 logger.info(
                     "Ollama POST took %.2fs, response: %s",
                     r.elapsed.total_seconds(),
@@ -56,28 +115,134 @@ class OllamaClient:
             if r.status_code == 200:
                 break
 
-            error_text = (r.text or "")[:200]
-            if "EOF" in error_text and attempt < self.max_retries:
-                logger.warning("Ollama returned EOF; retrying (attempt %d/%d).", attempt + 1, self.max_retries + 1)
+            if self._should_retry(r, attempt):
                 time.sleep(self.retry_backoff_sec)
                 continue
-            raise RuntimeError(
-                f"Ollama POST failed with status {r.status_code}: {error_text} "
-                f"(model={self.model}, url={self.url})"
+            raise self._status_error(r)
+        else:
+            if last_error is not None:
+                raise RuntimeError(f"Ollama POST failed after retries: {last_error}") from last_error
+
+        return self._parse_content(r)
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        """Return the shared async client, rebuilding it if the running event loop changed."""
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client.is_closed or self._async_client_loop is not loop:
+            # Connections are bound to the loop that opened them, so a new loop gets a new pool.
+            if self._async_client is not None and not self._async_client.is_closed:
+                self._retire_async_client(self._async_client, self._async_client_loop, loop)
+            self._async_client = httpx.AsyncClient(
+                timeout=self.timeout_sec,
+                limits=httpx.Limits(max_keepalive_connections=self.ASYNC_MAX_KEEPALIVE),
             )
+            self._async_client_loop = loop
+        return self._async_client
+
+    def _retire_async_client(self, client: httpx.AsyncClient, old_loop, loop) -> None:
+        """Close a client built on another event loop so its pooled connections are released."""
+        if old_loop is not None and old_loop.is_running() and not old_loop.is_closed():
+            # Still serving another thread: close it there, where its connections live.
+            asyncio.run_coroutine_threadsafe(_close_quietly(client), old_loop)
+            return
+        task = loop.create_task(_close_quietly(client))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    async def aclose(self) -> None:
+        """Close the shared async client and its pooled connections."""
+        client, self._async_client, self._async_client_loop = self._async_client, None, None
+        if client is not None:
+            await client.aclose()
+
+    async def achat(self, messages):
+        """Async variant of chat() so the event loop is not parked on the LLM call."""
+        payload = self._build_payload(messages)
+
+        last_error = None
+        client = self._get_async_client()
+        for attempt in range(self.max_retries + 1):
+            try:
+                logger.debug("Ollama POST payload: %s", payload)
+                started = time.perf_counter()
+                r = await client.post(self.url, content=_dumps(payload), headers=_JSON_HEADERS)
+                logger.info(
+                    "Ollama POST took %.2fs, response: %s",
+                    time.perf_counter() - started,
+                    r.text[:200],
+                )
+            except httpx.HTTPError as exc:
+                last_error = exc
+                logger.exception("Ollama POST failed on attempt %d: %s", attempt + 1, exc)
+                if attempt < self.max_retries:
+                    await asyncio.sleep(self.retry_backoff_sec)
+                    continue
+                raise
+
+            if r.status_code == 200:
+                break
+
+            if self._should_retry(r, attempt):
+                await asyncio.sleep(self.retry_backoff_sec)
+                continue
+            raise self._status_error(r)
         else:
             if last_error is not None:
                 raise RuntimeError(f"Ollama POST failed after retries: {last_error}") from last_error
 
+        return self._parse_content(r, _loads)
+
+    async def astream_chat(self, messages) -> AsyncIterator[str]:
+        """Yield assistant content deltas as Ollama generates them (no retries once streaming)."""
+        payload = self._build_payload(messages, stream=True)
+        logger.debug("Ollama streaming POST payload: %s", payload)
+        started = time.perf_counter()
+        async with self._get_async_client().stream(
+            "POST", self.url, content=_dumps(payload), headers=_JSON_HEADERS
+        ) as r:
+            if r.status_code != 200:
+                await r.aread()
+                raise self._status_error(r)
+            async for line in r.aiter_lines():
+                if not line:
+                    continue
+                try:
+                    chunk = _loads(line)
+                except ValueError as exc:
+                    raise RuntimeError(f"Ollama returned non-JSON stream line: {line[:200]}") from exc
+                if "error" in chunk:
+                    raise RuntimeError(f"Ollama stream failed: {chunk['error']} (model={self.model}, url={self.url})")
+                content = chunk.get("message", {}).get("content", "")
+                if content:
+                    yield content if isinstance(content, str) else str(content)
+                if chunk.get("done"):
+                    break
+        logger.info("Ollama streaming POST took %.2fs", time.perf_counter() - started)
+
+    def warm_up(self, system_prompt: str) -> bool:
+        """Load the model and prefill the shared system prompt so later chats hit Ollama's prefix cache."""
+        payload = self._build_payload(
+            [{"role": "system", "content": system_prompt}],
+            options={**self.options, "num_predict": 1},
+        )
         try:
-            data = r.json()
-        except ValueError as exc:
-            raise RuntimeError(f"Ollama returned non-JSON response: {r.text[:200]}") from exc
-        content = data.get("message", {}).get("content", "")
-        # Normalize non-string content to string
-        if isinstance(content, (dict, list)):
-            content = str(content)
-        return content
+            r = requests.post(self.url, json=payload, timeout=self.timeout_sec)
+        except requests.exceptions.RequestException as exc:
+            logger.warning("Ollama warm-up failed: %s", exc)
+            return False
+        if r.status_code != 200:
+            logger.warning("Ollama warm-up returned status %s: %s", r.status_code, (r.text or "")[:200])
+            return False
+        logger.info("Ollama model %s warmed up (keep_alive=%s)", self.model, self.keep_alive)
+        return True
 
 
 ollama_client = OllamaClient()
+
+
+async def _close_quietly(client: httpx.AsyncClient) -> None:
+    """Close a replaced async client; sockets from a closed loop may fail to close cleanly."""
+    try:
+        await client.aclose()
+    except Exception as exc:  # the pool is still dropped, so the sockets are freed with it
+        logger.debug("Closing replaced async client failed: %s", exc)
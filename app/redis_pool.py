@@ -0,0 +1,37 @@
+"""Shared Redis clients backed by bounded, keep-alive connection pools."""
+import socket
+from functools import lru_cache
+
+try:
+    import redis  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    redis = None
+
+from app.config import settings
+
+# Probe idle pooled connections so NATs/load balancers do not silently drop them between bursts.
+# TCP_KEEPIDLE and friends are platform-specific; use whichever this OS exposes.
+KEEPALIVE_OPTIONS = {
+    opt: value
+    for name, value in (("TCP_KEEPIDLE", 60), ("TCP_KEEPINTVL", 10), ("TCP_KEEPCNT", 3))
+    if (opt := getattr(socket, name, None)) is not None
+}
+
+
+@lru_cache(maxsize=None)
+def redis_client(url: str):
+    """Return the Redis client for url; callers using the same URL share one connection pool.
+
+    The pool blocks (up to redis_pool_timeout_seconds) when all connections are busy instead of
+    raising, so threadpool bursts queue for a connection rather than fail.
+    """
+    if redis is None:
+        raise RuntimeError("redis package is not installed")
+    pool = redis.BlockingConnectionPool.from_url(
+        url,
+        max_connections=settings.redis_max_connections,
+        timeout=settings.redis_pool_timeout_seconds,
+        socket_keepalive=True,
+        socket_keepalive_options=KEEPALIVE_OPTIONS,
+    )
+    return redis.Redis(connection_pool=pool)
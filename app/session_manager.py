@@ -9,6 +9,7 @@ except ImportError:  # pragma: no cover - optional dependency
 
 from app.agent import UserPreferences
 from app.config import settings
+from app.redis_pool import redis_client
 from app.session_store import InMemorySessionStore, RedisSessionStore, SessionStore
 from app.app_types import CachedAssessment, CachedConditions
 from app.domain import AgentAssessmentPayload
@@ -22,7 +23,7 @@ def _init_store() -> SessionStore:
     logger.debug(f"Initializing session store: redis_url='{settings.session_redis_url or 'None'}', redis package present: {'yes' if redis else 'no'}")
     if settings.session_redis_url and redis:
         try:
-            client = redis.Redis.from_url(settings.session_redis_url)
+            client = redis_client(settings.session_redis_url)
             client.ping()
             logger.info("Using RedisSessionStore", extra={"redis_url": settings.session_redis_url})
             return RedisSessionStore(client, ttl_seconds=settings.session_ttl_seconds)
@@ -69,13 +70,11 @@ def create_session(
 def get_session(session_id: str):
     """Fetch a session payload by ID, refreshing TTL if applicable."""
     payload = _store.get_session(session_id)
-    if payload and len(payload) == 3:
-        messages, preferences, conditions = payload
-        return messages, preferences, conditions, None
-    if payload and len(payload) == 4:
-        messages, preferences, conditions, assessment = payload
-        return messages, preferences, conditions, _unwrap_assessment(assessment)
-    return payload
+    if payload is None:
+        return None
+    # Stores always return the full 4-tuple; RedisSessionStore reads pre-assessment entries as None.
+    messages, preferences, conditions, assessment = payload
+    return messages, preferences, conditions, _unwrap_assessment(assessment)
 
 
 def update_session(
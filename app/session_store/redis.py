@@ -2,8 +2,9 @@
 
 import json
 import uuid
-from dataclasses import asdict
+from dataclasses import asdict, fields
 from datetime import datetime
+from operator import attrgetter
 from typing import Optional
 
 from app.agent import UserPreferences
@@ -15,6 +16,11 @@ from utils.logging_utils import get_tagged_logger
 
 logger = get_tagged_logger(__name__, tag="redis_session_store")
 
+# Hour fields are flat scalars plus `time`, so a shallow read replaces dataclasses.asdict,
+# whose recursive deepcopy dominated session serialization.
+_HOUR_FIELDS = tuple(f.name for f in fields(BikeHourConditions))
+_hour_values = attrgetter(*_HOUR_FIELDS)
+
 
 class RedisSessionStore(SessionStore):
     """Redis-backed sessions with TTL. Stores payload via pickle."""
@@ -54,7 +60,7 @@ class RedisSessionStore(SessionStore):
         try:
             data = json.loads(raw.decode("utf-8"))
             messages = data.get("messages")
-            prefs = UserPreferences(**(data.get("preferences") or {}))
+            prefs = UserPreferences.from_trusted(data.get("preferences") or {})
             conditions = self._deserialize_conditions(data.get("conditions"))
             assessment = self._deserialize_assessment(data.get("assessment"))
             return messages, prefs, conditions, assessment
@@ -81,7 +87,7 @@ class RedisSessionStore(SessionStore):
         def hour_to_dict(hour: BikeHourConditions | None):
             if not hour:
                 return None
-            d = asdict(hour)
+            d = dict(zip(_HOUR_FIELDS, _hour_values(hour)))
             if hour.time:
                 d["time"] = hour.time.isoformat()
             return d
@@ -167,20 +173,22 @@ class RedisSessionStore(SessionStore):
 
     def get_session(self, session_id: str) -> Optional[SessionPayload]:
         """Fetch a session payload, refreshing TTL, or None if missing/invalid."""
+        key = self._key(session_id)
         try:
-            raw = self.client.get(self._key(session_id))
+            # GET and the sliding-TTL EXPIRE share one round-trip; EXPIRE is a no-op on a missing key.
+            pipe = self.client.pipeline(transaction=False)
+            pipe.get(key)
+            pipe.expire(key, self.ttl)
+            raw, _ = pipe.execute()
         except Exception as exc:  # pragma: no cover - defensive
             logger.error("Failed to read session from Redis: %s", exc)
             return None
         if not raw:
             return None
         payload = self._safe_load(raw)
-        if not payload:
-            return None
-        try:
-            self.client.expire(self._key(session_id), self.ttl)
-        except Exception as exc:  # pragma: no cover - defensive
-            logger.warning("Failed to refresh session TTL: %s", exc)
+        if payload is None:
+            # The EXPIRE above just extended an unreadable payload; drop it so it cannot linger.
+            self.delete_session(session_id)
         return payload
 
     def update_session(self, session_id: str, messages=None, preferences=None, conditions: Optional[CachedConditions] = None, assessment: Optional[CachedAssessment] = None) -> None:
@@ -223,7 +231,9 @@ class RedisSessionStore(SessionStore):
     def clear(self) -> None:
         """Best-effort clear for all sessions under the configured prefix."""
         try:
+            pipe = self.client.pipeline(transaction=False)
             for key in self.client.scan_iter(f"{self.prefix}*"):
-                self.client.delete(key)
+                pipe.delete(key)
+            pipe.execute()
         except Exception as exc:  # pragma: no cover - defensive
             logger.error("Failed to clear sessions from Redis: %s", exc)
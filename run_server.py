@@ -3,6 +3,9 @@ import os
 import uvicorn
 
 from app.check_ollama import check_ollama
+from app.config import settings
+from app.narration import SYSTEM_PROMPT_HYBRID
+from app.ollama_client import ollama_client
 from utils.logging_utils import get_tagged_logger
 
 logger = get_tagged_logger(__name__, tag="server")
@@ -27,8 +30,18 @@ def maybe_check_ollama() -> None:
         raise
 
 
+def maybe_warm_ollama() -> None:
+    """Preload the model and system prompt; failures are logged and ignored."""
+    if os.getenv("AGENT_SKIP_OLLAMA_CHECK", "false").lower() in ("1", "true", "yes"):
+        return
+    if not settings.ollama_warmup_enabled:
+        return
+    ollama_client.warm_up(SYSTEM_PROMPT_HYBRID)
+
+
 if __name__ == "__main__":
     maybe_check_ollama()
+    maybe_warm_ollama()
 
     uvicorn.run(
         "app.main:app",
@@ -1,4 +1,5 @@
 import datetime as dt
+import json
 import unittest
 from zoneinfo import ZoneInfo
 
@@ -64,9 +65,13 @@ class TestApi(unittest.TestCase):
         self._orig_get_session = api_mod.get_session
         self._orig_update_session = api_mod.update_session
         self._orig_narrate = api_mod.narrate_assessment
+        self._orig_stream_narration = api_mod.stream_narration
         self._orig_default_prefs = api_mod.default_preferences
         self._orig_max_len = settings.max_user_message_chars
         self._orig_api_key = settings.api_key
+        self._orig_redis_client = api_mod._redis_client
+        self._orig_validate_conditions = settings.validate_response_conditions
+        api_mod._recent_fetches.clear()
 
     def tearDown(self):
         from app.config import settings
@@ -76,9 +81,14 @@ class TestApi(unittest.TestCase):
         self.api_mod.get_session = self._orig_get_session
         self.api_mod.update_session = self._orig_update_session
         self.api_mod.narrate_assessment = self._orig_narrate
+        self.api_mod.stream_narration = self._orig_stream_narration
         self.api_mod.default_preferences = self._orig_default_prefs
         settings.max_user_message_chars = self._orig_max_len
         settings.api_key = self._orig_api_key
+        self.api_mod._redis_client = self._orig_redis_client
+        self.api_mod._api_key_cache.clear()
+        self.api_mod._recent_fetches.clear()
+        settings.validate_response_conditions = self._orig_validate_conditions
         settings.conditions_ttl_seconds = 1800
 
     def test_start_session_200(self):
@@ -114,6 +124,42 @@ class TestApi(unittest.TestCase):
         resp = client.post("/v1/session/unknown/refresh")
         self.assertEqual(resp.status_code, 404)
 
+    def test_session_store_calls_run_off_the_event_loop(self):
+        import asyncio
+
+        from app.agent import UserPreferences
+        from app.app_types import CachedConditions
+
+        client = TestClient(fastapi_app)
+        prefs = UserPreferences()
+        fresh = CachedConditions(data=_mock_conditions(), fetched_at=dt.datetime.now(dt.timezone.utc))
+        on_loop = []
+
+        def record_loop():
+            try:
+                asyncio.get_running_loop()
+                on_loop.append(True)
+            except RuntimeError:
+                on_loop.append(False)
+
+        def fake_get(session_id):
+            record_loop()
+            return [], prefs, fresh, None
+
+        def fake_update(session_id, **kwargs):
+            record_loop()
+
+        async def fake_narrate(assessment_arg, user_message=None, prior_messages=None):
+            return [{"role": "assistant", "content": "ok"}], "ok"
+
+        self.api_mod.get_session = fake_get
+        self.api_mod.update_session = fake_update
+        self.api_mod.narrate_assessment = fake_narrate
+
+        resp = client.post("/v1/session/abc123/chat", json={"message": "hi"})
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(on_loop, [False, False])
+
     def test_continue_chat_rejects_long_message(self):
         from app.config import settings
 
@@ -138,6 +184,32 @@ class TestApi(unittest.TestCase):
         ok = client.post("/v1/session/start", headers={"X-API-Key": "sekret"})
         self.assertEqual(ok.status_code, 200)
 
+    def test_redis_api_key_validation_is_cached(self):
+        class FakeRedis:
+            def __init__(self):
+                self.calls = 0
+
+            def sismember(self, _set_name, key):
+                self.calls += 1
+                return key == "redis-key"
+
+        client = TestClient(fastapi_app)
+        fake = FakeRedis()
+        self.api_mod._redis_client = fake
+        self.api_mod.get_bike_conditions_for_window = lambda **kwargs: _mock_conditions()
+        self.api_mod.create_session = lambda messages, prefs, conditions: "abc123"
+
+        for _ in range(2):
+            resp = client.post("/v1/session/start", headers={"X-API-Key": "redis-key"})
+            self.assertEqual(resp.status_code, 200)
+        self.assertEqual(fake.calls, 1)
+
+        # Failures are never cached.
+        for _ in range(2):
+            resp = client.post("/v1/session/start", headers={"X-API-Key": "wrong"})
+            self.assertEqual(resp.status_code, 401)
+        self.assertEqual(fake.calls, 3)
+
     def test_run_initial_fetches_when_conditions_stale(self):
         from app.config import settings
         settings.conditions_ttl_seconds = 1
@@ -193,16 +265,224 @@ class TestApi(unittest.TestCase):
             update_calls["assessment"] = assessment
 
         self.api_mod.update_session = fake_update
-        self.api_mod.narrate_assessment = lambda assessment, user_message=None, prior_messages=None: (
-            [{"role": "assistant", "content": "ok"}],
-            "ok",
-        )
+        async def fake_narrate(assessment, user_message=None, prior_messages=None):
+            return [{"role": "assistant", "content": "ok"}], "ok"
+
+        self.api_mod.narrate_assessment = fake_narrate
 
         resp = client.post("/v1/session/abc123/chat", json={"message": "hi"})
         self.assertEqual(resp.status_code, 200)
         self.assertIsNotNone(update_calls.get("conditions"))
         self.assertIsNotNone(update_calls.get("assessment"))
 
+    def test_forecast_conditions_match_validating_path(self):
+        from app.config import settings
+
+        conditions = _mock_conditions()
+        settings.validate_response_conditions = False
+        fast = self.api_mod._get_forecast_conditions(conditions)
+        settings.validate_response_conditions = True
+        validated = self.api_mod._get_forecast_conditions(conditions)
+        self.assertEqual([c.model_dump() for c in fast], [c.model_dump() for c in validated])
+
+    def test_concurrent_fetches_share_one_upstream_call(self):
+        import asyncio
+        import time as time_mod
+        from app.agent import UserPreferences
+
+        calls = []
+
+        def slow_fetch(**kwargs):
+            calls.append(kwargs)
+            time_mod.sleep(0.05)
+            return _mock_conditions()
+
+        self.api_mod.get_bike_conditions_for_window = slow_fetch
+        prefs = UserPreferences()
+        start = dt.datetime(2024, 1, 1, 12, 5, tzinfo=dt.timezone.utc)
+        end = start + dt.timedelta(hours=12)
+
+        async def run():
+            first = await asyncio.gather(
+                *(self.api_mod._fetch_conditions(prefs, start, end, "UTC") for _ in range(3))
+            )
+            later = await self.api_mod._fetch_conditions(prefs, start.replace(minute=40), end, "UTC")
+            return first, later
+
+        first, later = asyncio.run(run())
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(all(c is first[0] for c in first))
+        self.assertIs(later, first[0])
+
+    def test_refresh_fetch_skips_recent_results(self):
+        import asyncio
+        from app.agent import UserPreferences
+
+        calls = []
+
+        def fetch(**kwargs):
+            calls.append(kwargs)
+            return _mock_conditions()
+
+        self.api_mod.get_bike_conditions_for_window = fetch
+        prefs = UserPreferences()
+        start = dt.datetime(2024, 1, 1, 12, 5, tzinfo=dt.timezone.utc)
+        end = start + dt.timedelta(hours=12)
+
+        async def run():
+            first = await self.api_mod._fetch_conditions(prefs, start, end, "UTC")
+            refreshed = await self.api_mod._fetch_conditions(prefs, start, end, "UTC", reuse_recent=False)
+            reused = await self.api_mod._fetch_conditions(prefs, start, end, "UTC")
+            return first, refreshed, reused
+
+        first, refreshed, reused = asyncio.run(run())
+        self.assertEqual(len(calls), 2)
+        self.assertIsNot(refreshed, first)
+        self.assertIs(reused, refreshed)
+
+    def test_followers_take_over_when_the_leading_fetch_is_cancelled(self):
+        import asyncio
+        import threading
+        from app.agent import UserPreferences
+
+        calls = []
+        gate = threading.Event()
+
+        def fetch(**kwargs):
+            calls.append(kwargs)
+            if len(calls) == 1:
+                gate.wait(5)
+            return _mock_conditions()
+
+        self.api_mod.get_bike_conditions_for_window = fetch
+        prefs = UserPreferences()
+        start = dt.datetime(2024, 1, 1, 12, 5, tzinfo=dt.timezone.utc)
+        end = start + dt.timedelta(hours=12)
+
+        async def run():
+            leader = asyncio.ensure_future(self.api_mod._fetch_conditions(prefs, start, end, "UTC"))
+            await asyncio.sleep(0.05)
+            follower = asyncio.ensure_future(self.api_mod._fetch_conditions(prefs, start, end, "UTC"))
+            await asyncio.sleep(0.01)
+            leader.cancel()
+            gate.set()
+            with self.assertRaises(asyncio.CancelledError):
+                await leader
+            return await asyncio.wait_for(follower, timeout=5)
+
+        conditions = asyncio.run(run())
+        self.assertIsNotNone(conditions.current)
+        self.assertEqual(len(calls), 2)
+
+    def test_continue_chat_reuses_fresh_conditions_and_assessment(self):
+        from app.agent import UserPreferences, build_assessment_payload
+        from app.app_types import CachedConditions
+
+        client = TestClient(fastapi_app)
+
+        def fail_fetch(**kwargs):
+            raise AssertionError("fresh conditions should not be refetched")
+
+        self.api_mod.get_bike_conditions_for_window = fail_fetch
+        prefs = UserPreferences()
+        fresh = CachedConditions(data=_mock_conditions(), fetched_at=dt.datetime.now(dt.timezone.utc))
+        assessment = build_assessment_payload(fresh.data, prefs)
+        self.api_mod.get_session = lambda sid: ([], prefs, fresh, assessment)
+
+        update_calls = {}
+
+        def fake_update(session_id, **kwargs):
+            update_calls.update(kwargs)
+
+        self.api_mod.update_session = fake_update
+        seen = {}
+
+        async def fake_narrate(assessment_arg, user_message=None, prior_messages=None):
+            seen["assessment"] = assessment_arg
+            return [{"role": "assistant", "content": "ok"}], "ok"
+
+        self.api_mod.narrate_assessment = fake_narrate
+
+        resp = client.post("/v1/session/abc123/chat", json={"message": "hi"})
+        self.assertEqual(resp.status_code, 200)
+        self.assertIs(seen["assessment"], assessment)
+        self.assertNotIn("conditions", update_calls)
+
+    def test_continue_chat_stream_sends_deltas_then_persisted_reply(self):
+        from app.agent import UserPreferences, build_assessment_payload
+        from app.app_types import CachedConditions
+
+        client = TestClient(fastapi_app)
+        prefs = UserPreferences()
+        fresh = CachedConditions(data=_mock_conditions(), fetched_at=dt.datetime.now(dt.timezone.utc))
+        assessment = build_assessment_payload(fresh.data, prefs)
+        self.api_mod.get_session = lambda sid: ([], prefs, fresh, assessment)
+        update_calls = {}
+        self.api_mod.update_session = lambda session_id, **kwargs: update_calls.update(kwargs)
+
+        async def fake_stream(assessment_arg, messages, user_message=None, prior_messages=None):
+            for delta in ("Nice ", "day"):
+                yield delta
+            messages[:] = [{"role": "user", "content": user_message}, {"role": "assistant", "content": "Nice day"}]
+
+        self.api_mod.stream_narration = fake_stream
+
+        resp = client.post("/v1/session/abc123/chat/stream", json={"message": "hi"})
+        self.assertEqual(resp.status_code, 200)
+        self.assertTrue(resp.headers["content-type"].startswith("text/event-stream"))
+        events = [block.splitlines() for block in resp.text.strip().split("\n\n")]
+        self.assertEqual([json.loads(e[0][len("data: "):])["delta"] for e in events[:-1]], ["Nice ", "day"])
+        self.assertEqual(events[-1][0], "event: done")
+        self.assertEqual(json.loads(events[-1][1][len("data: "):])["response"], "Nice day")
+        self.assertEqual(update_calls["messages"][-1]["content"], "Nice day")
+
+    def test_continue_chat_stream_unknown_session_404(self):
+        client = TestClient(fastapi_app)
+        self.api_mod.get_session = lambda sid: None
+        resp = client.post("/v1/session/missing/chat/stream", json={"message": "hi"})
+        self.assertEqual(resp.status_code, 404)
+
+    def test_unwrap_and_freshness_for_cache_shapes(self):
+        from app.app_types import CachedConditions
+        from app.config import settings
+
+        cond = _mock_conditions()
+        now = dt.datetime.now(dt.timezone.utc)
+        stale = now - dt.timedelta(seconds=settings.conditions_ttl_seconds + 1)
+        cases = [
+            (cond, cond, True),
+            (CachedConditions(data=cond, fetched_at=now), cond, True),
+            (CachedConditions(data=cond, fetched_at=stale), cond, False),
+            ({"data": cond, "fetched_at": now}, cond, True),
+            ({"data": "junk"}, None, False),
+            ("junk", None, False),
+            (None, None, False),
+        ]
+        for value, unwrapped, fresh in cases:
+            self.assertIs(self.api_mod._unwrap_conditions(value), unwrapped)
+            self.assertEqual(self.api_mod._conditions_are_fresh(value, now), fresh)
+
+    def test_json_routes_keep_default_response_class(self):
+        from fastapi.datastructures import DefaultPlaceholder
+
+        for route in self.api_mod.router.routes:
+            self.assertIsNotNone(route.response_model, route.path)
+            self.assertIsInstance(route.response_class, DefaultPlaceholder, route.path)
+
+    def test_display_fields_match_current_conditions_model(self):
+        from app.forecast_service import DISPLAY_FIELDS
+
+        self.assertEqual(self.api_mod._CC_FIELDS, DISPLAY_FIELDS)
+
+    def test_summary_markdown_is_cached_and_not_serialized(self):
+        from app.domain import AssessmentSummary, Decision
+
+        summary = AssessmentSummary(overall_decision=Decision.GO, suitability_score=80.0)
+        first = self.api_mod._format_summary_markdown(summary)
+        self.assertIn("**Ride decision:** Go", first)
+        self.assertIs(self.api_mod._format_summary_markdown(summary), first)
+        self.assertNotIn("_markdown", summary.model_dump())
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -73,3 +73,38 @@ def test_missing_values_become_unknown():
     assert res.judgments["wind_speed_mph"].status == Status.UNKNOWN
     assert res.judgments["precipitation_prob_percent"].status == Status.UNKNOWN
     assert res.decision in {Decision.GO, Decision.UNKNOWN}
+
+
+@pytest.mark.parametrize(
+    "is_day, status",
+    [("true", Status.IDEAL), (" No ", Status.CAUTION), (0, Status.CAUTION), ("dusk", Status.UNKNOWN)],
+)
+def test_string_and_numeric_is_day_values_are_normalized(is_day, status):
+    result = assess_hour(prefs(), make_hour(is_day=is_day))
+    assert result.judgments["daylight"].status == status
+
+
+def test_judgers_are_built_once_per_preferences():
+    from app.assessment_engine import _make_judgers
+
+    assert _make_judgers(prefs()) is _make_judgers(prefs())
+    listed = RiderPreferences.model_construct(**{**prefs().model_dump(), "preferred_temp_range_f": [60.0, 75.0]})
+    assert _make_judgers(listed) is _make_judgers(prefs().model_copy(update={"preferred_temp_range_f": (60.0, 75.0)}))
+
+
+def test_repeated_hours_reuse_cached_core_without_sharing_objects():
+    from app.assessment_engine import _assess_core
+
+    _assess_core.cache_clear()
+    first = assess_hour(prefs(), make_hour(temperature=50.0))
+    second = assess_hour(prefs(), make_hour(temperature=50.0, hour_index=3))
+    assert _assess_core.cache_info().hits == 1
+    assert second.hour_index == 3
+    assert first.model_dump(exclude={"hour_index"}) == second.model_dump(exclude={"hour_index"})
+
+    first.judgments["temperature_f"].trend_delta = 1.0
+    first.judgments["temperature_f"].reasons.append("mutated")
+    third = assess_hour(prefs(), make_hour(temperature=50.0))
+    assert third.judgments["temperature_f"].trend_delta is None
+    assert third.judgments["temperature_f"].reasons == ["Cold: 50.0F is 15.0F below preferred"]
+    assert third.risks[0].evidence == ("Cold: 50.0F is 15.0F below preferred",)
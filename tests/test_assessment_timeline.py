@@ -1,8 +1,10 @@
 import datetime as dt
 from zoneinfo import ZoneInfo
 
+import pytest
+
 from app.assessment_engine import assess_timeline
-from app.domain import RiderPreferences
+from app.domain import DEFAULT_MEASURE_POLICIES, MeasureDirectionality, MeasurePolicy, RiderPreferences
 from app.forecast_service import BikeConditions, BikeHourConditions
 
 
@@ -99,3 +101,83 @@ def test_assess_timeline_trends_respect_deadband_and_directionality():
     _, hourly = assess_timeline(prefs, conditions)
     wind_j = hourly[0].judgments["wind_speed_mph"]
     assert wind_j.trend is not None
+
+
+def test_custom_policies_override_defaults_per_measure():
+    conditions = BikeConditions(current=_hour(0, temp=70.0), forecast=[_hour(1, temp=60.0)])
+    wide_deadband = MeasurePolicy(
+        name="temperature_f", trend_deadband=50.0, directionality=MeasureDirectionality.TARGET_BAND
+    )
+    _, hourly = assess_timeline(_prefs(), conditions, policies={"temperature_f": wide_deadband})
+    assert hourly[0].judgments["temperature_f"].trend == "stable"
+    assert hourly[0].judgments["wind_speed_mph"].trend is not None  # still uses the default policy
+    with pytest.raises(TypeError):
+        DEFAULT_MEASURE_POLICIES["uv_index"] = wide_deadband
+
+
+def test_assess_timeline_columns_match_per_hour_assessment():
+    from app.assessment_engine import assess_hour
+
+    hours = [_hour(0, temp=50.0, aqi=120), _hour(1, temp=99.0), _hour(2)]
+    hours[2].is_day = False
+    conditions = BikeConditions(current=_hour(0), forecast=hours)
+    _, hourly = assess_timeline(_prefs(), conditions)
+    expected = [assess_hour(_prefs(), h) for h in hours]
+    assert [(a.decision, a.hour_score, a.risks) for a in hourly] == [
+        (e.decision, e.hour_score, e.risks) for e in expected
+    ]
+    assert conditions.columns["us_aqi"].tolist()[0] == 120.0
+
+
+def test_vectorized_judges_match_scalar_judges_across_thresholds():
+    from types import SimpleNamespace
+
+    temps = [None, 10.0, 25.0, 30.0, 40.0, 50.0, 58.0, 62.0, 64.9, 65.0, 80.0, 93.0, 95.0, 99.0, 110.0]
+    winds = [None, 0.0, 19.0, 21.0, 25.0, 26.0, 31.0]
+    aqis = [None, 10, 50, 51, 80, 81, 151]
+    precips = [None, 0.0, 20.0, 49.0, 50.0, 70.0, 85.0]
+    days = [None, True, False]
+    hours = []
+    for idx in range(len(temps) * len(winds) * len(days)):
+        temp, wind, day = temps[idx % len(temps)], winds[idx % len(winds)], days[idx % len(days)]
+        aqi, precip = aqis[(idx // 3) % len(aqis)], precips[(idx // 5) % len(precips)]
+        h = _hour(0, temp=temp, aqi=aqi)
+        h.time = h.time + dt.timedelta(hours=idx)
+        h.hour_index = idx
+        h.wind_speed = wind
+        h.wind_gusts = None if wind is None else wind + 12.0
+        h.precipitation_prob = precip
+        h.is_day = day
+        hours.append(h)
+
+    for prefs in (
+        _prefs(),
+        RiderPreferences(avoid_precip=False, avoid_poor_aqi=False, prefer_daylight=False),
+        RiderPreferences(preferred_temp_range_f=None, max_wind_mph=10.0, max_aqi=40),
+    ):
+        _, hourly = assess_timeline(prefs, BikeConditions(current=None, forecast=hours))
+        # A non-BikeConditions container takes the per-hour scalar path.
+        _, expected = assess_timeline(prefs, SimpleNamespace(current=None, forecast=hours))
+        assert [a.model_dump() for a in hourly] == [e.model_dump() for e in expected]
+
+
+def test_repeated_values_share_formatted_reasons():
+    hours = [_hour(0, aqi=30), _hour(1, aqi=30), _hour(2, aqi=31)]
+    _, hourly = assess_timeline(_prefs(), BikeConditions(current=None, forecast=hours))
+    first, second, third = (h.judgments["us_aqi"].reasons[0] for h in hourly)
+    assert first == "AQI 30 good"
+    assert first is second
+    assert third == "AQI 31 good"
+
+
+def test_snapshot_rows_read_dicts_dataclasses_and_objects_alike():
+    from types import SimpleNamespace
+
+    from app.assessment_engine import _SNAPSHOT_FIELDS, _read_snapshots
+
+    hour = _hour(0, aqi=42)
+    as_dict = {name: getattr(hour, name) for name in _SNAPSHOT_FIELDS if name != "us_aqi"}
+    rows = _read_snapshots([hour, as_dict, SimpleNamespace(**as_dict)])
+    expected = tuple(getattr(hour, name) for name in _SNAPSHOT_FIELDS)
+    assert rows[0] == expected
+    assert rows[1] == rows[2] == expected[:-3] + (None,) + expected[-2:]
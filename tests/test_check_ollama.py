@@ -1,12 +1,14 @@
+import json
 import unittest
 
 from app.check_ollama import get_ollama_status
 
 
 class DummyResp:
-    def __init__(self, json_payload, status_code=200):
+    def __init__(self, json_payload, status_code=200, headers=None):
         self._payload = json_payload
         self.status_code = status_code
+        self.headers = headers or {}
 
     def raise_for_status(self):
         if self.status_code != 200:
@@ -15,18 +17,23 @@ class DummyResp:
     def json(self):
         return self._payload
 
+    @property
+    def content(self):
+        return json.dumps(self._payload).encode()
+
 
 class TestCheckOllama(unittest.TestCase):
     def setUp(self):
         import app.check_ollama as co
         self._orig_get = co.requests.get
+        co._reset_tags_cache()
 
     def tearDown(self):
         import app.check_ollama as co
         co.requests.get = self._orig_get
 
     def test_get_ollama_status_ok(self):
-        def fake_get(url, timeout=None):
+        def fake_get(url, timeout=None, headers=None):
             return DummyResp({"models": [{"name": "phi4-mini:latest"}]})
 
         import app.check_ollama as co
@@ -38,7 +45,7 @@ class TestCheckOllama(unittest.TestCase):
         self.assertTrue(status["ok"])
 
     def test_get_ollama_status_missing(self):
-        def fake_get(url, timeout=None):
+        def fake_get(url, timeout=None, headers=None):
             return DummyResp({"models": []})
 
         import app.check_ollama as co
@@ -49,6 +56,138 @@ class TestCheckOllama(unittest.TestCase):
         self.assertFalse(status["models_ok"])
         self.assertIn("missing-model", status["missing_models"])
 
+    def test_tags_probe_reuses_cached_answer_and_revalidates_with_etag(self):
+        import app.check_ollama as co
+
+        sent = []
+
+        def fake_get(url, timeout=None, headers=None):
+            sent.append(headers)
+            if headers:
+                return DummyResp(None, status_code=304)
+            return DummyResp({"models": [{"name": "phi4-mini:latest"}]}, headers={"ETag": '"v1"'})
+
+        co.requests.get = fake_get
+        self.assertTrue(get_ollama_status(required_models=["phi4-mini"])["ok"])
+        self.assertTrue(get_ollama_status(required_models=["phi4-mini"])["ok"])
+        self.assertEqual(sent, [{}])
+
+        co._tags_cache = co._tags_cache._replace(fetched_at=0.0)
+        self.assertTrue(get_ollama_status(required_models=["phi4-mini"])["ok"])
+        self.assertEqual(sent, [{}, {"If-None-Match": '"v1"'}])
+
+    def test_liveness_probe_without_required_models_skips_tags(self):
+        import app.check_ollama as co
+
+        urls = []
+
+        def fake_get(url, timeout=None, headers=None):
+            urls.append(url)
+            return DummyResp(None)
+
+        co.requests.get = fake_get
+        status = get_ollama_status()
+        self.assertTrue(status["ok"])
+        self.assertEqual(status["installed_models"], [])
+        self.assertEqual(urls, [co._base_url()])
+
+    def test_status_lines_split_across_chunks(self):
+        import app.check_ollama as co
+
+        chunks = [b'{"status":"pull', b'ing"}\n{"digest":"x"}\r\n{"sta', b'tus":"success"}']
+        self.assertEqual(
+            list(co._status_lines(chunks)),
+            ['{"status":"pulling"}', '{"status":"success"}'],
+        )
+
+    def test_missing_models_are_pulled_concurrently(self):
+        import threading
+
+        import app.check_ollama as co
+
+        barrier = threading.Barrier(2, timeout=5)
+        pulled = []
+
+        def fake_pull(name):
+            barrier.wait()
+            pulled.append(name)
+
+        probes = []
+
+        def fake_status(required_models=None, **_kwargs):
+            probes.append(list(required_models))
+            missing = [] if pulled else ["a", "b"]
+            return {
+                "reachable": True,
+                "models_ok": not missing,
+                "missing_models": missing,
+                "installed_models": [],
+                "error": None,
+            }
+
+        orig_status, orig_pull = co.get_ollama_status, co._pull_model
+        co.get_ollama_status = fake_status
+        co._pull_model = fake_pull
+        try:
+            co.check_ollama(required_models=["a", "b"], auto_pull=True)
+        finally:
+            co.get_ollama_status, co._pull_model = orig_status, orig_pull
+        self.assertEqual(sorted(pulled), ["a", "b"])
+        # One probe before pulling and a single shared verification afterwards.
+        self.assertEqual(probes, [["a", "b"], ["a", "b"]])
+
+    def test_failed_pull_exits_from_the_calling_thread(self):
+        import app.check_ollama as co
+
+        def fake_pull(name):
+            if name == "a":
+                raise RuntimeError("pull failed")
+
+        probes = []
+
+        def fake_status(required_models=None, **_kwargs):
+            probes.append(list(required_models))
+            return {
+                "reachable": True,
+                "models_ok": False,
+                "missing_models": ["a", "b"],
+                "installed_models": [],
+                "error": None,
+            }
+
+        orig_status, orig_pull = co.get_ollama_status, co._pull_model
+        co.get_ollama_status = fake_status
+        co._pull_model = fake_pull
+        try:
+            with self.assertRaises(SystemExit) as ctx:
+                co.check_ollama(required_models=["a", "b"], auto_pull=True)
+        finally:
+            co.get_ollama_status, co._pull_model = orig_status, orig_pull
+        self.assertEqual(ctx.exception.code, 1)
+        # The failure is reported once the pool is done; no verification probe follows.
+        self.assertEqual(probes, [["a", "b"]])
+
+    def test_urls_are_cached_until_refreshed(self):
+        import os
+
+        import app.check_ollama as co
+
+        previous = os.environ.get("AGENT_OLLAMA_BASE_URL")
+        try:
+            os.environ["AGENT_OLLAMA_BASE_URL"] = "http://one:11434/"
+            co._refresh_urls()
+            self.assertEqual(co._tags_url(), "http://one:11434/api/tags")
+            os.environ["AGENT_OLLAMA_BASE_URL"] = "http://two:11434"
+            self.assertEqual(co._tags_url(), "http://one:11434/api/tags")
+            co._refresh_urls()
+            self.assertEqual(co._pull_url(), "http://two:11434/api/pull")
+        finally:
+            if previous is None:
+                os.environ.pop("AGENT_OLLAMA_BASE_URL", None)
+            else:
+                os.environ["AGENT_OLLAMA_BASE_URL"] = previous
+            co._refresh_urls()
+
 
 if __name__ == "__main__":
     unittest.main()
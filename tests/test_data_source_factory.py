@@ -3,7 +3,7 @@ import unittest
 
 from app.data_sources.factory import build_data_source, DEFAULT_SOURCE_NAME
 import app.data_sources.factory as factory
-from app.data_sources.base import CallableForecastDataSource
+from app.data_sources.base import CallableForecastDataSource, ForecastDataSource
 
 
 class DummySettings:
@@ -20,6 +20,18 @@ class TestDataSourceFactory(unittest.TestCase):
         settings = DummySettings(forecast_source="open_meteo")
         ds = build_data_source(settings)
         self.assertIsInstance(ds, CallableForecastDataSource)
+        # Attributes are the fetch functions themselves, not delegating wrappers.
+        self.assertIs(ds.fetch_weather_hours, factory.fetch_weather_hours)
+
+    def test_callable_source_keeps_keyword_fields_and_base_class(self):
+        fns = [lambda *a, **k: None for _ in range(4)]
+        ds = CallableForecastDataSource(
+            weather_current=fns[0], air_current=fns[1], weather_hours=fns[2], air_hours=fns[3]
+        )
+        self.assertIn(ForecastDataSource, type(ds).__mro__)
+        self.assertIs(ds.fetch_air_current, fns[1])
+        ds.air_hours = fns[0]
+        self.assertIs(ds.fetch_air_hours, fns[0])
 
     def test_unknown_source_raises(self):
         settings = DummySettings(forecast_source="unknown-source")
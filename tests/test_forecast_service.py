@@ -1,8 +1,16 @@
 import datetime as dt
 import unittest
+from dataclasses import fields
 from zoneinfo import ZoneInfo
 
-from app.forecast_service import get_bike_conditions_for_window
+import numpy as np
+
+from app.forecast_service import (
+    BikeConditions,
+    _normalize_is_day,
+    generate_bike_conditions,
+    get_bike_conditions_for_window,
+)
 from app.data_sources import CallableForecastDataSource
 from app.data_sources.open_meteo_client import WeatherHour, AirHour
 
@@ -79,6 +87,35 @@ class TestForecastService(unittest.TestCase):
 
         self.assertIs(conditions.current.is_day, True)
 
+    def test_normalize_is_day_accepts_strings_and_numpy_scalars(self):
+        self.assertIs(_normalize_is_day(" Yes "), True)
+        self.assertIs(_normalize_is_day("f"), False)
+        self.assertIsNone(_normalize_is_day("dusk"))
+        self.assertIs(_normalize_is_day(np.float64(1.0)), True)
+        self.assertIs(_normalize_is_day(np.float64(0.0)), False)
+
+    def test_generate_bike_conditions_copies_fields_by_name(self):
+        time = dt.datetime(2025, 1, 1, 12, 0, tzinfo=ZoneInfo("UTC"))
+        weather = WeatherHour(time, 3, *[f"w{i}" for i in range(20)], is_day="yes")
+        air = AirHour(time, *[f"a{i}" for i in range(10)])
+        merged = generate_bike_conditions(weather, air)
+        for f in fields(WeatherHour):
+            if f.name != "is_day":
+                self.assertEqual(getattr(merged, f.name), getattr(weather, f.name), f.name)
+        for f in fields(AirHour)[1:]:
+            self.assertEqual(getattr(merged, f.name), getattr(air, f.name), f.name)
+        self.assertIs(merged.is_day, True)
+        self.assertIsNone(generate_bike_conditions(weather, None).uv_index_unit)
+
+    def test_bike_conditions_use_slots_and_memoize_columns(self):
+        time = dt.datetime(2025, 1, 1, 12, 0, tzinfo=ZoneInfo("UTC"))
+        hour = generate_bike_conditions(WeatherHour(time, 0, *[1.0] * 20, is_day=1), AirHour(time, *[2.0] * 10))
+        conditions = BikeConditions(current=hour, forecast=[hour, None])
+        self.assertFalse(hasattr(hour, "__dict__") or hasattr(conditions, "__dict__"))
+        self.assertIs(conditions.columns, conditions.columns)
+        self.assertEqual(conditions.columns["us_aqi"].tolist(), [2.0])
+        self.assertEqual(conditions, BikeConditions(current=hour, forecast=[hour, None]))
+
     def test_forecast_days_spans_midnight(self):
         tz = ZoneInfo("America/Chicago")
         start_local = dt.datetime(2025, 1, 1, 22, 0, tzinfo=tz)
@@ -236,6 +273,79 @@ class TestForecastService(unittest.TestCase):
         self.assertGreaterEqual(calls["weather_days"], 2)
         self.assertGreaterEqual(calls["air_days"], 2)
 
+    def test_upstream_fetches_run_concurrently(self):
+        import threading
+
+        tz = ZoneInfo("America/Chicago")
+        start_local = dt.datetime(2025, 1, 1, 12, 0, tzinfo=tz)
+        # Every fetch waits for the other three; a serial caller would time out here.
+        barrier = threading.Barrier(4, timeout=5)
+        weather = WeatherHour(start_local, 0, 50.0, "°F", *([None] * 18), 1)
+        air = AirHour(start_local, *([None] * 10))
+
+        def fetch(result):
+            def _fetch(*_args, **_kwargs):
+                barrier.wait()
+                return result
+            return _fetch
+
+        ds = CallableForecastDataSource(fetch(weather), fetch(air), fetch([weather]), fetch([air]))
+        conditions = get_bike_conditions_for_window(
+            latitude=43.0,
+            longitude=-89.0,
+            start_local=start_local,
+            end_local=start_local + dt.timedelta(hours=1),
+            timezone="America/Chicago",
+            data_source=ds,
+        )
+
+        self.assertEqual(len(conditions.forecast), 1)
+        self.assertEqual(conditions.current.temperature, 50.0)
+
+    def test_past_window_skips_open_meteo_hourly_fetches(self):
+        from unittest import mock
+
+        from app import forecast_service
+
+        tz = ZoneInfo("America/Chicago")
+        yesterday = dt.datetime.now(tz) - dt.timedelta(days=1)
+        weather = WeatherHour(yesterday, 0, 50.0, "°F", *([None] * 18), 1)
+        air = AirHour(yesterday, *([None] * 10))
+        hourly_calls = []
+
+        def fetch_hours(*_args, **_kwargs):
+            hourly_calls.append(_kwargs)
+            return []
+
+        with mock.patch.multiple(
+            forecast_service,
+            fetch_weather_current=lambda *a, **k: weather,
+            fetch_air_current=lambda *a, **k: air,
+            fetch_weather_hours=fetch_hours,
+            fetch_air_hours=fetch_hours,
+        ):
+            conditions = get_bike_conditions_for_window(
+                latitude=43.0,
+                longitude=-89.0,
+                start_local=yesterday - dt.timedelta(hours=3),
+                end_local=yesterday,
+                timezone="America/Chicago",
+            )
+            self.assertEqual(hourly_calls, [])
+            self.assertEqual(conditions.forecast, [])
+            self.assertEqual(conditions.current.temperature, 50.0)
+
+            # A window still inside today is fetched as usual.
+            today = dt.datetime.now(tz)
+            get_bike_conditions_for_window(
+                latitude=43.0,
+                longitude=-89.0,
+                start_local=today,
+                end_local=today + dt.timedelta(hours=1),
+                timezone="America/Chicago",
+            )
+            self.assertEqual(len(hourly_calls), 2)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,5 +1,7 @@
 import unittest
 
+from fastapi.testclient import TestClient
+
 from app.main import app, _STATIC_DIR
 
 
@@ -8,6 +10,17 @@ class TestMain(unittest.TestCase):
         self.assertEqual(app.title, "Biking Conditions Agent")
         self.assertTrue(_STATIC_DIR.exists())
 
+    def test_index_revalidates_with_etag(self):
+        client = TestClient(app)
+        first = client.get("/")
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(first.headers["cache-control"], "no-cache")
+
+        again = client.get("/", headers={"If-None-Match": first.headers["etag"]})
+        self.assertEqual(again.status_code, 304)
+        self.assertEqual(again.content, b"")
+        self.assertEqual(client.get("/static/index.html").headers["cache-control"], "no-cache")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,119 @@
+import json
+
+import pytest
+
+from app.data_sources import _cache
+
+
+class FakePipeline:
+    def __init__(self, client):
+        self.client = client
+        self.ops = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.ops.append((name, args, kwargs))
+            return self
+        return queue
+
+    def execute(self):
+        ops, self.ops = self.ops, []
+        return [getattr(self.client, name)(*args, **kwargs) for name, args, kwargs in ops]
+
+
+class FakeRedis:
+    def __init__(self):
+        self.hashes = {}
+        self.expires = {}
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    def hset(self, key, mapping):
+        self.hashes[key] = {
+            k.encode(): v if isinstance(v, bytes) else str(v).encode() for k, v in mapping.items()
+        }
+
+    def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+    def expire(self, key, ttl):
+        self.expires[key] = ttl
+
+
+PARAMS = {"latitude": 43.0712, "longitude": -89.4011, "hourly": "temperature_2m", "timezone": "UTC"}
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    client = FakeRedis()
+    monkeypatch.setattr(_cache, "_redis_client", client)
+    return client
+
+
+def test_nearby_coordinates_share_a_key():
+    nearby = {**PARAMS, "latitude": 43.0738, "longitude": -89.4049}
+    assert _cache.cache_key("u", PARAMS) == _cache.cache_key("u", nearby)
+    assert _cache.cache_key("u", PARAMS) != _cache.cache_key("u", {**PARAMS, "timezone": "America/Chicago"})
+
+
+def test_fresh_seconds_tracks_response_time_within_policy_cap(monkeypatch):
+    monkeypatch.setattr(_cache.settings, "conditions_ttl_seconds", 900)
+    assert _cache.fresh_seconds("normal", 0.2) == _cache.MIN_FRESH_SECONDS
+    assert _cache.fresh_seconds("normal", 30) == 150
+    assert _cache.fresh_seconds("normal", 1000) == 900
+    assert _cache.fresh_seconds("current", 1000) == _cache.POLICY_MAX_FRESH_SECONDS["current"]
+
+
+def test_freshness_ends_at_the_next_upstream_update(monkeypatch):
+    monkeypatch.setattr(_cache.settings, "conditions_ttl_seconds", 900)
+    top_of_hour = 1_750_000_000 - 1_750_000_000 % 3600
+    assert _cache.fresh_seconds("normal", 30, now=top_of_hour + 3590) == 10
+    assert _cache.fresh_seconds("normal", 30, now=top_of_hour) == 150
+    assert _cache.fresh_seconds("current", 1000, now=top_of_hour + 800) == 100
+
+
+def test_hits_skip_the_upstream_call(fake_redis):
+    calls = []
+
+    @_cache.cached_meteo()
+    def fetch(url, params):
+        calls.append(url)
+        return {"hourly": {"temperature_2m": [1.0]}}
+
+    assert fetch("u", PARAMS) == fetch("u", PARAMS) == {"hourly": {"temperature_2m": [1.0]}}
+    assert calls == ["u"]
+    (stored,) = fake_redis.hashes.values()
+    assert json.loads(stored[b"body"]) == {"hourly": {"temperature_2m": [1.0]}}
+
+
+def test_stale_entry_is_served_when_upstream_fails(fake_redis, monkeypatch):
+    responses = [{"v": 1}]
+
+    @_cache.cached_meteo()
+    def fetch(url, params):
+        if not responses:
+            raise RuntimeError("upstream down")
+        return responses.pop()
+
+    assert fetch("u", PARAMS) == {"v": 1}
+    now = _cache.time.time()
+    monkeypatch.setattr(_cache.time, "time", lambda: now + 3600)
+    assert fetch("u", PARAMS) == {"v": 1}
+
+    with pytest.raises(RuntimeError):
+        fetch("u", {**PARAMS, "latitude": 10.0})
+
+
+def test_passthrough_without_redis(monkeypatch):
+    monkeypatch.setattr(_cache, "_redis_client", None)
+    calls = []
+
+    @_cache.cached_meteo()
+    def fetch(url, params):
+        calls.append(url)
+        return {}
+
+    fetch("u", PARAMS)
+    fetch("u", PARAMS)
+    assert len(calls) == 2
@@ -53,6 +53,16 @@ def test_build_messages_includes_summary_and_windows():
     assert "Best windows" in content
 
 
+def test_build_messages_reuses_rendered_user_content():
+    payload = _payload()
+    first = build_narration_messages(payload)
+    second = build_narration_messages(payload)
+    assert first is not second
+    assert second[1]["content"] is first[1]["content"]
+    assert "Hourly samples" not in build_narration_messages(payload, max_hours=0)[1]["content"]
+    assert "_narration_user_content" not in payload.model_dump()
+
+
 def test_validate_narration_output_passes_and_rejects_mismatch():
     payload = _payload()
     raw = "Suitability score 8.0. Looks good."
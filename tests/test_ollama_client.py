@@ -1,5 +1,9 @@
+import asyncio
+import json
 import unittest
 
+import httpx
+
 from app.ollama_client import OllamaClient
 
 
@@ -23,10 +27,19 @@ class TestOllamaClient(unittest.TestCase):
     def setUp(self):
         from app import ollama_client as oc
         self._orig_post = oc.requests.post
+        self._orig_async_client = oc.httpx.AsyncClient
 
     def tearDown(self):
         from app import ollama_client as oc
         oc.requests.post = self._orig_post
+        oc.httpx.AsyncClient = self._orig_async_client
+
+    def _mock_async_transport(self, handler):
+        from app import ollama_client as oc
+
+        transport = httpx.MockTransport(handler)
+        orig = self._orig_async_client
+        oc.httpx.AsyncClient = lambda **kwargs: orig(transport=transport, **kwargs)
 
     def test_chat_success(self):
         def fake_post(url, json=None, timeout=None):
@@ -50,6 +63,103 @@ class TestOllamaClient(unittest.TestCase):
         with self.assertRaises(RuntimeError):
             client.chat([])
 
+    def test_achat_success(self):
+        self._mock_async_transport(lambda request: httpx.Response(200, json={"message": {"content": "hi"}}))
+        client = OllamaClient()
+        out = asyncio.run(client.achat([{"role": "user", "content": "hi"}]))
+        self.assertEqual(out, "hi")
+
+    def test_achat_non_200(self):
+        self._mock_async_transport(lambda request: httpx.Response(500, text="err"))
+        client = OllamaClient()
+        with self.assertRaises(RuntimeError):
+            asyncio.run(client.achat([]))
+
+    def test_achat_reuses_one_async_client_per_loop(self):
+        from app import ollama_client as oc
+
+        built = []
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, json={"message": {"content": "hi"}}))
+        orig = self._orig_async_client
+
+        def build(**kwargs):
+            built.append(kwargs)
+            return orig(transport=transport, **kwargs)
+
+        oc.httpx.AsyncClient = build
+        client = OllamaClient()
+
+        async def chat_twice():
+            await client.achat([])
+            await client.achat([])
+            await client.aclose()
+
+        asyncio.run(chat_twice())
+        self.assertEqual(len(built), 1)
+        asyncio.run(client.achat([]))
+        self.assertEqual(len(built), 2)
+
+    def test_achat_closes_the_client_left_on_a_previous_loop(self):
+        from app import ollama_client as oc
+
+        clients = []
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, json={"message": {"content": "hi"}}))
+        orig = self._orig_async_client
+
+        def build(**kwargs):
+            clients.append(orig(transport=transport, **kwargs))
+            return clients[-1]
+
+        oc.httpx.AsyncClient = build
+        client = OllamaClient()
+
+        asyncio.run(client.achat([]))
+        self.assertFalse(clients[0].is_closed)
+        asyncio.run(client.achat([]))
+        self.assertTrue(clients[0].is_closed)
+        self.assertFalse(clients[1].is_closed)
+
+    def test_astream_chat_yields_deltas(self):
+        seen = {}
+
+        def handler(request):
+            seen["payload"] = json.loads(request.content)
+            seen["content_type"] = request.headers["content-type"]
+            lines = [
+                {"message": {"content": "Good "}, "done": False},
+                {"message": {"content": "ride"}, "done": False},
+                {"message": {"content": ""}, "done": True},
+            ]
+            return httpx.Response(200, content="\n".join(json.dumps(line) for line in lines))
+
+        self._mock_async_transport(handler)
+        client = OllamaClient()
+
+        async def collect():
+            return [delta async for delta in client.astream_chat([])]
+
+        self.assertEqual(asyncio.run(collect()), ["Good ", "ride"])
+        self.assertIs(seen["payload"]["stream"], True)
+        self.assertEqual(seen["content_type"], "application/json")
+
+    def test_warm_up_prefills_system_prompt_with_keep_alive(self):
+        seen = {}
+
+        def fake_post(url, json=None, timeout=None):
+            seen["payload"] = json
+            return DummyResponse(200, "hi")
+
+        from app import ollama_client as oc
+
+        oc.requests.post = fake_post
+        client = OllamaClient()
+        client.keep_alive = "30m"
+        self.assertTrue(client.warm_up("system prompt"))
+        self.assertEqual(seen["payload"]["keep_alive"], "30m")
+        self.assertEqual(seen["payload"]["messages"][0], {"role": "system", "content": "system prompt"})
+        self.assertEqual(seen["payload"]["options"]["num_predict"], 1)
+        self.assertNotIn("num_predict", client.options)
+
 
 if __name__ == "__main__":
     unittest.main()
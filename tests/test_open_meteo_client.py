@@ -1,3 +1,4 @@
+import json
 import unittest
 
 from app.data_sources import open_meteo_client
@@ -13,6 +14,10 @@ class DummyResp:
     def json(self):
         return self._payload
 
+    @property
+    def content(self):
+        return json.dumps(self._payload).encode()
+
 
 def _make_weather_payload():
     return {
@@ -146,6 +151,58 @@ class TestOpenMeteoClient(unittest.TestCase):
         self.assertEqual(len(hours), 2)
         self.assertEqual(hours[0].us_aqi, 25)
 
+    def test_hourly_series_builds_rows_on_access(self):
+        payload = _make_weather_payload()
+        open_meteo_client.session = type("S", (), {"get": lambda *a, **k: DummyResp(payload)})()
+
+        hours = open_meteo_client.fetch_weather_hours(0, 0, timezone="UTC")
+        self.assertEqual([t.hour for t in hours.times], [12, 13])
+        self.assertEqual(hours[-1], hours[1])
+        self.assertEqual(hours[1].hour_index, 1)
+        self.assertEqual(hours[1].wind_gusts_unit, "km/h")
+        self.assertEqual([h.temperature for h in hours[0:2]], [10.0, 11.0])
+
+    def test_missing_hourly_variable_reads_as_none(self):
+        payload = _make_air_payload()
+        del payload["hourly"]["ozone"]
+        open_meteo_client.session = type("S", (), {"get": lambda *a, **k: DummyResp(payload)})()
+
+        hours = open_meteo_client.fetch_air_hours(0, 0)
+        self.assertEqual([h.ozone for h in hours], [None, None])
+        self.assertEqual(hours[1].pm10, 11.0)
+
+    def test_unit_check_remembers_clean_units_but_keeps_warning(self):
+        open_meteo_client._validated_weather_units.clear()
+        clean = {"temperature_2m": "°C", "wind_speed_10m": "km/h"}
+        open_meteo_client._warn_on_unexpected_units(dict(clean), context="test")
+        self.assertIn(frozenset(clean.items()), open_meteo_client._validated_weather_units)
+
+        odd = {"temperature_2m": "K"}
+        for _ in range(2):
+            with self.assertLogs(open_meteo_client.logger.logger, level="WARNING"):
+                open_meteo_client._warn_on_unexpected_units(dict(odd), context="test")
+
+    def test_pool_session_keeps_retries_and_enlarges_pool(self):
+        import requests
+        from urllib3 import Retry
+
+        sess = requests.Session()
+        for prefix in ("http://", "https://"):
+            sess.mount(prefix, requests.adapters.HTTPAdapter(max_retries=Retry(total=5)))
+
+        pooled = open_meteo_client._pool_session(sess)
+        adapter = pooled.get_adapter("https://api.open-meteo.com/v1/forecast")
+        self.assertEqual(adapter.max_retries.total, 5)
+        self.assertEqual(adapter._pool_maxsize, open_meteo_client.HTTP_POOL_MAXSIZE)
+
+    def test_pool_session_can_install_fallback_retry(self):
+        import requests
+
+        pooled = open_meteo_client._pool_session(requests.Session(), max_retries=open_meteo_client.FALLBACK_RETRY)
+        adapter = pooled.get_adapter("https://air-quality-api.open-meteo.com/v1/air-quality")
+        self.assertEqual(adapter.max_retries.total, 3)
+        self.assertIn(503, adapter.max_retries.status_forcelist)
+
 
 if __name__ == "__main__":
     unittest.main()
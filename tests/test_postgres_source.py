@@ -0,0 +1,227 @@
+import datetime as dt
+import sqlite3
+import unittest
+from collections.abc import Iterator
+from unittest import mock
+from zoneinfo import ZoneInfo
+
+from sqlalchemy import bindparam, create_engine, text
+
+from app.data_sources import postgres_source
+from app.data_sources.postgres_source import PostgresForecastDataSource
+
+sqlite3.register_converter("UTC_STAMP", lambda raw: dt.datetime.fromisoformat(raw.decode()))
+
+
+def _weather_row(**overrides):
+    row = {
+        "open_meteo_start_time": dt.datetime(2025, 6, 1, 17, 0, tzinfo=dt.timezone.utc),
+        "temperature": 20.0,
+        "temperature_unit": "celsius",
+        "rel_humidity": 40.0,
+        "wind_speed": 10.0,
+        "wind_speed_unit": "km/h",
+        "precipitation": 1.0,
+        "precipitation_unit": "mm",
+        "is_day": 1,
+    }
+    row.update(overrides)
+    return row
+
+
+def _air_engine():
+    engine = create_engine("sqlite://", connect_args={"detect_types": sqlite3.PARSE_DECLTYPES})
+    with engine.begin() as conn:
+        conn.execute(text(
+            "CREATE TABLE air (air_event_id INTEGER, open_meteo_start_time UTC_STAMP, "
+            "open_meteo_end_time TIMESTAMP, latitude REAL, longitude REAL, pm2_5 REAL, pm2_5_unit TEXT, "
+            "pm10 REAL, pm10_unit TEXT, us_aqi INTEGER, us_aqi_unit TEXT, ozone REAL, ozone_unit TEXT, "
+            "uv_index REAL, uv_index_unit TEXT)"
+        ))
+        conn.execute(text(
+            "INSERT INTO air (air_event_id, open_meteo_start_time, latitude, longitude, us_aqi) "
+            "VALUES (1, '2025-06-01 17:00:00', 43.0, -89.0, 42), (2, '2025-06-01 18:00:00', 43.0, -89.0, 40)"
+        ))
+    return engine
+
+
+class TestPostgresForecastDataSource(unittest.TestCase):
+    def setUp(self):
+        self.ds = PostgresForecastDataSource(engine=None)
+
+    def test_invalid_timezone_falls_back_to_utc(self):
+        self.assertEqual(PostgresForecastDataSource._normalize_timezone("Not/AZone"), "UTC")
+        self.assertEqual(PostgresForecastDataSource._normalize_timezone("auto"), "UTC")
+        self.assertIs(postgres_source._zoneinfo_for("America/Chicago"), postgres_source._zoneinfo_for("America/Chicago"))
+
+    def test_row_to_weather_converts_units_and_localizes(self):
+        tz = ZoneInfo("America/Chicago")
+        hour = self.ds._row_to_weather(_weather_row(), tz, idx=3)
+        self.assertEqual(hour.time, dt.datetime(2025, 6, 1, 12, 0, tzinfo=tz))
+        self.assertEqual(hour.time.tzinfo, tz)
+        self.assertEqual(hour.hour_index, 3)
+        self.assertAlmostEqual(hour.temperature, 68.0)
+        self.assertEqual(hour.temperature_unit, "°F")
+        self.assertAlmostEqual(hour.wind_speed, 6.21371)
+        self.assertEqual(hour.wind_speed_unit, "mph")
+
+    def test_positional_rows_match_mapping_rows(self):
+        tz = ZoneInfo("America/Chicago")
+        row = _weather_row(wind_gusts_10m=12.0, hour_index=7)
+        keys = tuple(row.keys())
+        layout = postgres_source._row_layout(keys, "weather", True)
+        positional = self.ds._row_to_weather(tuple(row.values()), tz, layout=layout)
+        self.assertEqual(positional, self.ds._row_to_weather(row, tz))
+        self.assertEqual(positional.hour_index, 7)
+        self.assertEqual((positional.wind_gusts, positional.wind_gusts_unit), (12.0, "mph"))
+
+        air = {"open_meteo_start_time": row["open_meteo_start_time"], "us_aqi": 42, "pm2_5": 3.5}
+        air_layout = postgres_source._row_layout(tuple(air), "air", True)
+        air_hour = self.ds._row_to_air(tuple(air.values()), tz, layout=air_layout)
+        self.assertEqual(air_hour, self.ds._row_to_air(air, tz))
+        self.assertEqual((air_hour.us_aqi, air_hour.pm2_5, air_hour.ozone), (42, 3.5, None))
+
+    def test_epoch_start_times_match_localized_timestamps(self):
+        tz = ZoneInfo("America/Chicago")
+        row = _weather_row()
+        epoch_row = {**row, "open_meteo_start_epoch": row["open_meteo_start_time"].timestamp()}
+        layout = postgres_source._row_layout(tuple(epoch_row), "weather", True)
+        self.assertTrue(layout.start_is_epoch)
+        hour = self.ds._row_to_weather(tuple(epoch_row.values()), tz, layout=layout)
+        self.assertEqual(hour, self.ds._row_to_weather(row, tz))
+        self.assertIs(hour.time.tzinfo, tz)
+
+    def test_converters_are_specialized_once_per_target(self):
+        convert = postgres_source._wind_speed_converter("MPH")
+        self.assertIs(convert, postgres_source._wind_speed_converter("MPH"))
+        self.assertEqual(convert(10.0, "m/s"), (10.0 * 2.23694, "mph"))
+        self.assertEqual(convert(None, "km/h"), (None, "mph"))
+        self.assertEqual(postgres_source._precipitation_converter("furlongs")(1.0, "mm"), (1.0, "mm"))
+
+    def test_sql_conversion_matches_python_converters(self):
+        engine = create_engine("sqlite://")
+        columns = ", ".join(f"NULL AS {col}" for col in postgres_source._WEATHER_SELECT_COLUMNS if col not in (
+            "temperature", "temperature_unit", "wind_speed", "wind_speed_unit", "wind_gusts", "wind_gusts_unit",
+        ))
+        select_list = postgres_source._weather_select_list("fahrenheit", "km/h", "inch")
+        query = text(
+            f"SELECT {select_list} FROM (SELECT :t AS temperature, :tu AS temperature_unit, "
+            f":w AS wind_speed, :wu AS wind_speed_unit, :g AS wind_gusts, NULL AS wind_gusts_unit, {columns})"
+        )
+        cases = [
+            {"t": 20.0, "tu": "celsius", "w": 10.0, "wu": "mph", "g": 3.0},
+            {"t": 68.0, "tu": "°F", "w": 5.0, "wu": "m/s", "g": None},
+            {"t": None, "tu": None, "w": 4.0, "wu": "furlongs", "g": 1.0},
+        ]
+        tz = ZoneInfo("UTC")
+        start = _weather_row()["open_meteo_start_time"]
+        for params in cases:
+            with engine.connect() as conn:
+                row = conn.execute(query, params).mappings().one()
+            expected = self.ds._row_to_weather(
+                {"open_meteo_start_time": start, "temperature": params["t"], "temperature_unit": params["tu"],
+                 "wind_speed": params["w"], "wind_speed_unit": params["wu"], "wind_gusts": params["g"]},
+                tz, temperature_unit="fahrenheit", wind_speed_unit="km/h", precipitation_unit="inch",
+            )
+            actual = self.ds._row_to_weather(
+                {**row, "open_meteo_start_time": start}, tz,
+                temperature_unit="fahrenheit", wind_speed_unit="km/h", precipitation_unit="inch",
+                converters=postgres_source._PRECONVERTED,
+            )
+            self.assertEqual(actual, expected)
+
+    def test_current_air_query_is_built_once_and_runs(self):
+        engine = _air_engine()
+        ds = PostgresForecastDataSource(engine, current_air_table="air")
+        air = ds.fetch_air_current(43.0, -89.0, timezone="America/Chicago")
+        self.assertEqual(air.us_aqi, 40)
+        self.assertEqual(air.time, dt.datetime(2025, 6, 1, 18, 0, tzinfo=dt.timezone.utc))
+        self.assertIs(
+            postgres_source._current_query("air", postgres_source._AIR_SELECT_LIST),
+            postgres_source._current_query("air", postgres_source._AIR_SELECT_LIST),
+        )
+
+    def test_current_rows_are_memoized_per_location(self):
+        engine = _air_engine()
+        ds = PostgresForecastDataSource(engine, current_air_table="air")
+        first = ds.fetch_air_current(43.0, -89.0)
+        with engine.begin() as conn:
+            conn.execute(text("UPDATE air SET us_aqi = 99"))
+        self.assertIs(ds.fetch_air_current(43.0, -89.0), first)
+        with self.assertRaises(LookupError):
+            ds.fetch_air_current(10.0, 10.0)
+
+        ds.cache_clear()
+        self.assertEqual(ds.fetch_air_current(43.0, -89.0).us_aqi, 99)
+        uncached = PostgresForecastDataSource(engine, current_air_table="air", current_cache_seconds=0)
+        self.assertIsNot(uncached.fetch_air_current(43.0, -89.0), uncached.fetch_air_current(43.0, -89.0))
+
+    def test_hourly_rows_stream_from_a_generator(self):
+        ds = PostgresForecastDataSource(_air_engine(), forecast_air_table="air")
+        sqlite_query = text(
+            f"SELECT {postgres_source._AIR_SELECT_LIST} FROM air "
+            "WHERE latitude = :lat AND longitude = :lon AND :tz IS NOT NULL AND :days > 0 "
+            "ORDER BY open_meteo_start_time"
+        )
+        with mock.patch.object(postgres_source, "_hourly_query", return_value=sqlite_query):
+            rows = ds.iter_air_hours(43.0, -89.0, timezone="America/Chicago")
+            self.assertIsInstance(rows, Iterator)
+            self.assertEqual([hour.us_aqi for hour in rows], [42, 40])
+            self.assertEqual(ds.fetch_air_hours(43.0, -89.0)[1].us_aqi, 40)
+
+    def test_select_list_can_be_narrowed_to_consumed_fields(self):
+        fields = frozenset({"temperature", "is_day"})
+        select_list = postgres_source._weather_select_list("fahrenheit", "mph", "mm", fields)
+        columns = [expr.rsplit(" AS ", 1)[-1].strip() for expr in select_list.split(",\n")]
+        self.assertEqual(columns, ["open_meteo_start_time", "temperature", "temperature_unit", "is_day"])
+        self.assertNotIn("weather_event_id", postgres_source._weather_select_list("fahrenheit", "mph", "mm"))
+
+    def test_batch_weather_hours_group_rows_by_location(self):
+        engine = create_engine("sqlite://", connect_args={"detect_types": sqlite3.PARSE_DECLTYPES})
+        columns = [c for c in postgres_source._WEATHER_SELECT_COLUMNS if c != "open_meteo_start_time"]
+        with engine.begin() as conn:
+            conn.execute(text(
+                f"CREATE TABLE weather (open_meteo_start_time UTC_STAMP, latitude REAL, longitude REAL, "
+                f"{', '.join(columns)})"
+            ))
+            conn.execute(text(
+                "INSERT INTO weather (open_meteo_start_time, latitude, longitude, temperature, temperature_unit) "
+                "VALUES ('2025-06-01 18:00:00', 1.5, 2.5, 10.0, 'celsius'), "
+                "('2025-06-01 17:00:00', 1.5, 2.5, 0.0, 'celsius'), "
+                "('2025-06-01 17:00:00', 3.0, 4.0, 50.0, 'fahrenheit')"
+            ))
+        ds = PostgresForecastDataSource(engine, forecast_weather_table="weather")
+        select_list = postgres_source._weather_select_list("fahrenheit", "mph", "mm")
+        sqlite_query = text(
+            f"SELECT {select_list}, latitude, longitude FROM weather "
+            "WHERE (latitude, longitude) IN :points AND :tz IS NOT NULL AND :days > 0 "
+            "ORDER BY latitude, longitude, open_meteo_start_time"
+        ).bindparams(bindparam("points", expanding=True))
+        with mock.patch.object(postgres_source, "_hourly_batch_query", return_value=sqlite_query):
+            forecasts = ds.fetch_weather_hours_batch([(1.5, 2.5), (3.0, 4.0), (9.0, 9.0)])
+        self.assertEqual(list(forecasts), [(1.5, 2.5), (3.0, 4.0), (9.0, 9.0)])
+        self.assertEqual([(h.hour_index, h.temperature) for h in forecasts[(1.5, 2.5)]], [(0, 32.0), (1, 50.0)])
+        self.assertEqual([h.temperature for h in forecasts[(3.0, 4.0)]], [50.0])
+        self.assertEqual(forecasts[(9.0, 9.0)], [])
+        self.assertEqual(ds.fetch_weather_hours_batch([]), {})
+
+    def test_recommended_indexes_cover_each_table_once(self):
+        ddl = self.ds.recommended_index_ddl()
+        self.assertEqual(len(ddl), 2)
+        self.assertIn(
+            "ix_fct_open_meteo_current_weather_air_conditions_lat_lon_time "
+            "ON mart.fct_open_meteo_current_weather_air_conditions "
+            "(latitude, longitude, open_meteo_start_time DESC)",
+            ddl[0],
+        )
+
+    def test_localize_accepts_names_for_backward_compat(self):
+        naive = dt.datetime(2025, 1, 1, 12, 0)
+        self.assertEqual(
+            PostgresForecastDataSource._localize(naive, "America/Chicago"),
+            PostgresForecastDataSource._localize(naive, ZoneInfo("America/Chicago")),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
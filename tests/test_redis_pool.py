@@ -0,0 +1,27 @@
+import unittest
+
+from app import redis_pool
+
+
+@unittest.skipIf(redis_pool.redis is None, "redis package not installed")
+class TestRedisPool(unittest.TestCase):
+    def setUp(self):
+        redis_pool.redis_client.cache_clear()
+
+    def tearDown(self):
+        redis_pool.redis_client.cache_clear()
+
+    def test_clients_for_one_url_share_a_blocking_keepalive_pool(self):
+        client = redis_pool.redis_client("redis://localhost:6379/0")
+        pool = client.connection_pool
+
+        self.assertIs(redis_pool.redis_client("redis://localhost:6379/0"), client)
+        self.assertIsNot(redis_pool.redis_client("redis://localhost:6379/1"), client)
+        self.assertIsInstance(pool, redis_pool.redis.BlockingConnectionPool)
+        self.assertEqual(pool.max_connections, redis_pool.settings.redis_max_connections)
+        self.assertTrue(pool.connection_kwargs["socket_keepalive"])
+        self.assertEqual(pool.connection_kwargs["socket_keepalive_options"], redis_pool.KEEPALIVE_OPTIONS)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -39,19 +39,6 @@ class TestSessionManager(unittest.TestCase):
         _time.sleep(1.1)
         self.assertIsNone(session_manager.get_session(sid))
 
-    def test_get_session_normalizes_legacy_payload(self):
-        sid = session_manager.create_session([], UserPreferences(), None)
-        store = session_manager._store
-        orig_get = store.get_session
-        try:
-            store.get_session = lambda session_id: ([], UserPreferences(), None)
-            payload = session_manager.get_session(sid)
-            self.assertEqual(len(payload), 4)
-            _messages, _prefs, _conditions, assessment = payload
-            self.assertIsNone(assessment)
-        finally:
-            store.get_session = orig_get
-
     def test_get_session_unwraps_cached_assessment(self):
         payload = AgentAssessmentPayload(context=AssessmentContext(), preferences=RiderPreferences())
         wrapped = CachedAssessment(data=payload, generated_at=datetime.now(timezone.utc))
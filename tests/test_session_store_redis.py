@@ -8,10 +8,31 @@ from app.forecast_service import BikeConditions, BikeHourConditions
 from app.session_store.redis import RedisSessionStore
 
 
+class FakePipeline:
+    def __init__(self, client):
+        self.client = client
+        self.ops = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.ops.append((name, args, kwargs))
+            return self
+        return queue
+
+    def execute(self):
+        self.client.round_trips += 1
+        ops, self.ops = self.ops, []
+        return [getattr(self.client, name)(*args, **kwargs) for name, args, kwargs in ops]
+
+
 class FakeRedis:
     def __init__(self):
         self.store = {}
         self.expires = {}
+        self.round_trips = 0
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
 
     def setex(self, key, ttl, value):
         self.store[key] = value
@@ -21,7 +42,10 @@ class FakeRedis:
         return self.store.get(key)
 
     def expire(self, key, ttl):
+        if key not in self.store:
+            return False
         self.expires[key] = ttl
+        return True
 
     def delete(self, key):
         self.store.pop(key, None)
@@ -149,6 +173,41 @@ class TestRedisSessionStore(unittest.TestCase):
         store.delete_session(sid)
         self.assertIsNone(store.get_session(sid))
 
+    def test_get_session_uses_single_round_trip(self):
+        client = FakeRedis()
+        store = RedisSessionStore(client, ttl_seconds=10, prefix="session:")
+        sid = store.create_session([], UserPreferences(), None)
+        client.expires[f"session:{sid}"] = 1
+
+        self.assertIsNotNone(store.get_session(sid))
+        self.assertEqual(client.round_trips, 1)
+        self.assertEqual(client.expires[f"session:{sid}"], 10)
+
+    def test_entries_without_assessment_load_as_four_tuples(self):
+        import json
+
+        client = FakeRedis()
+        store = RedisSessionStore(client, ttl_seconds=10, prefix="session:")
+        client.setex("session:legacy", 10, json.dumps({"messages": [], "preferences": {}, "conditions": None}).encode())
+
+        payload = store.get_session("legacy")
+        self.assertEqual(len(payload), 4)
+        self.assertIsNone(payload[3])
+
+    def test_preferences_reload_without_validation(self):
+        import warnings
+
+        client = FakeRedis()
+        store = RedisSessionStore(client, ttl_seconds=10, prefix="session:")
+        sid = store.create_session([], UserPreferences(max_wind_mph=12.0, preferred_temp_range_f=(50.0, 80.0)), None)
+
+        _msgs, prefs, _conds, _assess = store.get_session(sid)
+        self.assertEqual(prefs.max_wind_mph, 12.0)
+        self.assertEqual(prefs.preferred_temp_range_f, (50.0, 80.0))
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            prefs.model_dump()
+
     def test_clear_removes_prefixed_keys(self):
         client = FakeRedis()
         store = RedisSessionStore(client, ttl_seconds=10, prefix="session:")
@@ -167,6 +226,9 @@ class TestRedisSessionStore(unittest.TestCase):
         sid = "bad"
         client.store[f"session:{sid}"] = b"not-json"
         self.assertIsNone(store.get_session(sid))
+        # Unreadable payloads are deleted rather than kept alive by the sliding TTL.
+        self.assertNotIn(f"session:{sid}", client.store)
+        self.assertNotIn(f"session:{sid}", client.expires)
 
 
 if __name__ == "__main__":
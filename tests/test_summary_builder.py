@@ -57,3 +57,23 @@ def test_primary_limiters_prefer_window_risks():
     window = _window(8.0)
     summary = build_summary(hours, [window])
     assert summary.primary_limiters == []
+
+
+def test_primary_limiters_keep_first_three_distinct_flags_in_order():
+    flags = [
+        RiskFlag(code=code, severity=severity, evidence=[])
+        for code, severity in [
+            ("high_wind", RiskSeverity.MODERATE),
+            ("high_wind", RiskSeverity.MODERATE),
+            ("darkness", RiskSeverity.MINOR),
+            ("high_wind", RiskSeverity.MAJOR),
+            ("precipitation", RiskSeverity.MINOR),
+        ]
+    ]
+    hours = [_hour(Decision.GO, 9.0, risks=flags[:2]), _hour(Decision.GO, 9.0, risks=flags[2:])]
+    summary = build_summary(hours, [])
+    assert [(f.code, f.severity) for f in summary.primary_limiters] == [
+        ("high_wind", RiskSeverity.MODERATE),
+        ("darkness", RiskSeverity.MINOR),
+        ("high_wind", RiskSeverity.MAJOR),
+    ]
@@ -38,3 +38,58 @@ def test_windows_require_consecutive_hours():
     h2 = _hour(dt.datetime(2024, 1, 1, 14, tzinfo=tz), 9.0)  # gap
     recs = compute_window_recommendations([h1, h2], durations_minutes=(120,))
     assert recs == []
+
+
+def test_window_score_is_average_of_hour_scores():
+    tz = ZoneInfo("UTC")
+    hours = [_hour(dt.datetime(2024, 1, 1, 12 + i, tzinfo=tz), score) for i, score in enumerate([6.0, 8.0, 7.0])]
+    recs = compute_window_recommendations(hours, durations_minutes=(120,))
+    scores = {r.start.hour: r.window_score for r in recs}
+    assert scores == {12: 7.0, 13: 7.5}
+
+
+def test_windows_never_span_an_avoid_hour():
+    tz = ZoneInfo("UTC")
+    decisions = [Decision.GO, Decision.AVOID, Decision.GO, Decision.GO, Decision.AVOID]
+    hours = [_hour(dt.datetime(2024, 1, 1, 12 + i, tzinfo=tz), 8.0, decision=d) for i, d in enumerate(decisions)]
+    recs = compute_window_recommendations(hours, durations_minutes=(60, 120))
+    assert sorted((r.start.hour, r.end.hour) for r in recs) == [(12, 12), (14, 14), (14, 15), (15, 15)]
+
+
+def test_window_decision_is_worst_hour_decision():
+    tz = ZoneInfo("UTC")
+    decisions = [Decision.UNKNOWN, Decision.GO, Decision.GO_WITH_CAUTION]
+    hours = [_hour(dt.datetime(2024, 1, 1, 12 + i, tzinfo=tz), 8.0, decision=d) for i, d in enumerate(decisions)]
+    recs = compute_window_recommendations(hours, durations_minutes=(60, 120))
+    by_span = {(r.start.hour, r.end.hour): r.decision for r in recs}
+    assert by_span == {
+        (12, 12): Decision.UNKNOWN,
+        (13, 13): Decision.GO,
+        (14, 14): Decision.GO_WITH_CAUTION,
+        (12, 13): Decision.GO,
+        (13, 14): Decision.GO_WITH_CAUTION,
+    }
+
+
+def test_top_k_returns_prefix_of_full_ranking():
+    tz = ZoneInfo("UTC")
+    hours = [_hour(dt.datetime(2024, 1, 1, 12 + i, tzinfo=tz), score) for i, score in enumerate([6.0, 9.0, 7.0, 9.0, 5.0])]
+    full = compute_window_recommendations(hours)
+    top = compute_window_recommendations(hours, top_k=3)
+    assert [r.model_dump() for r in top] == [r.model_dump() for r in full[:3]]
+
+
+def test_equal_hour_scores_tie_earliest_first_and_stay_in_range():
+    tz = ZoneInfo("UTC")
+    # Fractional scores up front would make running totals drift on the later 10.0 hours.
+    scores = [0.1, 0.7, 3.3, 6.1] + [10.0] * 8
+    hours = [_hour(dt.datetime(2024, 1, 1, i, tzinfo=tz), score) for i, score in enumerate(scores)]
+    recs = compute_window_recommendations(hours, durations_minutes=(60, 120))
+    perfect = [r for r in recs if r.window_score == 10.0]
+    assert all(r.window_score <= 10.0 for r in recs)
+    assert [(r.start.hour, r.duration) for r in recs[: len(perfect)]] == [
+        (start, dt.timedelta(minutes=minutes))
+        for start in range(4, 12)
+        for minutes in (60, 120)
+        if start + minutes // 60 <= 12
+    ]